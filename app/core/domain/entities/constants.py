@@ -0,0 +1,21 @@
+from core.domain.entities.integer import Integer
+from core.domain.entities.natural import Natural
+from core.domain.entities.polynomial import Polynomial
+from core.domain.entities.rational import Rational
+from core.domain.entities.sparse_polynomial import SparsePolynomial
+
+# Часто используемые значения. Сущности - замороженные dataclass, и решатели не изменяют аргументы,
+# поэтому один экземпляр разделяется всеми решателями, а результат операции может без копирования
+# ссылаться на части аргументов (модуль, числитель, коэффициенты).
+NATURAL_ZERO = Natural(1, (0,))
+NATURAL_ONE = Natural(1, (1,))
+NATURAL_TEN = Natural(2, (1, 0))
+
+INTEGER_ZERO = Integer(0, NATURAL_ZERO)
+INTEGER_ONE = Integer(0, NATURAL_ONE)
+
+RATIONAL_ZERO = Rational(INTEGER_ZERO, NATURAL_ONE, True)
+RATIONAL_ONE = Rational(INTEGER_ONE, NATURAL_ONE, True)
+
+POLYNOMIAL_ZERO = Polynomial(0, (RATIONAL_ZERO,))
+SPARSE_POLYNOMIAL_ZERO = SparsePolynomial(0, ())
@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+from typing import Tuple
+
+from core.domain.entities.integer import Integer
+from core.domain.entities.rational import Rational
+
+@dataclass(frozen=True)
+class ContentPolynomial:
+    """
+    Класс, описывающий полином с рациональными коэффициентами в виде произведения содержания на примитивную часть.
+    Содержание - рациональное число, его знаменатель является общим знаменателем всех коэффициентов.
+    Примитивная часть - полином с целыми взаимно простыми в совокупности коэффициентами и положительным старшим коэффициентом.
+    Умножение на число (MUL_CQ_C) меняет только содержание и переиспользует кортеж коэффициентов аргумента.
+
+    Attributes:
+        polynom_degree (int): Степень полинома.
+        content (Rational): Содержание полинома (0/1 для нулевого полинома).
+        coefficients (Tuple[Integer, ...]): Коэффициенты примитивной части, начиная со старшего.
+    """
+    
+    polynom_degree: int
+    content: Rational
+    coefficients: Tuple[Integer, ...]
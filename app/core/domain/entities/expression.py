@@ -0,0 +1,34 @@
+from dataclasses import dataclass
+from typing import Any, Optional, Tuple
+
+@dataclass(frozen=True)
+class ExpressionNode:
+    """
+    Класс, описывающий вершину графа выражения: вызов решателя, константу или переменную.
+    У вызова заданы solver_name и args, у константы - value, у переменной - variable.
+
+    Attributes:
+        solver_name (Optional[str]): Имя решателя (для вызова).
+        args (Tuple[int, ...]): Номера вершин-аргументов вызова.
+        value (Any): Значение константы.
+        variable (Optional[str]): Имя переменной.
+    """
+
+    solver_name: Optional[str] = None
+    args: Tuple[int, ...] = ()
+    value: Any = None
+    variable: Optional[str] = None
+
+@dataclass(frozen=True)
+class Expression:
+    """
+    Класс, описывающий выражение как ациклический граф: одинаковые подвыражения представлены одной вершиной.
+    Вершины упорядочены топологически - аргументы вершины всегда стоят раньше нее.
+
+    Attributes:
+        nodes (Tuple[ExpressionNode, ...]): Вершины графа.
+        root (int): Номер вершины, значение которой является значением выражения.
+    """
+
+    nodes: Tuple[ExpressionNode, ...]
+    root: int
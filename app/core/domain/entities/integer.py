@@ -2,10 +2,10 @@ from dataclasses import dataclass
 
 from core.domain.entities.natural import Natural
 
-@dataclass
+@dataclass(frozen=True)
 class Integer:
     """
-    Класс, описывающий целые числа.
+    Класс, описывающий целые числа. Смена знака (MUL_ZM_Z) переиспользует объект модуля аргумента.
 
     Attributes:
         sign (int): Знак числа. 0 - положительное, 1 - отрицательное.
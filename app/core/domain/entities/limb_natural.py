@@ -0,0 +1,20 @@
+from array import array
+from dataclasses import dataclass
+
+LIMB_DIGITS = 9
+LIMB_BASE = 10 ** LIMB_DIGITS
+
+@dataclass(frozen=True)
+class LimbNatural:
+    """
+    Класс, описывающий натуральные числа и 0 в системе счисления с основанием 10^9.
+    Каждый разряд (лимб) хранит 9 десятичных цифр, разряды хранятся в компактном массиве array('I').
+    Объекты неизменяемы: массив лимбов не изменяется после создания.
+
+    Attributes:
+        limb_count (int): Количество лимбов числа.
+        limbs (array): Лимбы числа, начиная с младшего.
+    """
+
+    limb_count: int
+    limbs: array
\ No newline at end of file
@@ -1,15 +1,28 @@
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, field
+from typing import Optional, Tuple
 
-@dataclass
+# Числа не длиннее SMALL_DIGIT_COUNT разрядов (меньше 10^18) дополнительно хранят значение машинным целым.
+SMALL_DIGIT_COUNT = 18
+
+@dataclass(frozen=True)
 class Natural:
     """
-    Класс, описывающий натуральные числа и 0.
+    Класс, описывающий натуральные числа и 0. Значения 0, 1 и 10 решатели могут возвращать общими экземплярами из constants.
+    Для коротких чисел значение дополнительно хранится машинным целым, по которому решатели выполняют операции напрямую.
 
     Attributes:
         digit_count (int): Количество разрядов числа.
-        digits (List[int]): Само число.
+        digits (Tuple[int, ...]): Само число.
+        native (Optional[int]): Значение числа, если в нем не больше SMALL_DIGIT_COUNT разрядов, иначе None.
     """
     
     digit_count: int
-    digits: List[int]
\ No newline at end of file
+    digits: Tuple[int, ...]
+    native: Optional[int] = field(default=None, compare=False, repr=False)
+    
+    def __post_init__(self):
+        if self.native is None and self.digit_count <= SMALL_DIGIT_COUNT:
+            native = 0
+            for digit in self.digits:
+                native = native * 10 + digit
+            object.__setattr__(self, 'native', native)
@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+@dataclass(frozen=True, eq=False)
+class NaturalBatch:
+    """
+    Класс, описывающий набор натуральных чисел, упакованный в матрицу лимбов по основанию 10^9.
+    Строка матрицы - одно число, столбец - разряд (лимб), начиная с младшего; короткие числа дополнены нулевыми лимбами.
+    Матрица типа int64 доступна только для чтения.
+
+    Attributes:
+        count (int): Количество чисел.
+        limb_count (int): Количество лимбов в каждой строке.
+        limbs (np.ndarray): Матрица лимбов размера count x limb_count.
+    """
+
+    count: int
+    limb_count: int
+    limbs: np.ndarray
@@ -1,17 +1,17 @@
 from dataclasses import dataclass
-from typing import List
+from typing import Tuple
 
 from core.domain.entities.rational import Rational
 
-@dataclass
+@dataclass(frozen=True)
 class Polynomial:
     """
-    Класс, описывающий полином натуральной степени с рациональными коэффициентами.
+    Класс, описывающий полином натуральной степени с рациональными коэффициентами. Сдвиг (MUL_Pxk_P) переиспользует коэффициенты аргумента.
 
     Attributes:
         polynom_degree (int): Степень полинома.
-        coefficients (List[Rational]): Коэффициенты полинома.
+        coefficients (Tuple[Rational, ...]): Коэффициенты полинома.
     """
     
     polynom_degree: int
-    coefficients: List[Rational]
\ No newline at end of file
+    coefficients: Tuple[Rational, ...]
\ No newline at end of file
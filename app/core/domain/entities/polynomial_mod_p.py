@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+@dataclass(frozen=True, eq=False)
+class PolynomialModP:
+    """
+    Класс, описывающий полином над полем вычетов по простому модулю p < 2^31.
+    Коэффициенты - вычеты от 0 до p-1 в массиве NumPy типа int64, начиная со старшего; массив доступен только для чтения.
+    Нулевой полином хранится как массив из одного нуля.
+
+    Attributes:
+        modulus (int): Простой модуль p.
+        polynom_degree (int): Степень полинома.
+        coefficients (np.ndarray): Коэффициенты полинома.
+    """
+    
+    modulus: int
+    polynom_degree: int
+    coefficients: np.ndarray
@@ -1,17 +1,20 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from core.domain.entities.integer import Integer
 from core.domain.entities.natural import Natural
 
-@dataclass
+@dataclass(frozen=True)
 class Rational:
     """
-    Класс, описывающий рациональную дробь.
+    Класс, описывающий рациональную дробь. Результат операции может ссылаться на числитель и знаменатель аргумента без копирования.
+    Флаг reduced отмечает дроби, про которые известно, что они несократимы: решатели не сокращают их повторно.
 
     Attributes:
         numerator (Integer): Числитель.
         denominator (Natural): Знаменатель.
+        reduced (bool): Дробь заведомо несократима.
     """
     
     numerator: Integer
-    denominator: Natural
\ No newline at end of file
+    denominator: Natural
+    reduced: bool = field(default=False, compare=False, repr=False)
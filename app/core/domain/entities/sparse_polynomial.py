@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+from typing import Tuple
+
+from core.domain.entities.rational import Rational
+
+@dataclass(frozen=True)
+class SparsePolynomial:
+    """
+    Класс, описывающий разреженный полином с рациональными коэффициентами: хранятся только ненулевые члены.
+    Члены упорядочены по убыванию показателя, показатели не повторяются. Сдвиг (MUL_Sxk_S) переиспользует объекты коэффициентов аргумента.
+
+    Attributes:
+        polynom_degree (int): Степень полинома (0 для нулевого полинома).
+        terms (Tuple[Tuple[int, Rational], ...]): Пары (показатель, ненулевой коэффициент), начиная со старшего члена.
+    """
+    
+    polynom_degree: int
+    terms: Tuple[Tuple[int, Rational], ...]
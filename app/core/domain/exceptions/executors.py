@@ -0,0 +1,55 @@
+class UnknownSolverException(Exception):
+    """
+    Исключение, вызываемое, когда в задании указано имя, не являющееся функцией-решателем.
+
+    Attributes:
+        message (str): Сообщение об ошибке.
+    """
+    
+    def __init__(self, solver_name):
+        self.solver_name = solver_name
+        self.message = f'Ошибка: {solver_name} не является решателем.'
+        super().__init__(self.message)
+
+class BatchJobException(Exception):
+    """
+    Исключение, вызываемое, когда задание пакета завершилось ошибкой в рабочем процессе.
+
+    Attributes:
+        message (str): Сообщение об ошибке.
+    """
+    
+    def __init__(self, job_index, solver_name, error):
+        self.job_index = job_index
+        self.solver_name = solver_name
+        self.error = error
+        self.message = f'Ошибка: задание {job_index} ({solver_name}) завершилось ошибкой: {error}'
+        super().__init__(self.message)
+
+class UnboundVariableException(Exception):
+    """
+    Исключение, вызываемое, когда при вычислении выражения не задано значение переменной.
+
+    Attributes:
+        message (str): Сообщение об ошибке.
+    """
+    
+    def __init__(self, variable):
+        self.variable = variable
+        self.message = f'Ошибка: не задано значение переменной {variable}.'
+        super().__init__(self.message)
+
+class ExpressionNodeException(Exception):
+    """
+    Исключение, вызываемое, когда вызов решателя в вершине выражения завершился ошибкой (в текущем процессе или в пуле).
+
+    Attributes:
+        message (str): Сообщение об ошибке.
+    """
+    
+    def __init__(self, node_index, solver_name, error):
+        self.node_index = node_index
+        self.solver_name = solver_name
+        self.error = error
+        self.message = f'Ошибка: вершина {node_index} ({solver_name}) завершилась ошибкой: {error}'
+        super().__init__(self.message)
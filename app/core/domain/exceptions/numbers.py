@@ -64,4 +64,48 @@ class RationalIsNotIntegerException(Exception):
     def __init__(self, ratio):
         self.ratio = ratio
         self.message = f'Ошибка: дробь ({ratio}) не является целым числом.'
-        super().__init__(self.message)
\ No newline at end of file
+        super().__init__(self.message)
+
+
+class IncorrectModulusException(Exception):
+    """
+    Исключение, вызываемое, когда модуль не является простым числом из допустимого диапазона.
+    
+    Attributes:
+        message (str): Сообщение об ошибке
+    """
+    
+    def __init__(self, modulus):
+        self.modulus = modulus
+        self.message = f'Ошибка: модуль ({modulus}) не является простым числом меньше 2^31.'
+        super().__init__(self.message)
+
+
+class DifferentModulusException(Exception):
+    """
+    Исключение, вызываемое при операции над полиномами по разным модулям.
+    
+    Attributes:
+        message (str): Сообщение об ошибке
+    """
+    
+    def __init__(self, first, second):
+        self.first = first
+        self.second = second
+        self.message = f'Ошибка: полиномы заданы по разным модулям ({first} и {second}).'
+        super().__init__(self.message)
+
+
+class DifferentBatchSizeException(Exception):
+    """
+    Исключение, вызываемое при поэлементной операции над наборами чисел разной длины.
+    
+    Attributes:
+        message (str): Сообщение об ошибке
+    """
+    
+    def __init__(self, first, second):
+        self.first = first
+        self.second = second
+        self.message = f'Ошибка: наборы чисел разной длины ({first} и {second}).'
+        super().__init__(self.message)
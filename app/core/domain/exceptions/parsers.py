@@ -48,4 +48,57 @@ class StrToPolymonialException(Exception):
     def __init__(self, polynom_str):
         self.polynom_str = polynom_str
         self.message = f'Ошибка: Строка {polynom_str} не является полиномом.'
-        super().__init__(self.message)
\ No newline at end of file
+        super().__init__(self.message)
+
+class StrToSparsePolymonialException(Exception):
+    """
+    Исключение, вызываемое, когда вводимая строка не соответствует разреженному полиному (в том числе при повторяющихся показателях).
+
+    Attributes:
+        message (str): Сообщение об ошибке.
+    """
+    
+    def __init__(self, polynom_str):
+        self.polynom_str = polynom_str
+        self.message = f'Ошибка: Строка {polynom_str} не является разреженным полиномом.'
+        super().__init__(self.message)
+
+class BytesToEntityException(Exception):
+    """
+    Исключение, вызываемое, когда двоичные данные не соответствуют формату сериализации сущностей (или его версии).
+
+    Attributes:
+        message (str): Сообщение об ошибке.
+    """
+    
+    def __init__(self, reason):
+        self.reason = reason
+        self.message = f'Ошибка: Двоичные данные не соответствуют формату: {reason}.'
+        super().__init__(self.message)
+
+class EntityToBytesException(Exception):
+    """
+    Исключение, вызываемое, когда сериализуемый объект не является натуральным, целым, рациональным числом или полиномом.
+
+    Attributes:
+        message (str): Сообщение об ошибке.
+    """
+    
+    def __init__(self, entity_type):
+        self.entity_type = entity_type
+        self.message = f'Ошибка: Объект типа {entity_type} не поддерживается форматом сериализации.'
+        super().__init__(self.message)
+
+class StrToExpressionException(Exception):
+    """
+    Исключение, вызываемое, когда вводимая строка не соответствует выражению из вызовов решателей, констант и переменных.
+
+    Attributes:
+        message (str): Сообщение об ошибке.
+    """
+    
+    def __init__(self, expr_str, reason):
+        self.expr_str = expr_str
+        self.reason = reason
+        self.message = f'Ошибка: Строка {expr_str} не является выражением: {reason}.'
+        super().__init__(self.message)
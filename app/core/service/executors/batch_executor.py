@@ -0,0 +1,137 @@
+from concurrent.futures import Executor, ProcessPoolExecutor
+from os import cpu_count
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Tuple
+
+from core.domain.entities.integer import Integer
+from core.domain.entities.natural import Natural
+from core.domain.entities.polynomial import Polynomial
+from core.domain.entities.rational import Rational
+from core.domain.exceptions.executors import BatchJobException, UnknownSolverException
+from core.service.parsers.binary_parser import BinaryParser
+from core.service.solvers import integer_solver, natural_solver, polynomial_solver, rational_solver
+
+# Модули, решатели которых можно вызывать по имени: их аргументы и результаты - сущности, для которых есть двоичный формат.
+SOLVER_MODULES = (natural_solver, integer_solver, rational_solver, polynomial_solver)
+# Сколько порций приходится в среднем на один рабочий процесс, если размер порции не задан.
+CHUNKS_PER_WORKER = 4
+
+# Задание: имя решателя и закодированные аргументы. Сущности кодируются двоичным форматом BinaryParser,
+# числа, флаги и строки передаются как есть, кортежи кодируются поэлементно.
+Job = Tuple[str, Tuple[Any, ...]]
+
+
+def encode(value: Any) -> Any:
+    """
+    Компактное кодирование аргумента или результата для передачи между процессами.
+    """
+
+    if isinstance(value, (Natural, Integer, Rational, Polynomial)):
+        return BinaryParser.entity_to_bytes(value)
+    if isinstance(value, tuple):
+        return tuple(encode(item) for item in value)
+    return value
+
+
+def decode(value: Any) -> Any:
+    """
+    Восстановление значения, закодированного encode.
+    """
+
+    if isinstance(value, bytes):
+        return BinaryParser.bytes_to_entity(value)
+    if isinstance(value, tuple):
+        return tuple(decode(item) for item in value)
+    return value
+
+
+def make_job(solver_name: str, *args: Any) -> Job:
+    """
+    Задание для вызова решателя solver_name с данными аргументами.
+    """
+
+    return solver_name, encode(args)
+
+
+def get_solver(solver_name: str) -> Callable:
+    """
+    Функция-решатель по имени. Имя должно начинаться с заглавной буквы и принадлежать функции, определенной
+    в одном из SOLVER_MODULES (импортированные в модуль функции и служебные функции не подходят).
+
+    Args:
+        solver_name (str): Имя решателя, например ADD_QQ_Q.
+
+    Returns:
+        Callable: Решатель.
+    """
+
+    if solver_name[:1].isupper():
+        for module in SOLVER_MODULES:
+            solver = getattr(module, solver_name, None)
+            if callable(solver) and solver.__module__ == module.__name__:
+                return solver
+    raise UnknownSolverException(solver_name)
+
+
+def _run_chunk(chunk: List[Job]) -> List[Tuple[bool, Any]]:
+    """
+    Выполнение порции заданий в рабочем процессе. Для каждого задания возвращается (True, закодированный результат)
+    или (False, текст ошибки): исключения решателей не передаются между процессами напрямую.
+    """
+
+    results = []
+    for solver_name, args in chunk:
+        try:
+            results.append((True, encode(get_solver(solver_name)(*decode(args)))))
+        except Exception as error:
+            results.append((False, f'{type(error).__name__}: {error}'))
+    return results
+
+
+def _collect(jobs: Sequence[Job], outcomes: Iterable[List[Tuple[bool, Any]]], decode_results: bool) -> List[Any]:
+    """
+    Сборка результатов порций в порядке заданий; первая ошибка поднимается как BatchJobException с номером задания.
+    """
+
+    results = []
+    for chunk in outcomes:
+        for ok, value in chunk:
+            if not ok:
+                raise BatchJobException(len(results), jobs[len(results)][0], value)
+            results.append(decode(value) if decode_results else value)
+    return results
+
+
+def run_batch(jobs: Sequence[Job], max_workers: Optional[int] = None, chunk_size: Optional[int] = None, decode_results: bool = True,
+              executor: Optional[Executor] = None) -> List[Any]:
+    """
+    Выполнение пакета заданий в пуле процессов. Задания делятся на порции по chunk_size (по умолчанию -
+    CHUNKS_PER_WORKER порций на процесс), чтобы накладные расходы на передачу распределялись на много заданий;
+    порции передаются в закодированном виде, результаты возвращаются в порядке заданий.
+    При max_workers=1 пакет выполняется в текущем процессе. Если передан executor, порции выполняются в нем
+    и он не закрывается: так несколько пакетов подряд обходятся без повторного запуска процессов.
+
+    Args:
+        jobs (Sequence[Job]): Задания (см. make_job).
+        max_workers (Optional[int]): Число рабочих процессов (по умолчанию - число ядер).
+        chunk_size (Optional[int]): Число заданий в порции.
+        decode_results (bool): Восстанавливать ли результаты из закодированного вида.
+        executor (Optional[Executor]): Уже запущенный пул, в котором выполняются порции.
+
+    Returns:
+        List[Any]: Результаты заданий в порядке заданий.
+    """
+
+    for solver_name, _ in jobs:
+        get_solver(solver_name)
+
+    workers = max_workers or cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(1, -(-len(jobs) // (workers * CHUNKS_PER_WORKER)))
+    chunks = [list(jobs[i:i+chunk_size]) for i in range(0, len(jobs), chunk_size)]
+
+    if executor is not None:
+        return _collect(jobs, executor.map(_run_chunk, chunks), decode_results)
+    if workers == 1:
+        return _collect(jobs, map(_run_chunk, chunks), decode_results)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return _collect(jobs, executor.map(_run_chunk, chunks), decode_results)
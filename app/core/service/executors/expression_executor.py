@@ -0,0 +1,130 @@
+from concurrent.futures import ProcessPoolExecutor
+from os import cpu_count
+from typing import Any, Callable, List, Mapping, Optional
+
+from core.domain.entities.expression import Expression
+from core.domain.exceptions.executors import BatchJobException, ExpressionNodeException, UnboundVariableException
+from core.service.executors.batch_executor import get_solver, make_job, run_batch
+from core.service.parsers.expression_parser import ExpressionParser
+
+
+def _levels(expression: Expression) -> List[List[int]]:
+    """
+    Разбиение вызовов на уровни: вызов попадает на уровень, следующий за самым глубоким из его аргументов,
+    поэтому вызовы одного уровня не зависят друг от друга и могут выполняться одновременно.
+    """
+
+    depth = [0] * len(expression.nodes)
+    levels = []
+    for i, node in enumerate(expression.nodes):
+        if node.solver_name is not None:
+            depth[i] = 1 + max((depth[j] for j in node.args), default=0)
+            if depth[i] > len(levels):
+                levels.append([])
+            levels[depth[i]-1].append(i)
+    return levels
+
+
+def _last_uses(expression: Expression) -> List[int]:
+    """
+    Для каждой вершины - номер последнего вызова, использующего ее значение (или -1).
+    """
+
+    last_uses = [-1] * len(expression.nodes)
+    for i, node in enumerate(expression.nodes):
+        for j in node.args:
+            last_uses[j] = i
+    return last_uses
+
+
+def _call(expression: Expression, index: int, solver: Callable, values: List[Any]) -> Any:
+    """
+    Вызов решателя вершины index в текущем процессе; ошибка решателя поднимается как ExpressionNodeException.
+    """
+
+    node = expression.nodes[index]
+    try:
+        return solver(*(values[j] for j in node.args))
+    except Exception as error:
+        raise ExpressionNodeException(index, node.solver_name, f'{type(error).__name__}: {error}') from error
+
+
+def evaluate(expression: Expression, variables: Optional[Mapping[str, Any]] = None, parallel: bool = False, max_workers: Optional[int] = None) -> Any:
+    """
+    Вычисление выражения. Каждая вершина графа вычисляется один раз, поэтому повторяющиеся подвыражения
+    не пересчитываются; вершины обходятся в топологическом порядке. При последовательном вычислении значения
+    промежуточных вершин освобождаются сразу после последнего использования.
+    При parallel=True независимые вызовы одного уровня выполняются пакетом (см. run_batch) в одном пуле процессов,
+    который запускается при первом уровне из нескольких вызовов и служит до конца вычисления; уровень из одного вызова
+    выполняется в текущем процессе. Ошибка решателя в обоих режимах поднимается как ExpressionNodeException
+    с номером вершины. Разобранное выражение можно вычислять много раз с разными значениями переменных.
+
+    Args:
+        expression (Expression): Выражение (см. ExpressionParser.str_to_expression).
+        variables (Optional[Mapping[str, Any]]): Значения переменных.
+        parallel (bool): Выполнять ли независимые вызовы в пуле процессов.
+        max_workers (Optional[int]): Число рабочих процессов (по умолчанию - число ядер).
+
+    Returns:
+        Any: Значение выражения.
+    """
+
+    nodes = expression.nodes
+    solvers = {node.solver_name: get_solver(node.solver_name) for node in nodes if node.solver_name is not None}
+
+    values: List[Any] = [None] * len(nodes)
+    for i, node in enumerate(nodes):
+        if node.variable is not None:
+            if variables is None or node.variable not in variables:
+                raise UnboundVariableException(node.variable)
+            values[i] = variables[node.variable]
+        elif node.solver_name is None:
+            values[i] = node.value
+
+    if not parallel:
+        last_uses = _last_uses(expression)
+        for i, node in enumerate(nodes):
+            if node.solver_name is not None:
+                values[i] = _call(expression, i, solvers[node.solver_name], values)
+                for j in node.args:
+                    if last_uses[j] == i and j != expression.root:
+                        values[j] = None
+        return values[expression.root]
+
+    workers = max_workers or cpu_count() or 1
+    executor = None
+    try:
+        for level in _levels(expression):
+            if len(level) == 1:
+                values[level[0]] = _call(expression, level[0], solvers[nodes[level[0]].solver_name], values)
+                continue
+            if executor is None and workers > 1:
+                executor = ProcessPoolExecutor(max_workers=workers)
+            jobs = [make_job(nodes[i].solver_name, *(values[j] for j in nodes[i].args)) for i in level]
+            try:
+                results = run_batch(jobs, workers, executor=executor)
+            except BatchJobException as error:
+                raise ExpressionNodeException(level[error.job_index], error.solver_name, error.error) from error
+            for i, value in zip(level, results):
+                values[i] = value
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    return values[expression.root]
+
+
+def run_expression(expr_str: str, variables: Optional[Mapping[str, Any]] = None, parallel: bool = False, max_workers: Optional[int] = None) -> Any:
+    """
+    Разбор и вычисление выражения, записанного строкой.
+
+    Args:
+        expr_str (str): Выражение, например ADD_QQ_Q(MUL_QQ_Q(a, b), MUL_QQ_Q(a, b)).
+        variables (Optional[Mapping[str, Any]]): Значения переменных.
+        parallel (bool): Выполнять ли независимые вызовы в пуле процессов.
+        max_workers (Optional[int]): Число рабочих процессов (по умолчанию - число ядер).
+
+    Returns:
+        Any: Значение выражения.
+    """
+
+    return evaluate(ExpressionParser.str_to_expression(expr_str), variables, parallel, max_workers)
@@ -0,0 +1,227 @@
+from array import array
+from mmap import ACCESS_READ, mmap
+from os import fstat
+from struct import Struct
+from sys import byteorder
+from typing import Tuple, Union
+
+from core.domain.exceptions.parsers import BytesToEntityException, EntityToBytesException
+from core.domain.entities.integer import Integer
+from core.domain.entities.limb_natural import LIMB_BASE, LimbNatural
+from core.domain.entities.natural import Natural
+from core.domain.entities.polynomial import Polynomial
+from core.domain.entities.rational import Rational
+from core.service.solvers.limb_solver import TRANS_L_N, TRANS_N_L
+
+# Двоичный формат (все числа little-endian):
+#   заголовок:   MAGIC (4 байта), версия (uint16), вид сущности (uint8), резерв (1 байт);
+#   Natural:     число лимбов (uint32), лимбы по основанию 10^9 начиная с младшего (uint32 каждый);
+#   Integer:     знак (uint8), модуль - Natural;
+#   Rational:    числитель - Integer, знаменатель - Natural;
+#   Polynomial:  число коэффициентов n (uint64), таблица из n+1 смещений (uint64, от начала данных),
+#                затем коэффициенты - Rational, начиная со старшего; i-й коэффициент занимает байты [offsets[i], offsets[i+1]).
+# Таблица смещений позволяет прочитать один коэффициент отображенного в память файла, не разбирая остальные.
+MAGIC = b'DMLB'
+FORMAT_VERSION = 1
+
+KIND_NATURAL = 1
+KIND_INTEGER = 2
+KIND_RATIONAL = 3
+KIND_POLYNOMIAL = 4
+
+_HEADER = Struct('<4sHBx')
+_U8 = Struct('<B')
+_U32 = Struct('<I')
+_U64 = Struct('<Q')
+
+Buffer = Union[bytes, bytearray, memoryview, mmap]
+Entity = Union[Natural, Integer, Rational, Polynomial]
+
+
+def _limbs(nat: Natural) -> bytes:
+    """
+    Запись Natural: число лимбов и лимбы по основанию 10^9 в порядке little-endian.
+    """
+
+    limbs = TRANS_N_L(nat).limbs
+    if byteorder == 'big':
+        limbs = array('I', limbs)
+        limbs.byteswap()
+    return _U32.pack(len(limbs)) + limbs.tobytes()
+
+
+def _rational(ratio: Rational) -> bytes:
+    """
+    Запись Rational: знак и модуль числителя, затем знаменатель.
+    """
+
+    return _U8.pack(ratio.numerator.sign) + _limbs(ratio.numerator.number) + _limbs(ratio.denominator)
+
+
+def _read_natural(buffer: Buffer, offset: int) -> Tuple[Natural, int]:
+    """
+    Чтение Natural, начиная с offset; возвращается число и смещение следующего за ним байта.
+    """
+
+    if offset + _U32.size > len(buffer):
+        raise BytesToEntityException('данные обрываются')
+    count, = _U32.unpack_from(buffer, offset)
+    start = offset + _U32.size
+    end = start + count * _U32.size
+    if count == 0 or end > len(buffer):
+        raise BytesToEntityException('неверная длина числа')
+
+    limbs = array('I')
+    limbs.frombytes(buffer[start:end])
+    if byteorder == 'big':
+        limbs.byteswap()
+    if max(limbs) >= LIMB_BASE or (count > 1 and limbs[-1] == 0):
+        raise BytesToEntityException('неверный лимб числа')
+    return TRANS_L_N(LimbNatural(count, limbs)), end
+
+
+def _read_integer(buffer: Buffer, offset: int) -> Tuple[Integer, int]:
+    """
+    Чтение Integer, начиная с offset; возвращается число и смещение следующего за ним байта.
+    """
+
+    if offset + _U8.size > len(buffer):
+        raise BytesToEntityException('данные обрываются')
+    sign, = _U8.unpack_from(buffer, offset)
+    if sign > 1:
+        raise BytesToEntityException('неверный знак числа')
+    number, end = _read_natural(buffer, offset + _U8.size)
+    return Integer(sign, number), end
+
+
+def _read_rational(buffer: Buffer, offset: int) -> Tuple[Rational, int]:
+    """
+    Чтение Rational, начиная с offset; возвращается дробь и смещение следующего за ней байта.
+    """
+
+    numerator, offset = _read_integer(buffer, offset)
+    denominator, end = _read_natural(buffer, offset)
+    return Rational(numerator, denominator), end
+
+
+def _read_header(buffer: Buffer) -> int:
+    """
+    Проверка заголовка (сигнатура и версия формата); возвращается вид сущности.
+    """
+
+    if len(buffer) < _HEADER.size:
+        raise BytesToEntityException('нет заголовка')
+    magic, version, kind = _HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC:
+        raise BytesToEntityException('неизвестная сигнатура')
+    if version != FORMAT_VERSION:
+        raise BytesToEntityException(f'неподдерживаемая версия {version}')
+    return kind
+
+
+def _offsets(buffer: Buffer) -> Tuple[int, int]:
+    """
+    Число коэффициентов полинома и смещение таблицы смещений.
+    """
+
+    if _read_header(buffer) != KIND_POLYNOMIAL:
+        raise BytesToEntityException('данные не содержат полином')
+    if _HEADER.size + _U64.size > len(buffer):
+        raise BytesToEntityException('данные обрываются')
+    count, = _U64.unpack_from(buffer, _HEADER.size)
+    table = _HEADER.size + _U64.size
+    if count == 0 or table + (count + 1) * _U64.size > len(buffer):
+        raise BytesToEntityException('неверная таблица коэффициентов')
+    return count, table
+
+
+def _map(file) -> mmap:
+    """
+    Отображение открытого файла в память только для чтения (пустой файл отображать нельзя).
+    """
+
+    if fstat(file.fileno()).st_size == 0:
+        raise BytesToEntityException('нет заголовка')
+    return mmap(file.fileno(), 0, access=ACCESS_READ)
+
+
+class BinaryParser:
+    """
+    Чтение и запись Natural, Integer, Rational и Polynomial в двоичном формате, описанном выше. Загрузка из файла
+    выполняется через отображение в память, поэтому отдельный коэффициент полинома читается без разбора остальных.
+    """
+
+    def entity_to_bytes(entity: Entity) -> bytes:
+        if isinstance(entity, Natural):
+            return _HEADER.pack(MAGIC, FORMAT_VERSION, KIND_NATURAL) + _limbs(entity)
+        if isinstance(entity, Integer):
+            return _HEADER.pack(MAGIC, FORMAT_VERSION, KIND_INTEGER) + _U8.pack(entity.sign) + _limbs(entity.number)
+        if isinstance(entity, Rational):
+            return _HEADER.pack(MAGIC, FORMAT_VERSION, KIND_RATIONAL) + _rational(entity)
+        if not isinstance(entity, Polynomial):
+            raise EntityToBytesException(type(entity).__name__)
+
+        coefficients = [_rational(coef) for coef in entity.coefficients]
+        offsets = array('Q', [0] * (len(coefficients) + 1))
+        offsets[0] = _HEADER.size + _U64.size + len(offsets) * _U64.size
+        for i, data in enumerate(coefficients):
+            offsets[i+1] = offsets[i] + len(data)
+        if byteorder == 'big':
+            offsets.byteswap()
+        header = _HEADER.pack(MAGIC, FORMAT_VERSION, KIND_POLYNOMIAL) + _U64.pack(len(coefficients)) + offsets.tobytes()
+        return b''.join([header] + coefficients)
+
+    def bytes_to_entity(buffer: Buffer) -> Entity:
+        kind = _read_header(buffer)
+        if kind == KIND_NATURAL:
+            entity, end = _read_natural(buffer, _HEADER.size)
+        elif kind == KIND_INTEGER:
+            entity, end = _read_integer(buffer, _HEADER.size)
+        elif kind == KIND_RATIONAL:
+            entity, end = _read_rational(buffer, _HEADER.size)
+        elif kind == KIND_POLYNOMIAL:
+            count, table = _offsets(buffer)
+            offsets = array('Q')
+            offsets.frombytes(buffer[table:table + (count + 1) * _U64.size])
+            if byteorder == 'big':
+                offsets.byteswap()
+            coefficients = []
+            end = table + len(offsets) * _U64.size
+            for i in range(count):
+                if end != offsets[i]:
+                    raise BytesToEntityException('неверная таблица коэффициентов')
+                coef, end = _read_rational(buffer, end)
+                coefficients.append(coef)
+            if end != offsets[count]:
+                raise BytesToEntityException('неверная таблица коэффициентов')
+            entity = Polynomial(count - 1, tuple(coefficients))
+        else:
+            raise BytesToEntityException(f'неизвестный вид сущности {kind}')
+        if end != len(buffer):
+            raise BytesToEntityException('лишние данные после сущности')
+        return entity
+
+    def bytes_to_coefficient(buffer: Buffer, index: int) -> Rational:
+        count, table = _offsets(buffer)
+        if not 0 <= index < count:
+            raise IndexError(index)
+        start, = _U64.unpack_from(buffer, table + index * _U64.size)
+        end, = _U64.unpack_from(buffer, table + (index + 1) * _U64.size)
+        if end > len(buffer):
+            raise BytesToEntityException('данные обрываются')
+        coef, stop = _read_rational(buffer, start)
+        if stop != end:
+            raise BytesToEntityException('неверная таблица коэффициентов')
+        return coef
+
+    def dump(entity: Entity, path: str):
+        with open(path, 'wb') as file:
+            file.write(BinaryParser.entity_to_bytes(entity))
+
+    def load(path: str) -> Entity:
+        with open(path, 'rb') as file, _map(file) as buffer:
+            return BinaryParser.bytes_to_entity(buffer)
+
+    def load_coefficient(path: str, index: int) -> Rational:
+        with open(path, 'rb') as file, _map(file) as buffer:
+            return BinaryParser.bytes_to_coefficient(buffer, index)
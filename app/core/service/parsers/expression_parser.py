@@ -0,0 +1,172 @@
+from re import compile
+from typing import Any, Dict, List, Optional, Tuple
+
+from core.domain.exceptions.parsers import (StrToExpressionException, StrToIntegerException, StrToNaturalException,
+                                            StrToPolymonialException, StrToRationalException)
+from core.service.parsers.natural_parser import NaturalParser
+from core.service.parsers.integer_parser import IntegerParser
+from core.service.parsers.rational_parser import RationalParser
+from core.service.parsers.polynoial_parser import PolynomialParser
+from core.domain.entities.expression import Expression, ExpressionNode
+from core.domain.entities.integer import Integer
+from core.domain.entities.natural import Natural
+from core.domain.entities.polynomial import Polynomial
+from core.domain.entities.rational import Rational
+from core.service.parsers.regex_patters import EXPRESSION_TOKEN_PATTERN
+from core.service.solvers.natural_solver import NZER_N_B
+
+_TOKEN_REGEX = compile(EXPRESSION_TOKEN_PATTERN)
+_SPACE_REGEX = compile(r'\s*')
+_CALL_REGEX = compile(r'\s*\(')
+
+_LITERALS = {
+    'N': NaturalParser.str_to_nat,
+    'Z': IntegerParser.str_to_int,
+    'Q': RationalParser.str_to_ratio,
+    'P': PolynomialParser.str_to_polynom,
+}
+_FLAGS = {'True': True, 'False': False}
+
+
+def _literal(kind: str, text: str) -> Optional[Any]:
+    """
+    Разбор константы вида N[...], Z[...], Q[...] или P[...]; None, если текст не является константой этого вида
+    или содержит дробь с нулевым знаменателем.
+    """
+
+    try:
+        value = _LITERALS[kind](text)
+    except (StrToNaturalException, StrToIntegerException, StrToRationalException, StrToPolymonialException):
+        return None
+    ratios = value.coefficients if isinstance(value, Polynomial) else (value,) if isinstance(value, Rational) else ()
+    if any(not NZER_N_B(ratio.denominator) for ratio in ratios):
+        return None
+    return value
+
+def _node(nodes: List[ExpressionNode], table: Dict[Tuple, int], key: Tuple, node: ExpressionNode) -> int:
+    """
+    Номер вершины с ключом key: одинаковые подвыражения имеют одинаковые ключи и получают одну вершину.
+    """
+
+    if key not in table:
+        table[key] = len(nodes)
+        nodes.append(node)
+    return table[key]
+
+
+def _constant_to_str(value) -> str:
+    """
+    Запись константы: сущности - в виде N[...], Z[...], Q[...], P[...], числа и флаги - как есть.
+    """
+
+    if isinstance(value, Natural):
+        return f'N[{NaturalParser.nat_to_str(value)}]'
+    if isinstance(value, Integer):
+        return f'Z[{IntegerParser.int_to_str(value)}]'
+    if isinstance(value, Rational):
+        return f'Q[{RationalParser.ratio_to_str(value)}]'
+    if isinstance(value, Polynomial):
+        return f'P[{PolynomialParser.polynom_to_str(value)}]'
+    return str(value)
+
+
+class ExpressionParser:
+    """
+    Выражение записывается так же, как цепочка вызовов решателей: ADD_QQ_Q(MUL_QQ_Q(a, b), MUL_QQ_Q(a, b)).
+    Аргументы - вызовы, константы N[...], Z[...], Q[...], P[...] в форматах соответствующих парсеров, целые числа
+    (цифры и степени для решателей вида MUL_ND_N), флаги True/False и переменные, значения которых задаются при вычислении.
+    Разбор идет без рекурсии, со стеком открытых вызовов; одинаковые подвыражения объединяются в одну вершину
+    по ключу (имя решателя, номера вершин-аргументов), поэтому вершины получаются сразу в топологическом порядке.
+    """
+
+    def str_to_expression(expr_str: str) -> Expression:
+        nodes: List[ExpressionNode] = []
+        table: Dict[Tuple, int] = {}
+        frames: List[Tuple[Optional[str], List[int]]] = [(None, [])]
+        expect_value = True
+
+        pos = _SPACE_REGEX.match(expr_str).end()
+        while pos < len(expr_str):
+            match = _TOKEN_REGEX.match(expr_str, pos)
+            if not match:
+                raise StrToExpressionException(expr_str, f'неожиданный символ в позиции {pos}')
+            pos = match.end()
+            symbol = match.group('symbol')
+
+            if symbol is None:
+                if not expect_value:
+                    raise StrToExpressionException(expr_str, f'ожидается запятая или скобка в позиции {match.start()}')
+                name = match.group('name')
+                call = _CALL_REGEX.match(expr_str, pos) if name else None
+                if call:
+                    pos = call.end()
+                    frames.append((name, []))
+                else:
+                    if match.group('literal'):
+                        kind, text = match.group('literal'), match.group('text')
+                        value = _literal(kind, text)
+                        if value is None:
+                            raise StrToExpressionException(expr_str, f'неверная константа в позиции {match.start()}')
+                        node = _node(nodes, table, ('literal', kind, text), ExpressionNode(value=value))
+                    elif match.group('number'):
+                        value = int(match.group('number'))
+                        node = _node(nodes, table, ('number', value), ExpressionNode(value=value))
+                    elif name in _FLAGS:
+                        node = _node(nodes, table, ('flag', name), ExpressionNode(value=_FLAGS[name]))
+                    else:
+                        node = _node(nodes, table, ('variable', name), ExpressionNode(variable=name))
+                    frames[-1][1].append(node)
+                    expect_value = False
+            elif symbol == ',':
+                if expect_value or len(frames) == 1:
+                    raise StrToExpressionException(expr_str, f'лишняя запятая в позиции {match.start()}')
+                expect_value = True
+            elif symbol == ')':
+                if len(frames) == 1:
+                    raise StrToExpressionException(expr_str, f'лишняя закрывающая скобка в позиции {match.start()}')
+                if expect_value and frames[-1][1]:
+                    raise StrToExpressionException(expr_str, f'лишняя запятая перед скобкой в позиции {match.start()}')
+                name, args = frames.pop()
+                frames[-1][1].append(_node(nodes, table, ('call', name, tuple(args)), ExpressionNode(solver_name=name, args=tuple(args))))
+                expect_value = False
+            else:
+                raise StrToExpressionException(expr_str, f'лишняя открывающая скобка в позиции {match.start()}')
+            pos = _SPACE_REGEX.match(expr_str, pos).end()
+
+        if len(frames) > 1:
+            raise StrToExpressionException(expr_str, 'не закрыта скобка')
+        if not frames[0][1]:
+            raise StrToExpressionException(expr_str, 'пустое выражение')
+        return Expression(tuple(nodes), frames[0][1][0])
+
+    def expression_to_str(expression: Expression) -> str:
+        """
+        Запись выражения строкой. Граф обходится в глубину с явным стеком, части записи собираются в один список,
+        поэтому тексты подвыражений не хранятся по отдельности и память растет линейно по длине результата.
+        Подвыражение, общее для нескольких вызовов, записывается в каждом из них.
+        """
+
+        nodes = expression.nodes
+        constants = {}
+        parts = []
+        stack = [expression.root]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, str):
+                parts.append(item)
+                continue
+            node = nodes[item]
+            if node.solver_name is not None:
+                parts.append(f'{node.solver_name}(')
+                stack.append(')')
+                for k in range(len(node.args) - 1, -1, -1):
+                    stack.append(node.args[k])
+                    if k:
+                        stack.append(', ')
+            elif node.variable is not None:
+                parts.append(node.variable)
+            else:
+                if item not in constants:
+                    constants[item] = _constant_to_str(node.value)
+                parts.append(constants[item])
+        return ''.join(parts)
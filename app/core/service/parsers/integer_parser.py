@@ -7,14 +7,14 @@ from core.service.parsers.regex_patters import INTEGER_PATTERN
 
 class IntegerParser:
     
-    def str_to_int(int_str: str) -> Integer:
-        if not fullmatch(INTEGER_PATTERN, int_str):
+    def str_to_int(int_str: str, validate: bool = True) -> Integer:
+        if validate and not fullmatch(INTEGER_PATTERN, int_str):
             raise StrToIntegerException(int_str)
         
-        return Integer(1, NaturalParser.str_to_nat(int_str[1::])) if int_str[0] == '-' else Integer(0, NaturalParser.str_to_nat(int_str))
+        return Integer(1, NaturalParser.str_to_nat(int_str[1::], False)) if int_str[0] == '-' else Integer(0, NaturalParser.str_to_nat(int_str, False))
     
     def int_to_str(integer: Integer) -> str:
         result = NaturalParser.nat_to_str(integer.number)
         if integer.sign:
             result = '-' + result
-        return result
\ No newline at end of file
+        return result
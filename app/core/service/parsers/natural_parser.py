@@ -1,15 +1,31 @@
+from array import array
 from re import fullmatch
 
 from core.domain.exceptions.parsers import StrToNaturalException
+from core.domain.entities.limb_natural import LIMB_DIGITS, LimbNatural
 from core.domain.entities.natural import Natural
 from core.service.parsers.regex_patters import NATURAL_PATTERN
 
+# Таблицы перекодировки символов '0'-'9' в цифры 0-9 и обратно (перевод выполняется целиком на уровне C).
+TO_DIGITS = bytes.maketrans(b'0123456789', bytes(range(10)))
+FROM_DIGITS = bytes.maketrans(bytes(range(10)), b'0123456789')
+
 class NaturalParser:
     
-    def str_to_nat(nat_str: str) -> Natural:
-        if not fullmatch(NATURAL_PATTERN, nat_str):
+    def str_to_nat(nat_str: str, validate: bool = True) -> Natural:
+        if validate and not fullmatch(NATURAL_PATTERN, nat_str):
             raise StrToNaturalException(nat_str)
-        return Natural(len(nat_str), [int(c) for c in nat_str])
+        return Natural(len(nat_str), tuple(nat_str.encode().translate(TO_DIGITS)))
         
     def nat_to_str(nat: Natural) -> str:
-        return ''.join(map(str, nat.digits))
\ No newline at end of file
+        return bytes(nat.digits).translate(FROM_DIGITS).decode()
+    
+    def str_to_limb_nat(nat_str: str, validate: bool = True) -> LimbNatural:
+        if validate and not fullmatch(NATURAL_PATTERN, nat_str):
+            raise StrToNaturalException(nat_str)
+        limbs = array('I', [int(nat_str[max(i-LIMB_DIGITS, 0):i]) for i in range(len(nat_str), 0, -LIMB_DIGITS)])
+        return LimbNatural(len(limbs), limbs)
+    
+    def limb_nat_to_str(limb_nat: LimbNatural) -> str:
+        limbs = limb_nat.limbs
+        return str(limbs[-1]) + ''.join(map('{:09d}'.format, reversed(limbs[:-1])))
@@ -7,11 +7,11 @@ from core.service.parsers.regex_patters import POLYNOMIAL_PATTERN
 
 class PolynomialParser:
     
-    def str_to_polynom(polynom_str: str) -> Polynomial:
-        if not fullmatch(POLYNOMIAL_PATTERN, polynom_str):
+    def str_to_polynom(polynom_str: str, validate: bool = True) -> Polynomial:
+        if validate and not fullmatch(POLYNOMIAL_PATTERN, polynom_str):
             raise StrToPolymonialException(polynom_str)
         coef_str = polynom_str.split('; ')
-        return Polynomial(len(coef_str)-1, [RationalParser.str_to_ratio(coef) for coef in coef_str])
+        return Polynomial(len(coef_str)-1, tuple(RationalParser.str_to_ratio(coef, False) for coef in coef_str))
     
     def polynom_to_str(polynom: Polynomial) -> str:
-        return '; '.join(map(RationalParser.ratio_to_str, polynom.coefficients))
\ No newline at end of file
+        return '; '.join(map(RationalParser.ratio_to_str, polynom.coefficients))
@@ -5,13 +5,18 @@ from core.service.parsers.natural_parser import NaturalParser
 from core.service.parsers.integer_parser import IntegerParser
 from core.domain.entities.rational import Rational
 from core.service.parsers.regex_patters import RATIONAL_PATTERN
+from core.service.solvers.natural_solver import NZER_N_B
+from core.service.solvers.rational_solver import RED_Q_Q
 
 class RationalParser:
-    def str_to_ratio(ratio_str: str) -> Rational:
-        if not fullmatch(RATIONAL_PATTERN, ratio_str):
+    def str_to_ratio(ratio_str: str, validate: bool = True) -> Rational:
+        if validate and not fullmatch(RATIONAL_PATTERN, ratio_str):
             raise StrToRationalException(ratio_str)
         slash_index = ratio_str.find('/')
-        return Rational(IntegerParser.str_to_int(ratio_str[:slash_index]), NaturalParser.str_to_nat(ratio_str[slash_index+1::]))
+        return Rational(IntegerParser.str_to_int(ratio_str[:slash_index], False), NaturalParser.str_to_nat(ratio_str[slash_index+1::], False))
         
     def ratio_to_str(ratio: Rational) -> str:
-        return f'{IntegerParser.int_to_str(ratio.numerator)}/{NaturalParser.nat_to_str(ratio.denominator)}'
\ No newline at end of file
+        # Результаты операций с reduce=False печатаются в сокращенном виде; дроби с нулевым знаменателем - как есть
+        if not ratio.reduced and NZER_N_B(ratio.denominator):
+            ratio = RED_Q_Q(ratio)
+        return f'{IntegerParser.int_to_str(ratio.numerator)}/{NaturalParser.nat_to_str(ratio.denominator)}'
@@ -1,4 +1,7 @@
 NATURAL_PATTERN = r'(0|[1-9][0-9]*)'
 INTEGER_PATTERN = rf'-?{NATURAL_PATTERN}'
 RATIONAL_PATTERN = rf'{INTEGER_PATTERN}/{NATURAL_PATTERN}'
-POLYNOMIAL_PATTERN = rf'{RATIONAL_PATTERN}(; {RATIONAL_PATTERN})*'
\ No newline at end of file
+POLYNOMIAL_PATTERN = rf'{RATIONAL_PATTERN}(; {RATIONAL_PATTERN})*'
+SPARSE_TERM_PATTERN = rf'{RATIONAL_PATTERN} x\^{NATURAL_PATTERN}'
+SPARSE_POLYNOMIAL_PATTERN = rf'{SPARSE_TERM_PATTERN}(; {SPARSE_TERM_PATTERN})*'
+EXPRESSION_TOKEN_PATTERN = r'(?:(?P<literal>[NZQP])\[(?P<text>[^\]]*)\]|(?P<name>[A-Za-z_][A-Za-z0-9_]*)|(?P<number>-?[0-9]+)|(?P<symbol>[(),]))'
@@ -0,0 +1,30 @@
+from re import fullmatch
+
+from core.domain.exceptions.parsers import StrToSparsePolymonialException
+from core.service.parsers.rational_parser import RationalParser
+from core.domain.entities.sparse_polynomial import SparsePolynomial
+from core.service.parsers.regex_patters import SPARSE_POLYNOMIAL_PATTERN
+
+class SparsePolynomialParser:
+    
+    def str_to_sparse(polynom_str: str, validate: bool = True) -> SparsePolynomial:
+        if validate and not fullmatch(SPARSE_POLYNOMIAL_PATTERN, polynom_str):
+            raise StrToSparsePolymonialException(polynom_str)
+        terms = {}
+        for term_str in polynom_str.split('; '):
+            coef_str, exp_str = term_str.split(' x^')
+            try:
+                exponent = int(exp_str)
+            except ValueError:
+                raise StrToSparsePolymonialException(polynom_str)
+            if exponent in terms:
+                raise StrToSparsePolymonialException(polynom_str)
+            coef = RationalParser.str_to_ratio(coef_str, False)
+            terms[exponent] = coef
+        terms = tuple((exponent, coef) for exponent, coef in sorted(terms.items(), reverse=True) if coef.numerator.number.digits[0] != 0)
+        return SparsePolynomial(terms[0][0] if terms else 0, terms)
+    
+    def sparse_to_str(polynom: SparsePolynomial) -> str:
+        if not polynom.terms:
+            return '0/1 x^0'
+        return '; '.join(f'{RationalParser.ratio_to_str(coef)} x^{exponent}' for exponent, coef in polynom.terms)
@@ -0,0 +1,95 @@
+from re import compile
+from typing import IO, Iterable, Iterator, Union
+
+from core.domain.exceptions.parsers import StrToNaturalException, StrToPolymonialException
+from core.service.parsers.natural_parser import FROM_DIGITS, TO_DIGITS
+from core.service.parsers.rational_parser import RationalParser
+from core.domain.entities.natural import Natural
+from core.domain.entities.polynomial import Polynomial
+from core.domain.entities.rational import Rational
+from core.service.parsers.regex_patters import POLYNOMIAL_PATTERN
+
+# Размер блока, читаемого из файла за один раз.
+STREAM_CHUNK_SIZE = 1 << 16
+# Сколько символов ошибочного фрагмента попадает в сообщение об ошибке.
+_ERROR_PREVIEW = 64
+
+_POLYNOMIAL_REGEX = compile(POLYNOMIAL_PATTERN)
+_DIGITS_REGEX = compile(r'[0-9]*')
+
+Source = Union[IO, Iterable[Union[str, bytes]]]
+
+
+def _chunks(source: Source, chunk_size: int) -> Iterator[str]:
+    """
+    Непустые текстовые блоки источника: файловый объект читается по chunk_size символов (или байт),
+    итератор блоков проходится как есть; блоки bytes декодируются как ASCII.
+    """
+
+    if hasattr(source, 'read'):
+        file = source
+        source = iter(lambda: file.read(chunk_size) or None, None)
+    for chunk in source:
+        if isinstance(chunk, bytes):
+            chunk = chunk.decode('ascii')
+        if chunk:
+            yield chunk
+
+
+def _preview(text: str) -> str:
+    """
+    Начало ошибочного фрагмента для сообщения об ошибке: не больше _ERROR_PREVIEW символов.
+    """
+
+    return text if len(text) <= _ERROR_PREVIEW else text[:_ERROR_PREVIEW] + '...'
+
+
+class StreamParser:
+    """
+    Потоковый разбор входа из файлового объекта или итератора блоков (str или bytes) в тех же форматах, что и у
+    NaturalParser и PolynomialParser. Каждый символ проверяется регулярным выражением один раз (одна проверка на блок), вход целиком в памяти
+    не собирается: хранится текущий блок и фрагменты числа, не уместившегося в него. Перевод строки в конце входа допускается.
+    """
+
+    def stream_coefficients(source: Source, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[Rational]:
+        pieces = []
+        for chunk in _chunks(source, chunk_size):
+            pieces.append(chunk)
+            if '; ' not in chunk and not (len(pieces) > 1 and pieces[-2][-1] == ';' and chunk[0] == ' '):
+                continue
+            text = ''.join(pieces)
+            end = text.rfind('; ')
+            yield from StreamParser._coefficients(text[:end])
+            pieces = [text[end+2:]] if end + 2 < len(text) else []
+        yield from StreamParser._coefficients(''.join(pieces).rstrip('\r\n'))
+
+    def stream_to_polynom(source: Source, chunk_size: int = STREAM_CHUNK_SIZE) -> Polynomial:
+        coefficients = tuple(StreamParser.stream_coefficients(source, chunk_size))
+        return Polynomial(len(coefficients)-1, coefficients)
+
+    def stream_to_nat(source: Source, chunk_size: int = STREAM_CHUNK_SIZE) -> Natural:
+        digits = bytearray()
+        previous = ''
+        for chunk in _chunks(source, chunk_size):
+            if previous and not _DIGITS_REGEX.fullmatch(previous):
+                raise StrToNaturalException(_preview(previous))
+            digits += previous.encode().translate(TO_DIGITS)
+            previous = chunk
+        previous = previous.rstrip('\r\n')
+        if not _DIGITS_REGEX.fullmatch(previous):
+            raise StrToNaturalException(_preview(previous))
+        digits += previous.encode().translate(TO_DIGITS)
+
+        if not digits or (digits[0] == 0 and len(digits) > 1):
+            raise StrToNaturalException(_preview(bytes(digits[:_ERROR_PREVIEW + 1]).translate(FROM_DIGITS).decode()))
+        return Natural(len(digits), tuple(digits))
+
+    def _coefficients(polynom_str: str) -> Iterator[Rational]:
+        """
+        Коэффициенты фрагмента записи полинома, состоящего из полностью прочитанных коэффициентов (без разделителей по краям): фрагмент проверяется одним регулярным выражением.
+        """
+
+        if not _POLYNOMIAL_REGEX.fullmatch(polynom_str):
+            raise StrToPolymonialException(_preview(polynom_str))
+        for coef_str in polynom_str.split('; '):
+            yield RationalParser.str_to_ratio(coef_str, False)
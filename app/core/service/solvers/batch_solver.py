@@ -0,0 +1,225 @@
+from typing import Sequence, Tuple
+
+import numpy as np
+
+from core.domain.entities.limb_natural import LIMB_BASE, LimbNatural
+from core.domain.entities.natural import Natural
+from core.domain.entities.natural_batch import NaturalBatch
+from core.domain.exceptions.numbers import DifferentBatchSizeException, FirstLessThanSecondException, IncorrectDigitException
+from core.service.parsers.natural_parser import NaturalParser
+from core.service.solvers.limb_solver import TRANS_L_N, TRANS_N_L
+from core.service.solvers.natural_solver import MOD_NN_N, from_native
+
+# Наибольший модуль, по которому остатки вычисляются векторно: r * 10^9 + лимб помещается в int64 при r < модуля.
+BATCH_MOD_LIMIT = (2 ** 63 - LIMB_BASE) // LIMB_BASE
+
+
+def _build(limbs: np.ndarray) -> NaturalBatch:
+    """
+    Построение NaturalBatch по матрице лимбов: старшие столбцы, нулевые во всех строках, отбрасываются.
+    """
+
+    nonzero = np.flatnonzero(limbs.any(axis=0)) if limbs.size else np.empty(0, dtype=np.int64)
+    width = int(nonzero[-1]) + 1 if nonzero.size else 1
+    limbs = np.ascontiguousarray(limbs[:, :width])
+    limbs.setflags(write=False)
+    return NaturalBatch(limbs.shape[0], width, limbs)
+
+
+def _pad(batch: NaturalBatch, width: int) -> np.ndarray:
+    """
+    Матрица лимбов набора, дополненная нулевыми старшими столбцами до заданной ширины.
+    """
+
+    if batch.limb_count == width:
+        return batch.limbs
+    return np.pad(batch.limbs, ((0, 0), (0, width - batch.limb_count)))
+
+
+def _check_count(batch1: NaturalBatch, batch2: NaturalBatch):
+    """
+    Проверка, что наборы содержат одинаковое количество чисел.
+    """
+
+    if batch1.count != batch2.count:
+        raise DifferentBatchSizeException(batch1.count, batch2.count)
+
+
+def TRANS_N_B(nats: Sequence[Natural]) -> NaturalBatch:
+    """
+    Упаковка натуральных чисел в матрицу лимбов. Короткие числа (с машинным значением) раскладываются
+    на лимбы одной векторной операцией, длинные - через запись лимбами.
+
+    Args:
+        nats (Sequence[Natural]): Числа.
+
+    Returns:
+        NaturalBatch: Набор чисел.
+    """
+
+    long = {i: TRANS_N_L(nat).limbs for i, nat in enumerate(nats) if nat.native is None}
+    width = max((len(limbs) for limbs in long.values()), default=2)
+    limbs = np.zeros((len(nats), max(width, 2)), dtype=np.int64)
+
+    natives = np.array([0 if nat.native is None else nat.native for nat in nats], dtype=np.int64)
+    limbs[:, 0], limbs[:, 1] = natives % LIMB_BASE, natives // LIMB_BASE
+    for i, row in long.items():
+        limbs[i, :len(row)] = row
+    return _build(limbs)
+
+
+def TRANS_B_N(batch: NaturalBatch) -> Tuple[Natural, ...]:
+    """
+    Распаковка набора в натуральные числа. Числа не длиннее двух лимбов собираются из машинных значений.
+
+    Args:
+        batch (NaturalBatch): Набор чисел.
+
+    Returns:
+        Tuple[Natural, ...]: Числа в порядке строк.
+    """
+
+    limbs = batch.limbs
+    short = ~limbs[:, 2:].any(axis=1)
+    natives = (limbs[:, 0] + (limbs[:, 1] * LIMB_BASE if batch.limb_count > 1 else 0)).tolist()
+
+    nats = []
+    for i, is_short in enumerate(short.tolist()):
+        if is_short:
+            nats.append(from_native(natives[i]))
+        else:
+            row = limbs[i]
+            length = int(np.flatnonzero(row)[-1]) + 1
+            nats.append(TRANS_L_N(LimbNatural(length, row[:length].astype(np.uint32))))
+    return tuple(nats)
+
+
+def ADD_BB_B(batch1: NaturalBatch, batch2: NaturalBatch) -> NaturalBatch:
+    """
+    Поэлементное сложение наборов: перенос распространяется по столбцам, каждый столбец обрабатывается для всех строк сразу.
+
+    Args:
+        batch1 (NaturalBatch): Первый набор.
+        batch2 (NaturalBatch): Второй набор.
+
+    Returns:
+        NaturalBatch: Набор сумм.
+    """
+
+    _check_count(batch1, batch2)
+    width = max(batch1.limb_count, batch2.limb_count)
+    result = np.empty((batch1.count, width + 1), dtype=np.int64)
+    result[:, :width] = _pad(batch1, width) + _pad(batch2, width)
+
+    carry = np.zeros(batch1.count, dtype=np.int64)
+    for j in range(width):
+        column = result[:, j] + carry
+        carry = (column >= LIMB_BASE).astype(np.int64)
+        result[:, j] = column - carry * LIMB_BASE
+    result[:, width] = carry
+    return _build(result)
+
+
+def SUB_BB_B(batch1: NaturalBatch, batch2: NaturalBatch) -> NaturalBatch:
+    """
+    Поэлементное вычитание наборов с распространением заема по столбцам. Каждое число первого набора
+    должно быть не меньше соответствующего числа второго.
+
+    Args:
+        batch1 (NaturalBatch): Первый набор.
+        batch2 (NaturalBatch): Второй набор.
+
+    Returns:
+        NaturalBatch: Набор разностей.
+    """
+
+    _check_count(batch1, batch2)
+    width = max(batch1.limb_count, batch2.limb_count)
+    result = _pad(batch1, width) - _pad(batch2, width)
+
+    borrow = np.zeros(batch1.count, dtype=np.int64)
+    for j in range(width):
+        column = result[:, j] - borrow
+        borrow = (column < 0).astype(np.int64)
+        result[:, j] = column + borrow * LIMB_BASE
+
+    negative = np.flatnonzero(borrow)
+    if negative.size:
+        i = int(negative[0])
+        nat1, nat2 = TRANS_B_N(_build(_pad(batch1, width)[i:i+1]))[0], TRANS_B_N(_build(_pad(batch2, width)[i:i+1]))[0]
+        raise FirstLessThanSecondException(NaturalParser.nat_to_str(nat1), NaturalParser.nat_to_str(nat2))
+    return _build(result)
+
+
+def MUL_BD_B(batch: NaturalBatch, multiplier: int) -> NaturalBatch:
+    """
+    Умножение всех чисел набора на цифру с распространением переноса по столбцам.
+
+    Args:
+        batch (NaturalBatch): Набор.
+        multiplier (int): Цифра множитель.
+
+    Returns:
+        NaturalBatch: Набор произведений.
+    """
+
+    if not 0 <= multiplier < 10:
+        raise IncorrectDigitException(multiplier)
+
+    result = np.empty((batch.count, batch.limb_count + 1), dtype=np.int64)
+    carry = np.zeros(batch.count, dtype=np.int64)
+    for j in range(batch.limb_count):
+        column = batch.limbs[:, j] * multiplier + carry
+        carry, result[:, j] = np.divmod(column, LIMB_BASE)
+    result[:, batch.limb_count] = carry
+    return _build(result)
+
+
+def COM_BB_D(batch1: NaturalBatch, batch2: NaturalBatch) -> np.ndarray:
+    """
+    Поэлементное сравнение наборов: результат для каждой пары - как у COM_NN_D (2, если больше первое число,
+    1, если второе, 0 для равных). Для каждой строки берется старший различающийся лимб.
+
+    Args:
+        batch1 (NaturalBatch): Первый набор.
+        batch2 (NaturalBatch): Второй набор.
+
+    Returns:
+        np.ndarray: Результаты сравнения (int8).
+    """
+
+    _check_count(batch1, batch2)
+    width = max(batch1.limb_count, batch2.limb_count)
+    sign = np.sign(_pad(batch1, width) - _pad(batch2, width))
+
+    differs = sign != 0
+    top = width - 1 - np.argmax(differs[:, ::-1], axis=1)
+    leading = sign[np.arange(batch1.count), top]
+    return np.where(leading > 0, 2, np.where(leading < 0, 1, 0)).astype(np.int8)
+
+
+def MOD_BN_B(batch: NaturalBatch, modulus: Natural) -> NaturalBatch:
+    """
+    Остатки от деления всех чисел набора на одно число. Для модуля меньше BATCH_MOD_LIMIT остаток вычисляется
+    векторно схемой Горнера по лимбам, от старшего к младшему; для большего модуля - поэлементно через MOD_NN_N.
+
+    Args:
+        batch (NaturalBatch): Набор.
+        modulus (Natural): Модуль.
+
+    Returns:
+        NaturalBatch: Набор остатков.
+    """
+
+    if modulus.native == 0:
+        raise ZeroDivisionError('Ошибка: Деление на 0 невозможно')
+    if modulus.native is None or modulus.native >= BATCH_MOD_LIMIT:
+        return TRANS_N_B([MOD_NN_N(nat, modulus) for nat in TRANS_B_N(batch)])
+
+    remainder = np.zeros(batch.count, dtype=np.int64)
+    for j in range(batch.limb_count - 1, -1, -1):
+        remainder = (remainder * LIMB_BASE + batch.limbs[:, j]) % modulus.native
+
+    limbs = np.empty((batch.count, 2), dtype=np.int64)
+    limbs[:, 1], limbs[:, 0] = np.divmod(remainder, LIMB_BASE)
+    return _build(limbs)
@@ -0,0 +1,1087 @@
+from typing import List, Optional, Sequence, Tuple
+
+from core.domain.entities.constants import INTEGER_ONE, INTEGER_ZERO, NATURAL_ONE, POLYNOMIAL_ZERO, RATIONAL_ONE, RATIONAL_ZERO
+from core.domain.entities.content_polynomial import ContentPolynomial
+from core.domain.entities.integer import Integer
+from core.domain.entities.limb_natural import LIMB_BASE
+from core.domain.entities.polynomial import Polynomial
+from core.domain.entities.rational import Rational
+from core.service.solvers.integer_solver import MUL_ZM_Z, MUL_ZZ_Z, POZ_Z_D, TRANS_N_Z
+from core.service.solvers.limb_kernel import add, com, div_digit, divmod_limbs, from_int, gcd, mul, mul_digit, normalize, pack, pow_limbs, sadd, smul, ssub, sub
+from core.service.solvers.limb_solver import TRANS_L_N, TRANS_N_L
+from core.service.solvers.natural_solver import DIV_NN_N, GCF_NN_N, MUL_NN_N
+from core.service.solvers.rational_solver import DIV_QQ_Q, MUL_QQ_Q, POW_QZ_Q, RED_Q_Q
+
+# Внутри решателя полином хранится списком коэффициентов, начиная с младшего (индекс равен степени),
+# каждый коэффициент - число со знаком в виде пары (знак, лимбы модуля), как в limb_kernel.
+SignedLimbs = Tuple[int, List[int]]
+
+_ZERO = (0, [0])
+_ONE = (0, [1])
+
+# Наибольшее число простых модулей в модульном НОД, после которого используется субрезультантная последовательность остатков.
+MODULAR_GCD_MAX_PRIMES = 1000
+# Найденные простые меньше 10^9 для модульного НОД, по убыванию.
+_GCD_PRIMES = []
+
+# Пороги выбора алгоритма умножения полиномов (в коэффициентах меньшего множителя), подобраны по замерам.
+# Между POLY_KRONECKER_CUTOFF и POLY_KARATSUBA_CUTOFF подстановка Кронекера выгодна только для коротких
+# коэффициентов (суммарно не длиннее KRONECKER_SHORT_WIDTH лимбов), для длинных быстрее умножение столбиком.
+POLY_KRONECKER_CUTOFF = 4
+POLY_KARATSUBA_CUTOFF = 16
+KRONECKER_SHORT_WIDTH = 4
+# Допустимое раздувание записи при подстановке Кронекера (во сколько раз ячейки фиксированной ширины длиннее самих коэффициентов).
+KRONECKER_MAX_PADDING = 4
+
+
+def _to_signed(integer: Integer) -> SignedLimbs:
+    """
+    Преобразование целого числа в число со знаком, записанное лимбами.
+    """
+
+    limbs = list(TRANS_N_L(integer.number).limbs)
+    return (integer.sign if limbs != [0] else 0), limbs
+
+
+def _to_integer(x: SignedLimbs) -> Integer:
+    """
+    Преобразование числа со знаком, записанного лимбами, в целое число.
+    """
+
+    return Integer(x[0], TRANS_L_N(pack(x[1])))
+
+
+def _ptrim(p: List[SignedLimbs]) -> List[SignedLimbs]:
+    """
+    Удаление нулевых старших коэффициентов (нулевой полином хранится как один нулевой коэффициент).
+    """
+
+    while len(p) > 1 and p[-1][1] == [0]:
+        p.pop()
+    return p
+
+
+def _pzero(p: List[SignedLimbs]) -> bool:
+    """
+    Проверка, что полином нулевой.
+    """
+
+    return len(p) == 1 and p[0][1] == [0]
+
+
+def _padd(p: List[SignedLimbs], q: List[SignedLimbs]) -> List[SignedLimbs]:
+    """
+    Сложение двух полиномов с целыми коэффициентами.
+    """
+
+    if len(p) < len(q):
+        p, q = q, p
+    return _ptrim([sadd(x, y) for x, y in zip(p, q)] + p[len(q):])
+
+
+def _pscale(p: List[SignedLimbs], scalar: SignedLimbs) -> List[SignedLimbs]:
+    """
+    Умножение полинома с целыми коэффициентами на целое число.
+    """
+
+    if scalar == _ONE:
+        return p
+    if scalar[1] == [0]:
+        return [_ZERO]
+    return [smul(x, scalar) for x in p]
+
+
+def _pmul_schoolbook(p: List[SignedLimbs], q: List[SignedLimbs]) -> List[SignedLimbs]:
+    """
+    Умножение двух полиномов с целыми коэффициентами столбиком.
+    """
+
+    columns = [_ZERO] * (len(p) + len(q) - 1)
+    for i, x in enumerate(p):
+        if x[1] != [0]:
+            for j, y in enumerate(q, i):
+                if y[1] != [0]:
+                    columns[j] = sadd(columns[j], smul(x, y))
+    return columns
+
+
+def _pmul_karatsuba(p: List[SignedLimbs], q: List[SignedLimbs]) -> List[SignedLimbs]:
+    """
+    Умножение двух полиномов с целыми коэффициентами алгоритмом Карацубы по степеням x.
+    Если q короче половины p, p режется на блоки длины q.
+    """
+
+    if 2 * len(q) <= len(p):
+        result = [_ZERO] * (len(p) + len(q) - 1)
+        for start in range(0, len(p), len(q)):
+            for j, c in enumerate(_pmul(p[start:start+len(q)], q), start):
+                result[j] = sadd(result[j], c)
+        return result
+
+    m = (len(p) + 1) // 2
+    p0, p1 = p[:m], p[m:]
+    q0, q1 = q[:m], q[m:]
+
+    z0 = _pmul(p0, q0)
+    z2 = _pmul(p1, q1) if q1 else [_ZERO]
+    z1 = _pmul(_padd(p0, p1), _padd(q0, q1))
+
+    result = [_ZERO] * (len(p) + len(q) - 1)
+    for j, c in enumerate(z0):
+        result[j] = c
+    for j, c in enumerate(z2, 2*m):
+        result[j] = c
+    for j, c in enumerate(z1):
+        c = ssub(c, z0[j] if j < len(z0) else _ZERO)
+        c = ssub(c, z2[j] if j < len(z2) else _ZERO)
+        if c[1] != [0]:
+            result[j+m] = sadd(result[j+m], c)
+    return result
+
+
+def _kronecker_pack(p: List[SignedLimbs], width: int) -> SignedLimbs:
+    """
+    Значение полинома в точке X = 10^(9*width): коэффициенты укладываются в ячейки по width лимбов,
+    положительные и отрицательные коэффициенты собираются в два числа, которые затем вычитаются.
+    """
+
+    positive = []
+    negative = []
+    empty = [0] * width
+    for x in p:
+        slot = x[1] + [0] * (width - len(x[1]))
+        if x[0]:
+            positive.extend(empty)
+            negative.extend(slot)
+        else:
+            positive.extend(slot)
+            negative.extend(empty)
+    return ssub((0, normalize(positive)), (0, normalize(negative)))
+
+
+def _kronecker_unpack(value: SignedLimbs, width: int, count: int) -> List[SignedLimbs]:
+    """
+    Восстановление count коэффициентов по значению полинома в точке X = 10^(9*width).
+    Ячейки читаются как уравновешенные цифры из [-X/2, X/2): ячейка не меньше X/2 дает отрицательный коэффициент и заем из следующей.
+    """
+
+    sign, limbs = value
+    border = [0] * width + [1]
+    half = LIMB_BASE // 2
+
+    result = []
+    carry = 0
+    for i in range(count):
+        slot = limbs[i*width:(i+1)*width]
+        slot += [0] * (width - len(slot))
+        if carry:
+            slot = add(slot, [1])
+        if len(slot) > width or slot[-1] >= half:
+            magnitude = sub(border, slot)
+            result.append((sign ^ 1 if magnitude != [0] else 0, magnitude))
+            carry = 1
+        else:
+            magnitude = normalize(slot)
+            result.append((sign if magnitude != [0] else 0, magnitude))
+            carry = 0
+    return result
+
+
+def _max_magnitude(p: List[SignedLimbs]) -> Tuple[int, int]:
+    """
+    Оценка сверху наибольшего модуля коэффициента полинома: (t, l) означает, что все модули меньше t * 10^(9*l).
+    """
+
+    length = max(len(x[1]) for x in p)
+    top = max(x[1][-1] for x in p if len(x[1]) == length)
+    return top + 1, length - 1
+
+
+def _kronecker_width(p: List[SignedLimbs], q: List[SignedLimbs]) -> int:
+    """
+    Ширина ячейки (в лимбах) для подстановки Кронекера: каждый коэффициент произведения по модулю не больше
+    min(len(p), len(q)) * max|p_i| * max|q_j|, и удвоенная оценка должна помещаться в ячейку.
+    """
+
+    top_p, shift_p = _max_magnitude(p)
+    top_q, shift_q = _max_magnitude(q)
+    return shift_p + shift_q + len(from_int(2 * min(len(p), len(q)) * top_p * top_q))
+
+
+def _pmul_kronecker(p: List[SignedLimbs], q: List[SignedLimbs], parallel: bool = False) -> List[SignedLimbs]:
+    """
+    Умножение двух полиномов с целыми коэффициентами подстановкой Кронекера: полиномы вычисляются в точке X = 10^(9*width),
+    значения перемножаются быстрым умножением limb_kernel, коэффициенты произведения читаются из ячеек результата.
+    Ширина ячейки выбирается так, чтобы |коэффициент произведения| < X/2.
+    При parallel=True значения перемножаются параллельным умножением limb_kernel.
+    """
+
+    width = _kronecker_width(p, q)
+    packed_p = _kronecker_pack(p, width)
+    packed_q = packed_p if p is q else _kronecker_pack(q, width)
+    return _kronecker_unpack(smul(packed_p, packed_q, parallel), width, len(p) + len(q) - 1)
+
+
+def _pmul(p: List[SignedLimbs], q: List[SignedLimbs], parallel: bool = False) -> List[SignedLimbs]:
+    """
+    Умножение двух полиномов с целыми коэффициентами с выбором алгоритма по степени и размеру коэффициентов.
+    Подстановка Кронекера выравнивает все коэффициенты по самому длинному, поэтому при сильном разбросе длин
+    (раздувание больше KRONECKER_MAX_PADDING раз) используется Карацуба.
+    Флаг parallel передается в подстановку Кронекера: она сводит произведение к одному умножению больших чисел.
+    """
+
+    if _pzero(p) or _pzero(q):
+        return [_ZERO]
+    if len(p) < len(q):
+        p, q = q, p
+
+    if len(q) < POLY_KRONECKER_CUTOFF:
+        return _ptrim(_pmul_schoolbook(p, q))
+
+    width_p = max(len(x[1]) for x in p)
+    width_q = max(len(y[1]) for y in q)
+    if len(q) < POLY_KARATSUBA_CUTOFF:
+        if width_p + width_q <= KRONECKER_SHORT_WIDTH:
+            return _ptrim(_pmul_kronecker(p, q))
+        return _ptrim(_pmul_schoolbook(p, q))
+
+    used = sum(len(x[1]) for x in p) + sum(len(y[1]) for y in q)
+    if len(p) * width_p + len(q) * width_q <= KRONECKER_MAX_PADDING * used:
+        return _ptrim(_pmul_kronecker(p, q, parallel))
+    return _ptrim(_pmul_karatsuba(p, q))
+
+
+def _pneg(p: List[SignedLimbs]) -> List[SignedLimbs]:
+    """
+    Смена знака всех коэффициентов полинома.
+    """
+
+    return [(x[0] ^ 1 if x[1] != [0] else 0, x[1]) for x in p]
+
+
+def _psubproduct_tree(points: List[SignedLimbs]) -> List[List[List[SignedLimbs]]]:
+    """
+    Дерево подпроизведений для точек u_j: листья - линейные множители (x - u_j), каждый следующий уровень - попарные произведения.
+    Последний уровень состоит из одного полинома - произведения всех множителей.
+    """
+
+    level = [[(x[0] ^ 1 if x[1] != [0] else 0, x[1]), _ONE] for x in points]
+    tree = [level]
+    while len(level) > 1:
+        level = [_pmul(level[i], level[i+1]) if i + 1 < len(level) else level[i] for i in range(0, len(level), 2)]
+        tree.append(level)
+    return tree
+
+
+def _pmultipoint(p: List[SignedLimbs], points: List[SignedLimbs]) -> List[SignedLimbs]:
+    """
+    Значения полинома с целыми коэффициентами в целых точках спуском остатков по дереву подпроизведений:
+    остаток от деления на произведение множителей узла передается детям, в листьях остаток - значение в точке.
+    """
+
+    tree = _psubproduct_tree(points)
+    remainders = [_pdivmod(p, tree[-1][0])[1]]
+    for level in reversed(tree[:-1]):
+        remainders = [_pdivmod(remainders[i // 2], node)[1] for i, node in enumerate(level)]
+    return [r[0] for r in remainders]
+
+
+def _phorner(p: List[SignedLimbs], u: SignedLimbs, v: List[int]) -> SignedLimbs:
+    """
+    Однородная схема Горнера: значение v^n * p(u/v) для полинома p степени n, все вычисления в целых числах.
+    """
+
+    acc = p[-1]
+    v_power = _ONE
+    for x in reversed(p[:-1]):
+        if v != [1]:
+            v_power = smul(v_power, (0, v))
+        acc = smul(acc, u)
+        if x[1] != [0]:
+            acc = sadd(acc, smul(x, v_power) if v_power != _ONE else x)
+    return acc
+
+
+def _pcontent(p: List[SignedLimbs]) -> List[int]:
+    """
+    НОД модулей коэффициентов полинома. Вычисление прерывается, как только НОД становится равным 1.
+    """
+
+    g = [0]
+    for x in p:
+        if x[1] != [0]:
+            g = gcd(g, x[1])[0]
+            if g == [1]:
+                break
+    return g
+
+
+def _pdivmod(a: List[SignedLimbs], b: List[SignedLimbs]) -> Tuple[List[SignedLimbs], List[SignedLimbs], int]:
+    """
+    Псевдоделение полиномов с целыми коэффициентами без дробей: возвращает q, r и s, для которых lc(b)^s * a = q*b + r.
+    Деление выполняется за один проход по буферу остатка: на каждом шаге остаток домножается на lc(b),
+    но домножение откладывается - для каждой ячейки хранится, сколько домножений к ней уже применено,
+    и ячейка догоняется одним умножением на степень lc(b) только когда до нее доходит окно делителя.
+    Коэффициенты частного так же домножаются один раз в конце. При lc(b) = 1 и на шагах с нулевым
+    ведущим коэффициентом остатка домножение не выполняется вовсе.
+    """
+
+    n = len(b) - 1
+    if len(a) - 1 < n:
+        return [_ZERO], list(a), 0
+
+    lc = b[-1]
+    monic = lc == _ONE
+    powers = [_ONE, lc]
+
+    def power(d: int) -> SignedLimbs:
+        while len(powers) <= d:
+            powers.append(smul(powers[-1], lc))
+        return powers[d]
+
+    r = list(a)
+    level = [0] * len(r)
+    q = [_ZERO] * (len(a) - n)
+    q_level = [0] * len(q)
+    s = 0
+    for k in range(len(a) - 1 - n, -1, -1):
+        t = r[n+k]
+        if t[1] == [0]:
+            continue
+        if level[n+k] != s:
+            t = smul(t, power(s - level[n+k]))
+        r[n+k] = _ZERO
+        if not monic:
+            s += 1
+        q[k] = t
+        q_level[k] = s
+
+        for j in range(n):
+            x = r[k+j]
+            if level[k+j] != s and x[1] != [0]:
+                x = smul(x, power(s - level[k+j]))
+            if b[j][1] != [0]:
+                x = ssub(x, smul(t, b[j]))
+            r[k+j] = x
+            level[k+j] = s
+
+    for j in range(n):
+        if level[j] != s and r[j][1] != [0]:
+            r[j] = smul(r[j], power(s - level[j]))
+    for k in range(len(q)):
+        if q_level[k] != s and q[k][1] != [0]:
+            q[k] = smul(q[k], power(s - q_level[k]))
+
+    return _ptrim(q), _ptrim(r[:n] or [_ZERO]), s
+
+
+def _primitive(content: Rational, p: List[SignedLimbs]) -> Tuple[Rational, List[SignedLimbs]]:
+    """
+    Представление полинома content * p в виде содержания и примитивной части с положительным старшим коэффициентом.
+    """
+
+    p = _ptrim(p)
+    if _pzero(p) or POZ_Z_D(content.numerator) == 0:
+        return RATIONAL_ZERO, [_ZERO]
+
+    g = _pcontent(p)
+    sign = p[-1][0]
+    if g != [1]:
+        p = [(x[0], divmod_limbs(x[1], g)[0]) for x in p]
+    if sign:
+        p = _pneg(p)
+
+    factor = Rational(Integer(sign, TRANS_L_N(pack(g))), NATURAL_ONE, True)
+    return MUL_QQ_Q(content, factor), p
+
+
+def _unpack(cpolynom: ContentPolynomial) -> List[SignedLimbs]:
+    """
+    Примитивная часть полинома в виде списка чисел со знаком, начиная с младшего коэффициента.
+    """
+
+    return [_to_signed(coef) for coef in reversed(cpolynom.coefficients)]
+
+
+def _build(content: Rational, p: List[SignedLimbs]) -> ContentPolynomial:
+    """
+    Построение ContentPolynomial по содержанию и уже примитивной части.
+    """
+
+    return ContentPolynomial(len(p) - 1, content, tuple(_to_integer(x) for x in reversed(p)))
+
+
+def _lcm_all(values: List[List[int]]) -> List[int]:
+    """
+    НОК набора положительных чисел, заданных лимбами. Совпадающие с текущим НОК и единичные значения пропускаются без вычисления НОД.
+    """
+
+    lcm = [1]
+    for value in values:
+        if value != [1] and com(value, lcm) != 0:
+            lcm = mul(divmod_limbs(lcm, gcd(lcm, value)[0])[0], value)
+    return lcm
+
+
+def _value(content: Rational, value: SignedLimbs, denominator: List[int]) -> Rational:
+    """
+    Значение content * value / denominator, сокращаемое один раз.
+    """
+
+    numerator = smul(_to_signed(content.numerator), value)
+    denominator = mul(list(TRANS_N_L(content.denominator).limbs), denominator)
+    return RED_Q_Q(Rational(_to_integer(numerator), TRANS_L_N(pack(denominator))))
+
+
+def _lc_power(lc: SignedLimbs, s: int) -> Rational:
+    """
+    Степень старшего коэффициента делителя, накопленная при псевдоделении, в виде рационального числа.
+    """
+
+    return Rational(_to_integer((0, pow_limbs(lc[1], from_int(s)))), NATURAL_ONE, True)
+
+
+def _spow(x: SignedLimbs, e: int) -> SignedLimbs:
+    """
+    Возведение числа со знаком в неотрицательную степень.
+    """
+
+    magnitude = pow_limbs(x[1], from_int(e))
+    return (x[0] & e & 1 if magnitude != [0] else 0), magnitude
+
+
+def _sdiv_exact(x: SignedLimbs, y: SignedLimbs) -> SignedLimbs:
+    """
+    Точное деление чисел со знаком.
+    """
+
+    quotient = divmod_limbs(x[1], y[1])[0]
+    return (x[0] ^ y[0] if quotient != [0] else 0), quotient
+
+
+def _psubresultant_gcd(a: List[SignedLimbs], b: List[SignedLimbs]) -> List[SignedLimbs]:
+    """
+    НОД полиномов с целыми коэффициентами по субрезультантной последовательности полиномиальных остатков (Коллинз, Браун).
+    Псевдоостатки делятся на g*h^delta точно, поэтому рост коэффициентов остается полиномиальным, без вычисления содержаний на каждом шаге.
+    Результат совпадает с НОД с точностью до постоянного множителя.
+    """
+
+    if len(a) < len(b):
+        a, b = b, a
+    g = h = _ONE
+
+    while True:
+        delta = len(a) - len(b)
+        _, r, s = _pdivmod(a, b)
+        if _pzero(r):
+            return b
+        r = _pscale(r, _spow(b[-1], delta + 1 - s))
+
+        divisor = smul(g, _spow(h, delta))
+        a, b = b, [_sdiv_exact(x, divisor) for x in r]
+        g = a[-1]
+        if delta == 1:
+            h = g
+        elif delta > 1:
+            h = _sdiv_exact(_spow(g, delta), _spow(h, delta - 1))
+
+
+def _prime(x: int) -> bool:
+    """
+    Проверка простоты машинного числа пробным делением.
+    """
+
+    if x < 2 or x % 2 == 0:
+        return x == 2
+    d = 3
+    while d * d <= x:
+        if x % d == 0:
+            return False
+        d += 2
+    return True
+
+
+def _gcd_prime(index: int) -> int:
+    """
+    Простое число с номером index из последовательности простых меньше 10^9 (по убыванию).
+    Каждое простое помещается в один лимб, найденные простые запоминаются в _GCD_PRIMES.
+    """
+
+    while len(_GCD_PRIMES) <= index:
+        candidate = _GCD_PRIMES[-1] - 2 if _GCD_PRIMES else LIMB_BASE - 1
+        while not _prime(candidate):
+            candidate -= 2
+        _GCD_PRIMES.append(candidate)
+    return _GCD_PRIMES[index]
+
+
+def _reduce_mod(p: List[SignedLimbs], prime: int) -> List[int]:
+    """
+    Образ полинома с целыми коэффициентами по модулю простого числа (вычеты в [0, prime)).
+    """
+
+    image = []
+    for x in p:
+        v = 0
+        for limb in reversed(x[1]):
+            v = (v * LIMB_BASE + limb) % prime
+        image.append((prime - v) % prime if x[0] else v)
+    return image
+
+
+def _gcd_mod(a: List[int], b: List[int], prime: int) -> List[int]:
+    """
+    Нормированный НОД полиномов над полем вычетов по простому модулю алгоритмом Евклида.
+    """
+
+    while len(a) > 1 and a[-1] == 0:
+        a.pop()
+    while len(b) > 1 and b[-1] == 0:
+        b.pop()
+
+    while b != [0]:
+        inv = pow(b[-1], prime - 2, prime)
+        n = len(b) - 1
+        for k in range(len(a) - 1 - n, -1, -1):
+            c = a[k+n] * inv % prime
+            if c:
+                for j in range(n + 1):
+                    a[k+j] = (a[k+j] - c * b[j]) % prime
+        a = a[:n] or [0]
+        while len(a) > 1 and a[-1] == 0:
+            a.pop()
+        a, b = b, a
+
+    inv = pow(a[-1], prime - 2, prime)
+    return [c * inv % prime for c in a]
+
+
+def _ratrecon(w: List[int], modulus: List[int]) -> Optional[Tuple[SignedLimbs, List[int]]]:
+    """
+    Рациональное восстановление: поиск дроби n/d с |n|, d < sqrt(modulus/2), сравнимой с w по модулю modulus,
+    расширенным алгоритмом Евклида, остановленным на середине. Возвращает None, если такой дроби нет.
+    """
+
+    def small(x: List[int]) -> bool:
+        return com(mul_digit(mul(x, x), 2), modulus) == 1
+
+    r0, r1 = modulus, w
+    t0, t1 = _ZERO, _ONE
+    while not small(r1):
+        quotient, remainder = divmod_limbs(r0, r1)
+        r0, r1 = r1, remainder
+        t0, t1 = t1, ssub(t0, smul((0, quotient), t1))
+
+    if t1[1] == [0] or not small(t1[1]) or gcd(r1, t1[1])[0] != [1]:
+        return None
+    return (t1[0] if r1 != [0] else 0, r1), t1[1]
+
+
+def _reconstruct(residues: List[List[int]], modulus: List[int]) -> Optional[List[SignedLimbs]]:
+    """
+    Восстановление полинома с рациональными коэффициентами по вычетам коэффициентов и приведение его к примитивному целому.
+    Общий знаменатель D накапливается по мере обхода: для очередного вычета восстанавливается w*D, и если
+    результат уже целый, дополнительное рациональное восстановление не требуется.
+    """
+
+    denominator = [1]
+    numerators = []
+    for w in residues:
+        wd = divmod_limbs(mul(w, denominator), modulus)[1]
+        fraction = _ratrecon(wd, modulus)
+        if fraction is None:
+            return None
+        numer, den = fraction
+        if den != [1]:
+            denominator = mul(denominator, den)
+            numerators = _pscale(numerators, (0, den)) if numerators else numerators
+        numerators.append(numer)
+    return _primitive(RATIONAL_ONE, numerators)[1]
+
+
+def _pdivides(b: List[SignedLimbs], a: List[SignedLimbs]) -> bool:
+    """
+    Проверка пробным делением, что полином b делит полином a.
+    """
+
+    return _pzero(_pdivmod(a, b)[1])
+
+
+def _pmodular_gcd(a: List[SignedLimbs], b: List[SignedLimbs]) -> Optional[List[SignedLimbs]]:
+    """
+    Модульный НОД примитивных полиномов с целыми коэффициентами: нормированные НОД по модулю простых
+    собираются по китайской теореме об остатках, коэффициенты восстанавливаются рационально, результат проверяется пробным делением.
+    Простые, делящие старшие коэффициенты, пропускаются; образ большей степени, чем минимальная, отбрасывается
+    как неудачный, образ меньшей степени начинает накопление заново. Возвращает None, если за MODULAR_GCD_MAX_PRIMES
+    простых результат не получен.
+    """
+
+    residues = None
+    modulus = [1]
+    previous = None
+    for index in range(MODULAR_GCD_MAX_PRIMES):
+        prime = _gcd_prime(index)
+        image_a = _reduce_mod(a, prime)
+        image_b = _reduce_mod(b, prime)
+        if image_a[-1] == 0 or image_b[-1] == 0:
+            continue
+
+        image = _gcd_mod(image_a, image_b, prime)
+        if len(image) == 1:
+            return [_ONE]
+        if residues is not None and len(image) > len(residues):
+            continue
+        if residues is None or len(image) < len(residues):
+            residues = [from_int(c) for c in image]
+            modulus = [prime]
+            previous = None
+        else:
+            inv = pow(div_digit(modulus, prime)[1], prime - 2, prime)
+            for i, c in enumerate(image):
+                u = (c - div_digit(residues[i], prime)[1]) * inv % prime
+                if u:
+                    residues[i] = add(residues[i], mul_digit(modulus, u))
+            modulus = mul_digit(modulus, prime)
+
+        candidate = _reconstruct(residues, modulus)
+        if candidate is None:
+            continue
+        if candidate == previous and _pdivides(candidate, a) and _pdivides(candidate, b):
+            return candidate
+        previous = candidate
+    return None
+
+
+def _pgcd(a: List[SignedLimbs], b: List[SignedLimbs], modular: bool) -> List[SignedLimbs]:
+    """
+    НОД примитивных полиномов (один из них может быть нулевым) в виде примитивного полинома с положительным старшим коэффициентом.
+    """
+
+    if _pzero(b):
+        return a
+    if _pzero(a):
+        return b
+    g = _pmodular_gcd(a, b) if modular and len(a) > 1 and len(b) > 1 else None
+    if g is None:
+        g = _primitive(RATIONAL_ONE, _psubresultant_gcd(a, b))[1]
+    return g
+
+
+def _monic(p: List[SignedLimbs]) -> ContentPolynomial:
+    """
+    Полином со старшим коэффициентом 1, заданный примитивной частью с положительным старшим коэффициентом.
+    """
+
+    return _build(Rational(INTEGER_ONE, TRANS_L_N(pack(p[-1][1])), True), p)
+
+
+def _pdiv_exact(a: List[SignedLimbs], b: List[SignedLimbs]) -> List[SignedLimbs]:
+    """
+    Точное деление полиномов с целыми коэффициентами, когда b делит a (для примитивного b частное целое по лемме Гаусса).
+    Коэффициент частного - точное частное старшего коэффициента остатка на lc(b), без псевдоделения и роста коэффициентов.
+    Младшие deg b коэффициентов остатка заведомо обнуляются, поэтому они не пересчитываются.
+    """
+
+    if _pzero(a):
+        return [_ZERO]
+    n = len(b) - 1
+    lc = b[-1]
+    r = list(a)
+    q = [_ZERO] * (len(a) - n)
+    for k in range(len(q) - 1, -1, -1):
+        c = r[k+n]
+        if c[1] == [0]:
+            continue
+        if lc != _ONE:
+            c = _sdiv_exact(c, lc)
+        q[k] = c
+        for j in range(max(n - k, 0), n):
+            if b[j][1] != [0]:
+                r[k+j] = ssub(r[k+j], smul(c, b[j]))
+    return q
+
+
+def _pderivative(p: List[SignedLimbs]) -> List[SignedLimbs]:
+    """
+    Производная полинома с целыми коэффициентами.
+    """
+
+    if len(p) == 1:
+        return [_ZERO]
+    return [smul(p[i], (0, from_int(i))) if p[i][1] != [0] else _ZERO for i in range(1, len(p))]
+
+
+def _psquarefree(f: List[SignedLimbs], modular: bool) -> List[Tuple[List[SignedLimbs], int]]:
+    """
+    Бесквадратное разложение примитивного полинома алгоритмом Юня: f = lc(f) * a_1 * a_2^2 * ... * a_k^k.
+    После одного НОД(f, f') каждый шаг вычисляет a_i = НОД(b_i, d_i), где d_i = c_i - b_i', и точно делит
+    b_i и d_i на a_i, так что степени полиномов в НОД убывают от шага к шагу. Возвращаются множители
+    положительной степени с их кратностями, все примитивные с положительным старшим коэффициентом.
+    """
+
+    df = _pderivative(f)
+    a = _pgcd(f, df, modular)
+    b = _pdiv_exact(f, a)
+    c = _pdiv_exact(df, a)
+    factors = []
+    i = 1
+    while len(b) > 1:
+        d = _ptrim(_padd(c, _pneg(_pderivative(b))))
+        a = _pgcd(b, d, modular)
+        if len(a) > 1:
+            factors.append((a, i))
+            b = _pdiv_exact(b, a)
+            c = _pdiv_exact(d, a)
+        else:
+            c = d
+        i += 1
+    return factors
+
+
+def TRANS_P_C(polynom: Polynomial) -> ContentPolynomial:
+    """
+    Преобразование полинома в произведение содержания на примитивную часть.
+    Коэффициенты приводятся к общему знаменателю (НОК знаменателей), после чего из числителей выносится их НОД.
+
+    Args:
+        polynom (Polynomial): Полином.
+
+    Returns:
+        ContentPolynomial: Полином в виде содержания и примитивной части.
+    """
+
+    coefficients = polynom.coefficients[::-1]
+    denominators = [list(TRANS_N_L(coef.denominator).limbs) for coef in coefficients]
+    if [0] in denominators:
+        raise ZeroDivisionError('Ошибка: Знаменатель равен 0')
+
+    lcm = _lcm_all(denominators)
+    numerators = []
+    for coef, den in zip(coefficients, denominators):
+        numer = _to_signed(coef.numerator)
+        if com(den, lcm) != 0:
+            numer = smul(numer, (0, divmod_limbs(lcm, den)[0]))
+        numerators.append(numer)
+
+    content, p = _primitive(Rational(INTEGER_ONE, TRANS_L_N(pack(lcm)), True), numerators)
+    return _build(content, p)
+
+
+def TRANS_C_P(cpolynom: ContentPolynomial) -> Polynomial:
+    """
+    Преобразование полинома из произведения содержания на примитивную часть в полином с рациональными коэффициентами.
+    Каждый коэффициент сокращается один раз: целый коэффициент примитивной части умножается на содержание.
+
+    Args:
+        cpolynom (ContentPolynomial): Полином в виде содержания и примитивной части.
+
+    Returns:
+        Polynomial: Полином.
+    """
+
+    if POZ_Z_D(cpolynom.content.numerator) == 0:
+        return POLYNOMIAL_ZERO
+
+    coefficients = tuple(
+        RATIONAL_ZERO if POZ_Z_D(coef) == 0 else MUL_QQ_Q(cpolynom.content, Rational(coef, NATURAL_ONE, True))
+        for coef in cpolynom.coefficients
+    )
+    return Polynomial(cpolynom.polynom_degree, coefficients)
+
+
+def ADD_CC_C(cpolynom1: ContentPolynomial, cpolynom2: ContentPolynomial) -> ContentPolynomial:
+    """
+    Сложение полиномов. Для содержаний a1/b1, a2/b2 и g = НОД(b1, b2) примитивные части складываются
+    с целыми множителями a1*(b2/g) и a2*(b1/g) над общим знаменателем b1*b2/g.
+
+    Args:
+        cpolynom1 (ContentPolynomial): Первый полином.
+        cpolynom2 (ContentPolynomial): Второй полином.
+
+    Returns:
+        ContentPolynomial: Сумма полиномов.
+    """
+
+    if POZ_Z_D(cpolynom1.content.numerator) == 0:
+        return cpolynom2
+    if POZ_Z_D(cpolynom2.content.numerator) == 0:
+        return cpolynom1
+
+    den1 = cpolynom1.content.denominator
+    den2 = cpolynom2.content.denominator
+    gcf = GCF_NN_N(den1, den2)
+    dopmul1 = DIV_NN_N(den1, gcf)
+    dopmul2 = DIV_NN_N(den2, gcf)
+
+    p1 = _pscale(_unpack(cpolynom1), _to_signed(MUL_ZZ_Z(cpolynom1.content.numerator, TRANS_N_Z(dopmul2))))
+    p2 = _pscale(_unpack(cpolynom2), _to_signed(MUL_ZZ_Z(cpolynom2.content.numerator, TRANS_N_Z(dopmul1))))
+
+    content, p = _primitive(Rational(INTEGER_ONE, MUL_NN_N(dopmul1, den2), True), _padd(p1, p2))
+    return _build(content, p)
+
+
+def SUB_CC_C(cpolynom1: ContentPolynomial, cpolynom2: ContentPolynomial) -> ContentPolynomial:
+    """
+    Вычитание полиномов.
+
+    Args:
+        cpolynom1 (ContentPolynomial): Первый полином.
+        cpolynom2 (ContentPolynomial): Второй полином.
+
+    Returns:
+        ContentPolynomial: Разность полиномов.
+    """
+
+    content = cpolynom2.content
+    negated = Rational(MUL_ZM_Z(content.numerator), content.denominator, content.reduced)
+    return ADD_CC_C(cpolynom1, ContentPolynomial(cpolynom2.polynom_degree, negated, cpolynom2.coefficients))
+
+
+def MUL_CQ_C(cpolynom: ContentPolynomial, ratio: Rational) -> ContentPolynomial:
+    """
+    Умножение полинома на рациональное число: изменяется только содержание.
+
+    Args:
+        cpolynom (ContentPolynomial): Полином.
+        ratio (Rational): Рациональное число.
+
+    Returns:
+        ContentPolynomial: Произведение полинома и рационального числа.
+    """
+
+    if POZ_Z_D(ratio.numerator) == 0 or POZ_Z_D(cpolynom.content.numerator) == 0:
+        return ContentPolynomial(0, RATIONAL_ZERO, (INTEGER_ZERO,))
+    return ContentPolynomial(cpolynom.polynom_degree, MUL_QQ_Q(cpolynom.content, ratio), cpolynom.coefficients)
+
+
+def MUL_CC_C(cpolynom1: ContentPolynomial, cpolynom2: ContentPolynomial, parallel: bool = False) -> ContentPolynomial:
+    """
+    Умножение полиномов. По лемме Гаусса произведение примитивных полиномов примитивно,
+    поэтому перемножаются только целые примитивные части и содержания, без сокращения коэффициентов.
+    При parallel=True большое произведение подстановкой Кронекера вычисляется в пуле процессов.
+
+    Args:
+        cpolynom1 (ContentPolynomial): Первый полином.
+        cpolynom2 (ContentPolynomial): Второй полином.
+        parallel (bool): Распределять ли умножение больших полиномов по процессам.
+
+    Returns:
+        ContentPolynomial: Произведение полиномов.
+    """
+
+    if POZ_Z_D(cpolynom1.content.numerator) == 0 or POZ_Z_D(cpolynom2.content.numerator) == 0:
+        return ContentPolynomial(0, RATIONAL_ZERO, (INTEGER_ZERO,))
+    p1 = _unpack(cpolynom1)
+    p2 = p1 if cpolynom2 is cpolynom1 else _unpack(cpolynom2)
+    return _build(MUL_QQ_Q(cpolynom1.content, cpolynom2.content), _pmul(p1, p2, parallel))
+
+
+def DIVMOD_CC(cpolynom1: ContentPolynomial, cpolynom2: ContentPolynomial, pseudo: bool = False) -> Tuple[ContentPolynomial, ContentPolynomial]:
+    """
+    Деление полиномов с остатком за один проход псевдоделения примитивных частей над целыми числами.
+    При pseudo=False возвращаются обычные частное и остаток над рациональными числами:
+    накопленная степень старшего коэффициента делителя переносится в содержания.
+    При pseudo=True возвращаются псевдочастное Q и псевдоостаток R, для которых lc(B)^e * A = Q*B + R,
+    e = max(deg A - deg B + 1, 0); для полиномов с целыми коэффициентами Q и R также целые.
+
+    Args:
+        cpolynom1 (ContentPolynomial): Делимое A.
+        cpolynom2 (ContentPolynomial): Делитель B.
+        pseudo (bool): Выполнять ли псевдоделение.
+
+    Returns:
+        Tuple[ContentPolynomial, ContentPolynomial]: Частное и остаток.
+    """
+
+    if POZ_Z_D(cpolynom2.content.numerator) == 0:
+        raise ZeroDivisionError('Ошибка: Деление на 0 невозможно')
+
+    b = _unpack(cpolynom2)
+    q, r, s = _pdivmod(_unpack(cpolynom1), b)
+
+    if not pseudo:
+        q_content = DIV_QQ_Q(DIV_QQ_Q(cpolynom1.content, cpolynom2.content), _lc_power(b[-1], s))
+        r_content = DIV_QQ_Q(cpolynom1.content, _lc_power(b[-1], s))
+    else:
+        e = max(cpolynom1.polynom_degree - cpolynom2.polynom_degree + 1, 0)
+        if e == 0:
+            return _build(RATIONAL_ZERO, [_ZERO]), cpolynom1
+        scale = MUL_QQ_Q(cpolynom1.content, _lc_power(b[-1], e - s))
+        q_content = MUL_QQ_Q(scale, POW_QZ_Q(cpolynom2.content, _to_integer((0, from_int(e - 1)))))
+        r_content = MUL_QQ_Q(q_content, cpolynom2.content)
+
+    return _build(*_primitive(q_content, q)), _build(*_primitive(r_content, r))
+
+
+def DIV_CC_C(cpolynom1: ContentPolynomial, cpolynom2: ContentPolynomial) -> ContentPolynomial:
+    """
+    Частное от деления полиномов.
+
+    Args:
+        cpolynom1 (ContentPolynomial): Делимое.
+        cpolynom2 (ContentPolynomial): Делитель.
+
+    Returns:
+        ContentPolynomial: Частное от деления полиномов.
+    """
+
+    return DIVMOD_CC(cpolynom1, cpolynom2)[0]
+
+
+def MOD_CC_C(cpolynom1: ContentPolynomial, cpolynom2: ContentPolynomial) -> ContentPolynomial:
+    """
+    Остаток от деления полиномов.
+
+    Args:
+        cpolynom1 (ContentPolynomial): Делимое.
+        cpolynom2 (ContentPolynomial): Делитель.
+
+    Returns:
+        ContentPolynomial: Остаток от деления полиномов.
+    """
+
+    return DIVMOD_CC(cpolynom1, cpolynom2)[1]
+
+
+def GCF_CC_C(cpolynom1: ContentPolynomial, cpolynom2: ContentPolynomial, modular: bool = True) -> ContentPolynomial:
+    """
+    Нормированный НОД полиномов над рациональными числами (со старшим коэффициентом 1).
+    НОД над Q с точностью до множителя равен НОД примитивных частей, которые обрабатываются модульным алгоритмом
+    (образы по простым модулям, КТО, рациональное восстановление, проверка пробным делением).
+    При modular=False, а также если модульный алгоритм не сошелся, используется субрезультантная последовательность остатков.
+
+    Args:
+        cpolynom1 (ContentPolynomial): Первый полином.
+        cpolynom2 (ContentPolynomial): Второй полином.
+        modular (bool): Использовать ли модульный алгоритм.
+
+    Returns:
+        ContentPolynomial: НОД полиномов.
+    """
+
+    if POZ_Z_D(cpolynom1.content.numerator) == 0:
+        cpolynom1, cpolynom2 = cpolynom2, cpolynom1
+    if POZ_Z_D(cpolynom1.content.numerator) == 0:
+        return cpolynom1
+
+    return _monic(_pgcd(_unpack(cpolynom1), _unpack(cpolynom2), modular))
+
+
+def VAL_CQ_Q(cpolynom: ContentPolynomial, ratio: Rational) -> Rational:
+    """
+    Значение полинома в рациональной точке u/v однородной схемой Горнера над целыми числами:
+    вычисляется v^n * P(u/v) для примитивной части P степени n, дробь сокращается один раз в конце.
+
+    Args:
+        cpolynom (ContentPolynomial): Полином.
+        ratio (Rational): Точка.
+
+    Returns:
+        Rational: Значение полинома в точке.
+    """
+
+    v = list(TRANS_N_L(ratio.denominator).limbs)
+    if v == [0]:
+        raise ZeroDivisionError('Ошибка: Знаменатель равен 0')
+    if POZ_Z_D(cpolynom.content.numerator) == 0:
+        return RATIONAL_ZERO
+
+    value = _phorner(_unpack(cpolynom), _to_signed(ratio.numerator), v)
+    return _value(cpolynom.content, value, pow_limbs(v, from_int(cpolynom.polynom_degree)))
+
+
+def MVAL_CQ_Q(cpolynom: ContentPolynomial, ratios: Sequence[Rational], tree: bool = False) -> Tuple[Rational, ...]:
+    """
+    Значения полинома во многих рациональных точках. По умолчанию примитивная часть распаковывается один раз
+    и вычисляется однородной схемой Горнера в каждой точке, степени знаменателей v^n вычисляются один раз для
+    каждого различного знаменателя. При tree=True точки приводятся к общему знаменателю V: x_j = u_j / V,
+    полином P(x) заменяется на целый полином Q(y) = V^n * P(y / V), и его значения в целых точках u_j
+    вычисляются спуском остатков по дереву подпроизведений. Над целыми числами коэффициенты остатков
+    в верхних узлах дерева растут вместе со степенью узла, поэтому на практических размерах схема Горнера быстрее.
+    Каждое значение сокращается один раз.
+
+    Args:
+        cpolynom (ContentPolynomial): Полином.
+        ratios (Sequence[Rational]): Точки.
+        tree (bool): Вычислять значения по дереву подпроизведений.
+
+    Returns:
+        Tuple[Rational, ...]: Значения полинома в точках, в том же порядке.
+    """
+
+    denominators = [list(TRANS_N_L(ratio.denominator).limbs) for ratio in ratios]
+    if [0] in denominators:
+        raise ZeroDivisionError('Ошибка: Знаменатель равен 0')
+    if POZ_Z_D(cpolynom.content.numerator) == 0:
+        return (RATIONAL_ZERO,) * len(ratios)
+
+    p = _unpack(cpolynom)
+    degree = from_int(cpolynom.polynom_degree)
+    if not tree:
+        powers = {}
+        values = []
+        for ratio, den in zip(ratios, denominators):
+            key = tuple(den)
+            if key not in powers:
+                powers[key] = pow_limbs(den, degree)
+            values.append(_value(cpolynom.content, _phorner(p, _to_signed(ratio.numerator), den), powers[key]))
+        return tuple(values)
+
+    if not ratios:
+        return ()
+    common = _lcm_all(denominators)
+    points = []
+    for ratio, den in zip(ratios, denominators):
+        u = _to_signed(ratio.numerator)
+        points.append(u if com(den, common) == 0 else smul(u, (0, divmod_limbs(common, den)[0])))
+
+    if common != [1]:
+        scaled = [p[-1]]
+        v_power = _ONE
+        for x in reversed(p[:-1]):
+            v_power = smul(v_power, (0, common))
+            scaled.append(smul(x, v_power))
+        p = scaled[::-1]
+
+    denominator = pow_limbs(common, degree)
+    return tuple(_value(cpolynom.content, value, denominator) for value in _pmultipoint(p, points))
+
+
+def NMR_C_C(cpolynom: ContentPolynomial, modular: bool = True) -> ContentPolynomial:
+    """
+    Бесквадратная часть полинома P / НОД(P, P'), нормированная к старшему коэффициенту 1.
+    НОД вычисляется для примитивной части (по умолчанию модульным алгоритмом), деление на него точное.
+
+    Args:
+        cpolynom (ContentPolynomial): Полином.
+        modular (bool): Использовать ли модульный алгоритм НОД.
+
+    Returns:
+        ContentPolynomial: Бесквадратная часть полинома.
+    """
+
+    if POZ_Z_D(cpolynom.content.numerator) == 0:
+        return cpolynom
+
+    p = _unpack(cpolynom)
+    return _monic(_pdiv_exact(p, _pgcd(p, _pderivative(p), modular)))
+
+
+def SQF_C(cpolynom: ContentPolynomial, modular: bool = True) -> Tuple[Tuple[ContentPolynomial, int], ...]:
+    """
+    Бесквадратное разложение полинома алгоритмом Юня: P = lc(P) * F_1 * F_2^2 * ... * F_k^k, где
+    F_i попарно взаимно просты, не имеют кратных корней и нормированы к старшему коэффициенту 1.
+    Разложение строится для примитивной части: НОД вычисляются по умолчанию модульным алгоритмом, деления точные.
+
+    Args:
+        cpolynom (ContentPolynomial): Полином.
+        modular (bool): Использовать ли модульный алгоритм НОД.
+
+    Returns:
+        Tuple[Tuple[ContentPolynomial, int], ...]: Множители F_i положительной степени и их кратности i в порядке возрастания кратности.
+    """
+
+    if POZ_Z_D(cpolynom.content.numerator) == 0:
+        return ()
+
+    return tuple((_monic(a), i) for a, i in _psquarefree(_unpack(cpolynom), modular))
@@ -1,10 +1,12 @@
-from copy import deepcopy
+from typing import Tuple
 
+from core.domain.entities.constants import INTEGER_ONE, NATURAL_ONE
 from core.domain.entities.integer import Integer
 from core.domain.entities.natural import Natural
 from core.domain.exceptions.numbers import ConvertNegativeToNaturalException
 from core.service.parsers.integer_parser import IntegerParser
-from core.service.solvers.natural_solver import ADD_NN_N, COM_NN_D, DIV_NN_N, MUL_NN_N, NZER_N_B, SUB_NN_N
+from core.service.solvers.limb_solver import TRANS_L_N, TRANS_N_L, XGCF_LL_L
+from core.service.solvers.natural_solver import ADD_NN_N, COM_NN_D, DIV_NN_N, DIVMOD_NN, MUL_NN_N, NZER_N_B, POW_NN_N, POWMOD_NNN_N, SUB_NN_N
 
 
 def ABS_Z_N(integer: Integer) -> Natural:
@@ -18,7 +20,7 @@ def ABS_Z_N(integer: Integer) -> Natural:
         Natural: Модуль числа.
     """
     
-    return deepcopy(integer.number)
+    return integer.number
 
 
 def POZ_Z_D(integer: Integer) -> int:
@@ -50,11 +52,10 @@ def MUL_ZM_Z(integer: Integer) -> Integer:
     Returns:
         Integer: Число с инверсированным знаком.
     """
-    result = deepcopy(integer)
-    if POZ_Z_D(result):
-        result.sign ^= 1
+    if POZ_Z_D(integer):
+        return Integer(integer.sign ^ 1, integer.number)
         
-    return result
+    return integer
 
 
 def TRANS_N_Z(nat: Natural) -> Integer:
@@ -68,7 +69,7 @@ def TRANS_N_Z(nat: Natural) -> Integer:
         Integer: Преобразованное в целое натуральное число.
     """
     
-    return Integer(0, deepcopy(nat))
+    return Integer(0, nat)
 
 
 def TRANS_Z_N (integer: Integer) -> Natural:
@@ -85,7 +86,7 @@ def TRANS_Z_N (integer: Integer) -> Natural:
     if POZ_Z_D(integer) == 1:
         raise ConvertNegativeToNaturalException(IntegerParser.int_to_str(integer))
     
-    return deepcopy(integer.number)
+    return integer.number
 
 
 def ADD_ZZ_Z(integer1: Integer, integer2: Integer) -> Integer:
@@ -100,19 +101,17 @@ def ADD_ZZ_Z(integer1: Integer, integer2: Integer) -> Integer:
         Integer: Сумма двух целых чисел.
     """
     
-    int1_copy = deepcopy(integer1)
-    int2_copy = deepcopy(integer2)
-    if COM_NN_D(ABS_Z_N(int1_copy), ABS_Z_N(int2_copy)) == 1:
-        int2_copy, int1_copy = int1_copy, int2_copy
+    if COM_NN_D(ABS_Z_N(integer1), ABS_Z_N(integer2)) == 1:
+        integer2, integer1 = integer1, integer2
     
-    poz1 = POZ_Z_D(int1_copy)
-    poz2 = POZ_Z_D(int2_copy)
+    poz1 = POZ_Z_D(integer1)
+    poz2 = POZ_Z_D(integer2)
     if poz1 == poz2:
-        return Integer(int1_copy.sign, ADD_NN_N(ABS_Z_N(int1_copy), ABS_Z_N(int2_copy)))
+        return Integer(integer1.sign, ADD_NN_N(ABS_Z_N(integer1), ABS_Z_N(integer2)))
     elif poz2 == 0:
-        return int1_copy
+        return integer1
     else:
-        return Integer(int1_copy.sign, SUB_NN_N(ABS_Z_N(int1_copy), ABS_Z_N(int2_copy)))
+        return Integer(integer1.sign, SUB_NN_N(ABS_Z_N(integer1), ABS_Z_N(integer2)))
     
     
 def SUB_ZZ_Z(integer1: Integer, integer2: Integer) -> Integer:
@@ -142,19 +141,17 @@ def MUL_ZZ_Z(integer1: Integer, integer2: Integer) -> Integer:
         Integer: Произведение двух целых чисел.
     """
     
-    int1_copy = deepcopy(integer1)
-    int2_copy = deepcopy(integer2)
-    if COM_NN_D(ABS_Z_N(int1_copy), ABS_Z_N(int2_copy)) == 1:
-        int2_copy, int1_copy = int1_copy, int2_copy
+    if COM_NN_D(ABS_Z_N(integer1), ABS_Z_N(integer2)) == 1:
+        integer2, integer1 = integer1, integer2
     
-    poz1 = POZ_Z_D(int1_copy)
-    poz2 = POZ_Z_D(int2_copy)
+    poz1 = POZ_Z_D(integer1)
+    poz2 = POZ_Z_D(integer2)
     if poz2 == 0:
-        return int2_copy
+        return integer2
     elif poz1 == poz2:
-        return Integer(0, MUL_NN_N(ABS_Z_N(int1_copy), ABS_Z_N(int2_copy)))
+        return Integer(0, MUL_NN_N(ABS_Z_N(integer1), ABS_Z_N(integer2)))
     else:
-        return Integer(1, MUL_NN_N(ABS_Z_N(int1_copy), ABS_Z_N(int2_copy)))
+        return Integer(1, MUL_NN_N(ABS_Z_N(integer1), ABS_Z_N(integer2)))
     
     
 def DIV_ZZ_Z(integer1: Integer, integer2: Integer) -> Integer:
@@ -173,12 +170,37 @@ def DIV_ZZ_Z(integer1: Integer, integer2: Integer) -> Integer:
     if POZ_Z_D(result) == 0:
         return result
     if POZ_Z_D(integer1) != POZ_Z_D(integer2):
-        result = ADD_ZZ_Z(result, Integer(0, Natural(1, [1])))
+        result = ADD_ZZ_Z(result, INTEGER_ONE)
         result = MUL_ZM_Z(result)
     
     return result
 
     
+def DIVMOD_ZZ(integer1: Integer, integer2: Integer) -> Tuple[Integer, Integer]:
+    """
+    Деление с остатком двух целых чисел: частное и остаток вычисляются одним делением модулей.
+    Результат совпадает с DIV_ZZ_Z и MOD_ZZ_Z.
+    
+    Args:
+        integer1 (Integer): Первое целое число.
+        integer2 (Integer): Второе целое число.
+        
+    Returns:
+        Tuple[Integer, Integer]: Частное и остаток от целочисленного деления двух целых чисел.
+    """
+    
+    div, mod = DIVMOD_NN(ABS_Z_N(integer1), ABS_Z_N(integer2))
+    if not NZER_N_B(div):
+        return Integer(0, div), integer1
+    
+    if POZ_Z_D(integer1) == POZ_Z_D(integer2):
+        return Integer(0, div), Integer(integer1.sign if NZER_N_B(mod) else 0, mod)
+    
+    div = Integer(1, ADD_NN_N(div, NATURAL_ONE))
+    mod = SUB_NN_N(ABS_Z_N(integer2), mod)
+    return div, Integer(integer1.sign ^ 1, mod)
+
+    
 def MOD_ZZ_Z(integer1: Integer, integer2: Integer) -> Integer:
     """
     Деление с остатком двух целых чисел.
@@ -191,6 +213,56 @@ def MOD_ZZ_Z(integer1: Integer, integer2: Integer) -> Integer:
         Integer: Остаток от целочисленного деления двух целых чисел.
     """
     
-    div = DIV_ZZ_Z(integer1, integer2)
-    mul = MUL_ZZ_Z(div, integer2)
-    return SUB_ZZ_Z(integer1, mul)
\ No newline at end of file
+    return DIVMOD_ZZ(integer1, integer2)[1]
+
+
+def XGCF_NN_NZZ(nat1: Natural, nat2: Natural) -> Tuple[Natural, Integer, Integer]:
+    """
+    Расширенный алгоритм Евклида (Лемер / half-GCD): вычисление НОД и коэффициентов Безу u, v, для которых u*nat1 + v*nat2 = НОД.
+    
+    Args:
+        nat1 (Natural): Первое число.
+        nat2 (Natural): Второе число.
+        
+    Returns:
+        Tuple[Natural, Integer, Integer]: НОД и коэффициенты Безу u, v.
+    """
+    
+    gcf, u, v = XGCF_LL_L(TRANS_N_L(nat1), TRANS_N_L(nat2))
+    return TRANS_L_N(gcf), Integer(u[0], TRANS_L_N(u[1])), Integer(v[0], TRANS_L_N(v[1]))
+
+
+def POW_ZN_Z(integer: Integer, exponent: Natural) -> Integer:
+    """
+    Возведение целого числа в натуральную степень (0^0 = 1).
+    
+    Args:
+        integer (Integer): Целое число.
+        exponent (Natural): Показатель степени.
+        
+    Returns:
+        Integer: Степень числа.
+    """
+    
+    result = POW_NN_N(ABS_Z_N(integer), exponent)
+    sign = integer.sign if exponent.digits[-1] % 2 and NZER_N_B(result) else 0
+    return Integer(sign, result)
+
+
+def POWMOD_ZNN_N(integer: Integer, exponent: Natural, modulus: Natural) -> Natural:
+    """
+    Возведение целого числа в натуральную степень по модулю.
+    
+    Args:
+        integer (Integer): Целое число.
+        exponent (Natural): Показатель степени.
+        modulus (Natural): Модуль.
+        
+    Returns:
+        Natural: Неотрицательный остаток от деления степени числа на модуль.
+    """
+    
+    result = POWMOD_NNN_N(ABS_Z_N(integer), exponent, modulus)
+    if POZ_Z_D(integer) == 1 and exponent.digits[-1] % 2 and NZER_N_B(result):
+        result = SUB_NN_N(modulus, result)
+    return result
\ No newline at end of file
@@ -0,0 +1,968 @@
+from array import array
+from atexit import register
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing.shared_memory import SharedMemory
+from os import cpu_count
+from typing import List, Tuple
+
+from core.domain.entities.limb_natural import LIMB_BASE, LimbNatural
+
+# Арифметика над списками лимбов по основанию 10^9 (младший лимб первым) и над числами со знаком (знак, лимбы модуля).
+# Общее ядро limb_solver и content_solver: открытые функции модуля используются обоими решателями, остальные - только внутри.
+# Пороги переключения алгоритмов умножения (в лимбах), подобраны по замерам.
+KARATSUBA_CUTOFF = 48
+TOOM3_CUTOFF = 300
+KARATSUBA_SQR_CUTOFF = 64
+# Порог (в лимбах меньшего множителя), начиная с которого умножение выполняется через теоретико-числовое преобразование (NTT).
+NTT_CUTOFF = 1500
+
+# Простые числа вида c*2^k + 1 и их первообразные корни для NTT. Произведение простых (около 7.8*10^25)
+# превышает любой коэффициент свертки лимбов длины до 2^23, поэтому свертка восстанавливается по КТО точно.
+NTT_PRIMES = ((998244353, 3), (167772161, 3), (469762049, 3))
+NTT_MAX_LENGTH = 1 << 23
+# Порог (в лимбах меньшего множителя), начиная с которого умножение с parallel=True распределяется по процессам.
+PARALLEL_CUTOFF = 5000
+# Порог (в лимбах делителя), начиная с которого деление выполняется рекурсивно по Бурникелю-Циглеру.
+BURNIKEL_ZIEGLER_CUTOFF = 40
+# Порог (в лимбах), начиная с которого НОД вычисляется рекурсивным half-GCD, ниже - алгоритмом Лемера.
+HALF_GCD_CUTOFF = 500
+
+
+def normalize(limbs: List[int]) -> List[int]:
+    """
+    Удаление ведущих нулевых лимбов (ноль хранится как один нулевой лимб).
+    """
+
+    while len(limbs) > 1 and limbs[-1] == 0:
+        limbs.pop()
+    return limbs
+
+
+def pack(limbs: List[int]) -> LimbNatural:
+    """
+    Упаковка списка лимбов в LimbNatural.
+    """
+
+    normalize(limbs)
+    return LimbNatural(len(limbs), array('I', limbs))
+
+
+def limbs_to_str(limbs: List[int]) -> str:
+    """
+    Запись числа, заданного лимбами, в десятичном виде.
+    """
+
+    return str(limbs[-1]) + ''.join(f'{limb:09d}' for limb in reversed(limbs[:-1]))
+
+
+def com(a: List[int], b: List[int]) -> int:
+    """
+    Сравнение двух чисел, заданных лимбами. Возвращаемое значение совпадает с COM_NN_D.
+    """
+
+    if len(a) != len(b):
+        return 2 if len(a) > len(b) else 1
+    for i in range(len(a)-1, -1, -1):
+        if a[i] != b[i]:
+            return 2 if a[i] > b[i] else 1
+    return 0
+
+
+def add(a: List[int], b: List[int]) -> List[int]:
+    """
+    Сложение двух чисел, заданных лимбами.
+    """
+
+    if len(a) < len(b):
+        a, b = b, a
+
+    result = []
+    carry = 0
+    for i in range(len(b)):
+        cur = a[i] + b[i] + carry
+        if cur >= LIMB_BASE:
+            result.append(cur - LIMB_BASE)
+            carry = 1
+        else:
+            result.append(cur)
+            carry = 0
+
+    for i in range(len(b), len(a)):
+        cur = a[i] + carry
+        if cur >= LIMB_BASE:
+            result.append(cur - LIMB_BASE)
+            carry = 1
+        else:
+            result.append(cur)
+            carry = 0
+
+    if carry:
+        result.append(carry)
+    return result
+
+
+def sub(a: List[int], b: List[int]) -> List[int]:
+    """
+    Вычитание двух чисел, заданных лимбами. Первое число должно быть не меньше второго.
+    """
+
+    result = []
+    borrow = 0
+    for i in range(len(b)):
+        cur = a[i] - b[i] - borrow
+        if cur < 0:
+            result.append(cur + LIMB_BASE)
+            borrow = 1
+        else:
+            result.append(cur)
+            borrow = 0
+
+    for i in range(len(b), len(a)):
+        cur = a[i] - borrow
+        if cur < 0:
+            result.append(cur + LIMB_BASE)
+            borrow = 1
+        else:
+            result.append(cur)
+            borrow = 0
+
+    return normalize(result)
+
+
+def mul_digit(a: List[int], multiplier: int) -> List[int]:
+    """
+    Умножение числа, заданного лимбами, на один лимб.
+    """
+
+    if multiplier == 0:
+        return [0]
+
+    result = []
+    carry = 0
+    for limb in a:
+        carry, cur = divmod(limb * multiplier + carry, LIMB_BASE)
+        result.append(cur)
+    if carry:
+        result.append(carry)
+    return normalize(result)
+
+
+def _carry(columns: List[int]) -> List[int]:
+    """
+    Перенос переполнений в столбцах свертки, после которого каждый лимб меньше 10^9.
+    """
+
+    carry = 0
+    for i in range(len(columns)):
+        carry, columns[i] = divmod(columns[i] + carry, LIMB_BASE)
+    while carry:
+        carry, cur = divmod(carry, LIMB_BASE)
+        columns.append(cur)
+    return normalize(columns)
+
+
+def _mul_schoolbook(a: List[int], b: List[int]) -> List[int]:
+    """
+    Умножение двух чисел, заданных лимбами, столбиком.
+    Суммы в столбцах накапливаются без переносов, переносы выполняются один раз в конце.
+    """
+
+    columns = [0] * (len(a) + len(b))
+    for i, x in enumerate(a):
+        if x:
+            for j, y in enumerate(b, i):
+                columns[j] += x * y
+    return _carry(columns)
+
+
+def _sqr_schoolbook(a: List[int]) -> List[int]:
+    """
+    Возведение в квадрат числа, заданного лимбами, столбиком.
+    Используется симметрия: каждое попарное произведение a[i]*a[j] (i < j) вычисляется один раз и удваивается.
+    """
+
+    columns = [0] * (2 * len(a))
+    for i, x in enumerate(a):
+        if x:
+            columns[2*i] += x * x
+            x2 = 2 * x
+            for j in range(i+1, len(a)):
+                columns[i+j] += x2 * a[j]
+    return _carry(columns)
+
+
+def _add_into(acc: List[int], x: List[int], shift: int) -> None:
+    """
+    Прибавление к числу acc числа x, умноженного на 10^(9*shift). Число acc изменяется на месте.
+    """
+
+    need = shift + len(x) + 1
+    if len(acc) < need:
+        acc.extend([0] * (need - len(acc)))
+
+    carry = 0
+    i = shift
+    for limb in x:
+        cur = acc[i] + limb + carry
+        if cur >= LIMB_BASE:
+            acc[i] = cur - LIMB_BASE
+            carry = 1
+        else:
+            acc[i] = cur
+            carry = 0
+        i += 1
+
+    while carry:
+        if i == len(acc):
+            acc.append(0)
+        cur = acc[i] + carry
+        if cur >= LIMB_BASE:
+            acc[i] = cur - LIMB_BASE
+        else:
+            acc[i] = cur
+            carry = 0
+        i += 1
+
+
+def div_digit(a: List[int], divisor: int) -> Tuple[List[int], int]:
+    """
+    Деление числа, заданного лимбами, на один лимб. Возвращает частное и остаток.
+    """
+
+    quotient = [0] * len(a)
+    remainder = 0
+    for i in range(len(a)-1, -1, -1):
+        quotient[i], remainder = divmod(remainder * LIMB_BASE + a[i], divisor)
+    return normalize(quotient), remainder
+
+
+def sadd(x: Tuple[int, List[int]], y: Tuple[int, List[int]]) -> Tuple[int, List[int]]:
+    """
+    Сложение двух чисел со знаком. Число со знаком задается парой (знак, лимбы модуля), знак 0 - неотрицательное, 1 - отрицательное.
+    """
+
+    if x[0] == y[0]:
+        return x[0], add(x[1], y[1])
+
+    order = com(x[1], y[1])
+    if order == 0:
+        return 0, [0]
+    if order == 2:
+        return x[0], sub(x[1], y[1])
+    return y[0], sub(y[1], x[1])
+
+
+def ssub(x: Tuple[int, List[int]], y: Tuple[int, List[int]]) -> Tuple[int, List[int]]:
+    """
+    Вычитание двух чисел со знаком.
+    """
+
+    return sadd(x, (y[0] ^ 1 if y[1] != [0] else 0, y[1]))
+
+
+def smul(x: Tuple[int, List[int]], y: Tuple[int, List[int]], parallel: bool = False) -> Tuple[int, List[int]]:
+    """
+    Умножение двух чисел со знаком.
+    """
+
+    result = mul(x[1], y[1], parallel)
+    return (x[0] ^ y[0] if result != [0] else 0), result
+
+
+def _sdiv_digit(x: Tuple[int, List[int]], divisor: int) -> Tuple[int, List[int]]:
+    """
+    Точное деление числа со знаком на один лимб.
+    """
+
+    return x[0], div_digit(x[1], divisor)[0]
+
+
+def _split(a: List[int], start: int, end: int) -> List[int]:
+    """
+    Выделение лимбов числа с номерами [start, end) в отдельное нормализованное число.
+    """
+
+    part = a[start:end]
+    return normalize(part) if part else [0]
+
+
+def _mul_unbalanced(a: List[int], b: List[int]) -> List[int]:
+    """
+    Умножение длинного числа a на значительно более короткое b поблочно: a режется на блоки длины b.
+    """
+
+    result = [0]
+    step = len(b)
+    for start in range(0, len(a), step):
+        _add_into(result, mul(_split(a, start, start+step), b), start)
+    return normalize(result)
+
+
+def _mul_karatsuba(a: List[int], b: List[int]) -> List[int]:
+    """
+    Умножение двух чисел, заданных лимбами, алгоритмом Карацубы.
+    При a is b все три произведения вычисляются как квадраты.
+    """
+
+    m = (max(len(a), len(b)) + 1) // 2
+    a0, a1 = _split(a, 0, m), _split(a, m, len(a))
+    b0, b1 = (a0, a1) if a is b else (_split(b, 0, m), _split(b, m, len(b)))
+
+    a_sum = add(a0, a1)
+    b_sum = a_sum if a is b else add(b0, b1)
+
+    z0 = mul(a0, b0)
+    z2 = mul(a1, b1)
+    z1 = sub(sub(mul(a_sum, b_sum), z0), z2)
+
+    result = z0 + [0] * (2*m - len(z0)) + z2
+    _add_into(result, z1, m)
+    return normalize(result)
+
+
+def _mul_toom3(a: List[int], b: List[int]) -> List[int]:
+    """
+    Умножение двух чисел, заданных лимбами, алгоритмом Тоома-Кука (Toom-3).
+    Значения вычисляются в точках 0, 1, -1, -2, бесконечность, интерполяция по схеме Бодрато.
+    При a is b все пять произведений вычисляются как квадраты.
+    """
+
+    k = (max(len(a), len(b)) + 2) // 3
+    a0, a1, a2 = _split(a, 0, k), _split(a, k, 2*k), _split(a, 2*k, len(a))
+    if a is b:
+        b0, b1, b2 = a0, a1, a2
+    else:
+        b0, b1, b2 = _split(b, 0, k), _split(b, k, 2*k), _split(b, 2*k, len(b))
+
+    def evaluate(x0, x1, x2):
+        tmp = (0, add(x0, x2))
+        p1 = sadd(tmp, (0, x1))
+        pm1 = ssub(tmp, (0, x1))
+        pm2 = sadd(pm1, (0, x2))
+        pm2 = ssub((pm2[0], mul_digit(pm2[1], 2)), (0, x0))
+        return p1, pm1, pm2
+
+    p1, pm1, pm2 = evaluate(a0, a1, a2)
+    q1, qm1, qm2 = (p1, pm1, pm2) if a is b else evaluate(b0, b1, b2)
+
+    r0 = (0, mul(a0, b0))
+    r1 = smul(p1, q1)
+    rm1 = smul(pm1, qm1)
+    rm2 = smul(pm2, qm2)
+    rinf = (0, mul(a2, b2))
+
+    r3 = _sdiv_digit(ssub(rm2, r1), 3)
+    r1 = _sdiv_digit(ssub(r1, rm1), 2)
+    r2 = ssub(rm1, r0)
+    r3 = sadd(_sdiv_digit(ssub(r2, r3), 2), (0, mul_digit(rinf[1], 2)))
+    r2 = ssub(sadd(r2, r1), rinf)
+    r1 = ssub(r1, r3)
+
+    result = r0[1] + [0] * (4*k - len(r0[1])) + rinf[1]
+    _add_into(result, r1[1], k)
+    _add_into(result, r2[1], 2*k)
+    _add_into(result, r3[1], 3*k)
+    return normalize(result)
+
+
+_bit_reversal_cache = {}
+
+
+def _bit_reversal(n: int) -> List[int]:
+    """
+    Перестановка бит-реверса для преобразования длины n (степень двойки), кэшируется по длине.
+    """
+
+    if n not in _bit_reversal_cache:
+        bits = n.bit_length() - 1
+        _bit_reversal_cache[n] = [int(f'{i:0{bits}b}'[::-1], 2) if bits else 0 for i in range(n)]
+    return _bit_reversal_cache[n]
+
+
+def _ntt(a: List[int], prime: int, root: int, invert: bool) -> List[int]:
+    """
+    Итеративное теоретико-числовое преобразование (NTT) по простому модулю, длина a - степень двойки.
+    Бабочки каждого уровня выполняются срезами списка: поблочно на верхних уровнях и с шагом на нижних,
+    так что число итераций интерпретатора на уровень не превышает sqrt(n).
+    """
+
+    n = len(a)
+    a = [a[i] for i in _bit_reversal(n)]
+
+    half = 1
+    while half < n:
+        step = 2 * half
+        w = pow(root, (prime - 1) // step, prime)
+        if invert:
+            w = pow(w, prime - 2, prime)
+        twiddles = [1] * half
+        for k in range(1, half):
+            twiddles[k] = twiddles[k-1] * w % prime
+
+        if half < n // step:
+            for j in range(half):
+                tw = twiddles[j]
+                u = a[j::step]
+                v = [x * tw % prime for x in a[j+half::step]]
+                a[j::step] = [(x + y) % prime for x, y in zip(u, v)]
+                a[j+half::step] = [(x - y) % prime for x, y in zip(u, v)]
+        else:
+            for start in range(0, n, step):
+                u = a[start:start+half]
+                v = [x * tw % prime for x, tw in zip(a[start+half:start+step], twiddles)]
+                a[start:start+half] = [(x + y) % prime for x, y in zip(u, v)]
+                a[start+half:start+step] = [(x - y) % prime for x, y in zip(u, v)]
+        half = step
+
+    if invert:
+        n_inv = pow(n, prime - 2, prime)
+        a = [x * n_inv % prime for x in a]
+    return a
+
+
+def _ntt_residue(a: List[int], b: List[int], prime: int, root: int, size: int) -> List[int]:
+    """
+    Первые size коэффициентов свертки a и b по одному простому модулю NTT.
+    """
+
+    n = 1 << (size - 1).bit_length()
+    fa = _ntt(a + [0] * (n - len(a)), prime, root, False)
+    fb = fa if a is b else _ntt(b + [0] * (n - len(b)), prime, root, False)
+    return _ntt([x * y % prime for x, y in zip(fa, fb)], prime, root, True)[:size]
+
+
+def _garner(residues: List[List[int]]) -> List[int]:
+    """
+    Восстановление коэффициентов свертки по вычетам по трем простым NTT_PRIMES (схема Гарнера) и перенос в лимбы.
+    """
+
+    (p1, _), (p2, _), (p3, _) = NTT_PRIMES
+    p12 = p1 * p2
+    inv_p1 = pow(p1, p2 - 2, p2)
+    inv_p12 = pow(p12 % p3, p3 - 2, p3)
+
+    columns = []
+    for r1, r2, r3 in zip(*residues):
+        x = r1 + p1 * ((r2 - r1) * inv_p1 % p2)
+        columns.append(x + p12 * ((r3 - x) * inv_p12 % p3))
+    return _carry(columns)
+
+
+def _mul_ntt(a: List[int], b: List[int]) -> List[int]:
+    """
+    Умножение двух чисел, заданных лимбами, через свертку по трем простым модулям (NTT)
+    с восстановлением коэффициентов свертки по китайской теореме об остатках (схема Гарнера).
+    """
+
+    size = len(a) + len(b) - 1
+    return _garner([_ntt_residue(a, b, prime, root, size) for prime, root in NTT_PRIMES])
+
+
+def _read_limbs(memory: SharedMemory, start: int, count: int) -> List[int]:
+    """
+    Чтение count значений uint32 из разделяемой памяти, начиная с start-го.
+    """
+
+    values = array('I')
+    values.frombytes(memory.buf[4*start:4*(start+count)])
+    return values.tolist()
+
+
+def _ntt_residue_shared(name: str, len_a: int, len_b: int, index: int) -> None:
+    """
+    Задача рабочего процесса для _mul_parallel: операнды читаются из разделяемой памяти name
+    (лимбы a, затем лимбы b, по uint32), вычеты свертки по простому NTT_PRIMES[index] записываются туда же,
+    в index-й блок после операндов. Если len_b == 0, вычисляется квадрат a.
+    """
+
+    memory = SharedMemory(name)
+    try:
+        a = _read_limbs(memory, 0, len_a)
+        b = _read_limbs(memory, len_a, len_b) if len_b else a
+        size = len(a) + len(b) - 1
+        prime, root = NTT_PRIMES[index]
+        start = 4 * (len_a + len_b + index * size)
+        memory.buf[start:start + 4*size] = array('I', _ntt_residue(a, b, prime, root, size)).tobytes()
+    finally:
+        memory.close()
+
+
+_parallel_pool = None
+
+
+def _pool() -> ProcessPoolExecutor:
+    """
+    Общий пул процессов для параллельного умножения, создается при первом обращении: запуск процессов
+    на каждое умножение стоил бы дороже самого распараллеливания на не самых больших числах.
+    """
+
+    global _parallel_pool
+    if _parallel_pool is None:
+        _parallel_pool = ProcessPoolExecutor(max_workers=min(len(NTT_PRIMES), cpu_count() or 1))
+    return _parallel_pool
+
+
+def _shutdown_pool(wait: bool = True) -> None:
+    """
+    Остановка общего пула: при выходе из интерпретатора и после сбоя пула (следующее обращение создаст новый).
+    """
+
+    global _parallel_pool
+    if _parallel_pool is not None:
+        pool, _parallel_pool = _parallel_pool, None
+        pool.shutdown(wait=wait, cancel_futures=True)
+
+
+register(_shutdown_pool)
+
+
+def _mul_parallel(a: List[int], b: List[int]) -> List[int]:
+    """
+    Умножение через NTT, в котором свертки по трем простым модулям выполняются в пуле процессов одновременно.
+    Операнды и вычеты передаются через один блок разделяемой памяти, без сериализации списков лимбов;
+    восстановление по Гарнеру выполняется в текущем процессе. Если пул сломан (например, рабочий процесс
+    завершен системой из-за нехватки памяти), пул сбрасывается, а произведение вычисляется в текущем процессе.
+    """
+
+    square = a is b
+    len_b = 0 if square else len(b)
+    size = len(a) + len(b) - 1
+    residues = None
+    memory = SharedMemory(create=True, size=4 * (len(a) + len_b + len(NTT_PRIMES) * size))
+    try:
+        memory.buf[:4*len(a)] = array('I', a).tobytes()
+        if not square:
+            memory.buf[4*len(a):4*(len(a)+len_b)] = array('I', b).tobytes()
+        try:
+            tasks = [_pool().submit(_ntt_residue_shared, memory.name, len(a), len_b, i) for i in range(len(NTT_PRIMES))]
+            for task in tasks:
+                task.result()
+        except BrokenProcessPool:
+            _shutdown_pool(False)
+        else:
+            residues = [_read_limbs(memory, len(a) + len_b + i*size, size) for i in range(len(NTT_PRIMES))]
+    finally:
+        memory.close()
+        memory.unlink()
+    if residues is None:
+        return _mul_ntt(a, b)
+    return _garner(residues)
+
+
+def mul(a: List[int], b: List[int], parallel: bool = False) -> List[int]:
+    """
+    Умножение двух чисел, заданных лимбами, с выбором алгоритма по размеру операндов.
+    Если оба аргумента - один и тот же объект, выполняется возведение в квадрат.
+    При parallel=True числа от PARALLEL_CUTOFF лимбов на многоядерной машине умножаются через _mul_parallel.
+    """
+
+    if parallel and min(len(a), len(b)) >= PARALLEL_CUTOFF and len(a) + len(b) <= NTT_MAX_LENGTH and (cpu_count() or 1) > 1:
+        return _mul_parallel(a, b)
+    if a is b:
+        return sqr(a)
+    if len(a) < len(b):
+        a, b = b, a
+
+    if len(b) < KARATSUBA_CUTOFF:
+        return _mul_schoolbook(a, b)
+    if 2 * len(b) <= len(a):
+        return _mul_unbalanced(a, b)
+    if len(b) < TOOM3_CUTOFF:
+        return _mul_karatsuba(a, b)
+    if len(b) < NTT_CUTOFF or len(a) + len(b) > NTT_MAX_LENGTH:
+        return _mul_toom3(a, b)
+    return _mul_ntt(a, b)
+
+
+def _divmod_schoolbook(a: List[int], b: List[int]) -> Tuple[List[int], List[int]]:
+    """
+    Деление с остатком двух чисел, заданных лимбами, столбиком (алгоритм D Кнута).
+    Каждая цифра частного оценивается по двум старшим лимбам и уточняется не более чем двумя поправками.
+    """
+
+    if com(a, b) == 1:
+        return [0], list(a)
+    if len(b) == 1:
+        quotient, remainder = div_digit(a, b[0])
+        return quotient, [remainder]
+
+    norm = LIMB_BASE // (b[-1] + 1)
+    u = mul_digit(a, norm) if norm > 1 else list(a)
+    v = mul_digit(b, norm) if norm > 1 else list(b)
+    if len(u) == len(a):
+        u.append(0)
+
+    n = len(v)
+    m = len(u) - n
+    v_top = v[-1]
+    v_next = v[-2]
+    quotient = [0] * m
+
+    for j in range(m-1, -1, -1):
+        q_hat, r_hat = divmod(u[j+n] * LIMB_BASE + u[j+n-1], v_top)
+        while q_hat >= LIMB_BASE or q_hat * v_next > r_hat * LIMB_BASE + u[j+n-2]:
+            q_hat -= 1
+            r_hat += v_top
+            if r_hat >= LIMB_BASE:
+                break
+
+        borrow = 0
+        carry = 0
+        for i in range(n):
+            carry, low = divmod(q_hat * v[i] + carry, LIMB_BASE)
+            cur = u[i+j] - low - borrow
+            if cur < 0:
+                u[i+j] = cur + LIMB_BASE
+                borrow = 1
+            else:
+                u[i+j] = cur
+                borrow = 0
+        top = u[j+n] - carry - borrow
+
+        if top < 0:
+            q_hat -= 1
+            carry = 0
+            for i in range(n):
+                cur = u[i+j] + v[i] + carry
+                if cur >= LIMB_BASE:
+                    u[i+j] = cur - LIMB_BASE
+                    carry = 1
+                else:
+                    u[i+j] = cur
+                    carry = 0
+            top += carry
+        u[j+n] = top
+        quotient[j] = q_hat
+
+    remainder = normalize(u[:n])
+    if norm > 1:
+        remainder = div_digit(remainder, norm)[0]
+    return normalize(quotient), remainder
+
+
+def _shift(a: List[int], k: int) -> List[int]:
+    """
+    Умножение числа, заданного лимбами, на 10^(9k).
+    """
+
+    return [0] * k + a if a != [0] else [0]
+
+
+def _div3n2n(a12: List[int], a3: List[int], b: List[int], b1: List[int], b2: List[int], n: int) -> Tuple[List[int], List[int]]:
+    """
+    Шаг алгоритма Бурникеля-Циглера: деление числа из 3 блоков по n лимбов на число из 2 блоков.
+    """
+
+    if com(_split(a12, n, len(a12)), b1) == 0:
+        quotient = [LIMB_BASE - 1] * n
+        remainder = add(sub(a12, _shift(b1, n)), b1)
+    else:
+        quotient, remainder = _div2n1n(a12, b1, n)
+
+    remainder = ssub((0, add(_shift(remainder, n), a3)), (0, mul(quotient, b2)))
+    while remainder[0]:
+        quotient = sub(quotient, [1])
+        remainder = sadd(remainder, (0, b))
+    return quotient, remainder[1]
+
+
+def _div2n1n(a: List[int], b: List[int], n: int) -> Tuple[List[int], List[int]]:
+    """
+    Рекурсивное деление числа из 2n лимбов на нормализованное число из n лимбов (алгоритм Бурникеля-Циглера).
+    Частное должно помещаться в n лимбов.
+    """
+
+    if n < BURNIKEL_ZIEGLER_CUTOFF:
+        return _divmod_schoolbook(a, b)
+
+    pad = n % 2
+    if pad:
+        a = _shift(a, 1)
+        b = _shift(b, 1)
+        n += 1
+
+    half = n // 2
+    b1 = _split(b, half, len(b))
+    b2 = _split(b, 0, half)
+    q1, remainder = _div3n2n(_split(a, n, len(a)), _split(a, half, n), b, b1, b2, half)
+    q2, remainder = _div3n2n(remainder, _split(a, 0, half), b, b1, b2, half)
+
+    if pad:
+        remainder = _split(remainder, 1, len(remainder))
+    quotient = normalize(q2 + [0] * (half - len(q2)) + q1)
+    return quotient, remainder
+
+
+def divmod_limbs(a: List[int], b: List[int]) -> Tuple[List[int], List[int]]:
+    """
+    Деление с остатком двух чисел, заданных лимбами. Для длинных делителей используется алгоритм Бурникеля-Циглера,
+    для коротких - деление столбиком.
+    """
+
+    n = len(b)
+    if com(a, b) == 1:
+        return [0], list(a)
+    if n < BURNIKEL_ZIEGLER_CUTOFF or len(a) - n < BURNIKEL_ZIEGLER_CUTOFF:
+        return _divmod_schoolbook(a, b)
+
+    norm = LIMB_BASE // (b[-1] + 1)
+    a = mul_digit(a, norm)
+    b = mul_digit(b, norm)
+
+    blocks = [_split(a, start, start+n) for start in range(0, len(a), n)]
+    if com(blocks[-1], b) != 1:
+        blocks.append([0])
+
+    remainder = blocks.pop()
+    quotient = []
+    while blocks:
+        q_block, remainder = _div2n1n(add(_shift(remainder, n), blocks.pop()), b, n)
+        quotient = q_block + [0] * (n - len(q_block)) + quotient
+
+    if norm > 1:
+        remainder = div_digit(remainder, norm)[0]
+    return normalize(quotient), remainder
+
+
+def from_int(value: int) -> List[int]:
+    """
+    Разбиение неотрицательного машинного числа на лимбы.
+    """
+
+    limbs = []
+    while value:
+        value, limb = divmod(value, LIMB_BASE)
+        limbs.append(limb)
+    return limbs or [0]
+
+
+def _slincomb(p: Tuple[int, List[int]], q: Tuple[int, List[int]], x: int, y: int) -> Tuple[int, List[int]]:
+    """
+    Вычисление x*p + y*q для чисел со знаком p, q и машинных чисел x, y.
+    """
+
+    xp = mul_digit(p[1], abs(x))
+    yq = mul_digit(q[1], abs(y))
+    return sadd((p[0] ^ (x < 0) if xp != [0] else 0, xp), (q[0] ^ (y < 0) if yq != [0] else 0, yq))
+
+
+def _identity() -> List[List[Tuple[int, List[int]]]]:
+    """
+    Единичная матрица 2x2 из чисел со знаком.
+    """
+
+    return [[(0, [1]), (0, [0])], [(0, [0]), (0, [1])]]
+
+
+def _matmul(m2: List[List[Tuple[int, List[int]]]], m1: List[List[Tuple[int, List[int]]]]) -> List[List[Tuple[int, List[int]]]]:
+    """
+    Произведение матриц 2x2 из чисел со знаком.
+    """
+
+    return [[sadd(smul(m2[i][0], m1[0][j]), smul(m2[i][1], m1[1][j])) for j in range(2)] for i in range(2)]
+
+
+def _order(values: List[Tuple[int, List[int]]], matrix: List[List[Tuple[int, List[int]]]]) -> Tuple[List[List[Tuple[int, List[int]]]], List[int], List[int]]:
+    """
+    Приведение пары (a', b') = M (a, b) к виду a' >= b' >= 0: отрицательные значения заменяются модулями
+    со сменой знака строки матрицы, строки переставляются по убыванию значений.
+    НОД пары при этом не меняется, т.к. определитель матрицы остается равным ±1.
+    """
+
+    rows = []
+    for value, row in zip(values, matrix):
+        if value[0]:
+            row = [(c[0] ^ 1 if c[1] != [0] else 0, c[1]) for c in row]
+        rows.append((value[1], row))
+
+    if com(rows[0][0], rows[1][0]) == 1:
+        rows.reverse()
+    return [rows[0][1], rows[1][1]], rows[0][0], rows[1][0]
+
+
+def _apply(matrix: List[List[Tuple[int, List[int]]]], a: List[int], b: List[int]) -> Tuple[List[List[Tuple[int, List[int]]]], List[int], List[int]]:
+    """
+    Применение унимодулярной матрицы к паре чисел с последующим упорядочиванием (см. _order).
+    """
+
+    values = [sadd(smul(row[0], (0, a)), smul(row[1], (0, b))) for row in matrix]
+    return _order(values, matrix)
+
+
+def _lehmer(a: List[int], b: List[int]) -> Tuple[int, int, int, int]:
+    """
+    Шаг алгоритма Лемера: моделирование алгоритма Евклида на двух старших лимбах чисел a >= b машинными числами.
+    Возвращает матрицу (A, B, C, D), для которой a' = A*a + B*b, b' = C*a + D*b. При B = 0 ни один шаг не гарантирован.
+    """
+
+    n = len(a)
+    if n < 2:
+        return 1, 0, 0, 1
+
+    x = a[n-1] * LIMB_BASE + a[n-2]
+    y = (b[n-1] if len(b) >= n else 0) * LIMB_BASE + (b[n-2] if len(b) >= n-1 else 0)
+
+    A, B, C, D = 1, 0, 0, 1
+    while y + C != 0 and y + D != 0:
+        q = (x + A) // (y + C)
+        if q != (x + B) // (y + D):
+            break
+        A, C = C, A - q*C
+        B, D = D, B - q*D
+        x, y = y, x - q*y
+    return A, B, C, D
+
+
+def _gcd_step(a: List[int], b: List[int], matrix: List[List[Tuple[int, List[int]]]]) -> Tuple[List[List[Tuple[int, List[int]]]], List[int], List[int]]:
+    """
+    Один шаг сокращения пары a >= b > 0: шаг Лемера, если он удался, иначе шаг Евклида с полным делением.
+    Матрица преобразования (если передана) домножается на матрицу шага.
+    """
+
+    A, B, C, D = _lehmer(a, b)
+    if B:
+        values = [_slincomb((0, a), (0, b), A, B), _slincomb((0, a), (0, b), C, D)]
+        if matrix is None:
+            return None, values[0][1], values[1][1]
+        matrix = [[_slincomb(matrix[0][j], matrix[1][j], A, B) for j in range(2)],
+                  [_slincomb(matrix[0][j], matrix[1][j], C, D) for j in range(2)]]
+        return _order(values, matrix)
+
+    q, r = divmod_limbs(a, b)
+    if matrix is not None:
+        matrix = [matrix[1], [ssub(matrix[0][j], smul((0, q), matrix[1][j])) for j in range(2)]]
+    return matrix, b, r
+
+
+def _hgcd(a: List[int], b: List[int]) -> Tuple[List[List[Tuple[int, List[int]]]], List[int], List[int]]:
+    """
+    Half-GCD: сокращение пары a >= b до длины около половины длины a.
+    Матрица преобразования строится рекурсивно по старшим лимбам чисел и применяется к полным числам.
+    Возвращает матрицу M и пару (a', b') = M (a, b).
+    """
+
+    s = len(a) // 2 + 1
+    matrix = _identity()
+    if len(b) <= s:
+        return matrix, a, b
+
+    if len(a) >= HALF_GCD_CUTOFF:
+        step, a, b = _apply(_hgcd(a[s:], _split(b, s, len(b)))[0], a, b)
+        matrix = step
+
+        if len(b) > s:
+            matrix, a, b = _gcd_step(a, b, matrix)
+
+        if len(b) > s:
+            k = 2*s - len(a)
+            step, a, b = _apply(_hgcd(a[k:], _split(b, k, len(b)))[0], a, b)
+            matrix = _matmul(step, matrix)
+
+    while len(b) > s:
+        matrix, a, b = _gcd_step(a, b, matrix)
+    return matrix, a, b
+
+
+def gcd(a: List[int], b: List[int], extended: bool = False) -> Tuple[List[int], List[List[Tuple[int, List[int]]]]]:
+    """
+    НОД двух чисел, заданных лимбами: half-GCD для длинных чисел, алгоритм Лемера для коротких.
+    При extended=True дополнительно возвращается матрица M, первая строка которой содержит коэффициенты Безу.
+    """
+
+    swapped = com(a, b) == 1
+    if swapped:
+        a, b = b, a
+    matrix = _identity() if extended else None
+
+    while b != [0]:
+        if len(a) >= HALF_GCD_CUTOFF and len(b) > len(a) // 2 + 1:
+            step, a, b = _hgcd(a, b)
+            if extended:
+                matrix = _matmul(step, matrix)
+        else:
+            matrix, a, b = _gcd_step(a, b, matrix)
+
+    if extended and swapped:
+        matrix = [row[::-1] for row in matrix]
+    return a, matrix
+
+
+def sqr(a: List[int]) -> List[int]:
+    """
+    Возведение в квадрат числа, заданного лимбами, с выбором алгоритма по размеру.
+    """
+
+    if len(a) < KARATSUBA_SQR_CUTOFF:
+        return _sqr_schoolbook(a)
+    if len(a) < TOOM3_CUTOFF:
+        return _mul_karatsuba(a, a)
+    if len(a) < NTT_CUTOFF or 2 * len(a) > NTT_MAX_LENGTH:
+        return _mul_toom3(a, a)
+    return _mul_ntt(a, a)
+
+
+def _to_bits(a: List[int]) -> List[int]:
+    """
+    Двоичная запись числа, заданного лимбами, начиная с младшего бита.
+    """
+
+    bits = []
+    while a != [0]:
+        a, chunk = div_digit(a, 1 << 29)
+        bits.extend((chunk >> i) & 1 for i in range(29))
+    while len(bits) > 1 and bits[-1] == 0:
+        bits.pop()
+    return bits or [0]
+
+
+def pow_limbs(a: List[int], exponent: List[int]) -> List[int]:
+    """
+    Возведение в степень бинарным методом (слева направо): квадрат на каждый бит, умножение на основание на единичный бит.
+    """
+
+    result = [1]
+    for bit in reversed(_to_bits(exponent)):
+        result = sqr(result)
+        if bit:
+            result = mul(result, a)
+    return result
+
+
+def powmod_limbs(a: List[int], exponent: List[int], modulus: List[int]) -> List[int]:
+    """
+    Возведение в степень по модулю методом скользящего окна: заранее вычисляются нечетные степени основания,
+    показатель просматривается окнами до w бит, начинающимися и заканчивающимися единичным битом.
+    """
+
+    bits = _to_bits(exponent)
+    width = 1
+    for bound in (24, 80, 240, 672):
+        if len(bits) > bound:
+            width += 1
+
+    a = divmod_limbs(a, modulus)[1]
+    a_sqr = divmod_limbs(sqr(a), modulus)[1]
+    table = [a]
+    for _ in range((1 << (width - 1)) - 1):
+        table.append(divmod_limbs(mul(table[-1], a_sqr), modulus)[1])
+
+    result = divmod_limbs([1], modulus)[1]
+    i = len(bits) - 1
+    while i >= 0:
+        if bits[i] == 0:
+            result = divmod_limbs(sqr(result), modulus)[1]
+            i -= 1
+            continue
+
+        j = max(i - width + 1, 0)
+        while bits[j] == 0:
+            j += 1
+        window = 0
+        for k in range(i, j - 1, -1):
+            window = 2 * window + bits[k]
+            result = divmod_limbs(sqr(result), modulus)[1]
+        result = divmod_limbs(mul(result, table[window >> 1]), modulus)[1]
+        i = j - 1
+
+    return result
@@ -0,0 +1,301 @@
+from typing import Tuple
+
+from core.domain.entities.limb_natural import LIMB_BASE, LimbNatural
+from core.domain.entities.natural import Natural
+from core.domain.exceptions.numbers import FirstLessThanSecondException, IncorrectDegreeException, IncorrectDigitException
+from core.service.parsers.natural_parser import NaturalParser
+from core.service.solvers.limb_kernel import add, com, divmod_limbs, from_int, gcd, limbs_to_str, mul, mul_digit, pack, pow_limbs, powmod_limbs, sqr, sub
+
+
+def TRANS_N_L(nat: Natural) -> LimbNatural:
+    """
+    Преобразование натурального числа из поразрядной записи в запись по основанию 10^9.
+
+    Args:
+        nat (Natural): Натуральное число.
+
+    Returns:
+        LimbNatural: Число, записанное лимбами.
+    """
+
+    if nat.native is not None:
+        return pack(from_int(nat.native))
+    return NaturalParser.str_to_limb_nat(NaturalParser.nat_to_str(nat), False)
+
+
+def TRANS_L_N(limb_nat: LimbNatural) -> Natural:
+    """
+    Преобразование натурального числа из записи по основанию 10^9 в поразрядную запись.
+
+    Args:
+        limb_nat (LimbNatural): Число, записанное лимбами.
+
+    Returns:
+        Natural: Натуральное число.
+    """
+
+    if limb_nat.limb_count <= 2:
+        value = limb_nat.limbs[0] + (limb_nat.limbs[1] * LIMB_BASE if limb_nat.limb_count == 2 else 0)
+        digits = tuple(map(int, str(value)))
+        return Natural(len(digits), digits, value)
+    return NaturalParser.str_to_nat(NaturalParser.limb_nat_to_str(limb_nat), False)
+
+
+def COM_LL_D(limb_nat1: LimbNatural, limb_nat2: LimbNatural) -> int:
+    """
+    Сравнение 2 чисел, записанных лимбами.
+
+    Args:
+        limb_nat1 (LimbNatural): Первое число.
+        limb_nat2 (LimbNatural): Второе число.
+
+    Returns:
+        int: номер меньшего числа, 0 для равных чисел.
+    """
+
+    return com(limb_nat1.limbs, limb_nat2.limbs)
+
+
+def NZER_L_B(limb_nat: LimbNatural) -> bool:
+    """
+    Проверка, что число, записанное лимбами, не равно 0.
+
+    Args:
+        limb_nat (LimbNatural): Число.
+
+    Returns:
+        bool: неравенство числа 0.
+    """
+
+    return limb_nat.limb_count > 1 or limb_nat.limbs[0] != 0
+
+
+def ADD_LL_L(limb_nat1: LimbNatural, limb_nat2: LimbNatural) -> LimbNatural:
+    """
+    Сложение двух чисел, записанных лимбами.
+
+    Args:
+        limb_nat1 (LimbNatural): Первое число.
+        limb_nat2 (LimbNatural): Второе число.
+
+    Returns:
+        LimbNatural: Сумма двух чисел.
+    """
+
+    return pack(add(limb_nat1.limbs, limb_nat2.limbs))
+
+
+def SUB_LL_L(limb_nat1: LimbNatural, limb_nat2: LimbNatural) -> LimbNatural:
+    """
+    Вычитание из первого числа второго. Первое число должно быть не меньше второго.
+
+    Args:
+        limb_nat1 (LimbNatural): Первое число.
+        limb_nat2 (LimbNatural): Второе число.
+
+    Returns:
+        LimbNatural: Разность двух чисел.
+    """
+
+    if com(limb_nat1.limbs, limb_nat2.limbs) == 1:
+        raise FirstLessThanSecondException(limbs_to_str(limb_nat1.limbs), limbs_to_str(limb_nat2.limbs))
+
+    return pack(sub(limb_nat1.limbs, limb_nat2.limbs))
+
+
+def MUL_LD_L(limb_nat: LimbNatural, multiplier: int) -> LimbNatural:
+    """
+    Умножение числа на один лимб (цифру по основанию 10^9).
+
+    Args:
+        limb_nat (LimbNatural): Число.
+        multiplier (int): Лимб множитель.
+
+    Returns:
+        LimbNatural: Произведение числа и лимба.
+    """
+
+    if not 0 <= multiplier < LIMB_BASE:
+        raise IncorrectDigitException(multiplier)
+
+    return pack(mul_digit(limb_nat.limbs, multiplier))
+
+
+def MUL_Lk_L(limb_nat: LimbNatural, k: int) -> LimbNatural:
+    """
+    Умножение числа на неотрицательную степень 10^9.
+
+    Args:
+        limb_nat (LimbNatural): Число.
+        k (int): неотрицательная степень 10^9.
+
+    Returns:
+        LimbNatural: Произведение числа и 10^(9k).
+    """
+
+    if k < 0:
+        raise IncorrectDegreeException(k)
+
+    if not NZER_L_B(limb_nat):
+        return pack([0])
+    return pack([0] * k + list(limb_nat.limbs))
+
+
+def MUL_LL_L(limb_nat1: LimbNatural, limb_nat2: LimbNatural, parallel: bool = False) -> LimbNatural:
+    """
+    Умножение двух чисел, записанных лимбами. При parallel=True большие числа умножаются
+    через NTT, свертки по трем простым модулям которого выполняются в пуле процессов.
+
+    Args:
+        limb_nat1 (LimbNatural): Первое число.
+        limb_nat2 (LimbNatural): Второе число.
+        parallel (bool): Распределять ли умножение больших чисел по процессам.
+
+    Returns:
+        LimbNatural: Произведение двух чисел.
+    """
+
+    a = list(limb_nat1.limbs)
+    return pack(mul(a, a if limb_nat2 is limb_nat1 else list(limb_nat2.limbs), parallel))
+
+
+def DIV_LL_L(limb_nat1: LimbNatural, limb_nat2: LimbNatural) -> LimbNatural:
+    """
+    Целочисленное деление первого числа на второе.
+
+    Args:
+        limb_nat1 (LimbNatural): Первое число.
+        limb_nat2 (LimbNatural): Второе число.
+
+    Returns:
+        LimbNatural: Частное от целочисленного деления двух чисел.
+    """
+
+    if not NZER_L_B(limb_nat2):
+        raise ZeroDivisionError('Ошибка: Деление на 0 невозможно')
+
+    return pack(divmod_limbs(list(limb_nat1.limbs), list(limb_nat2.limbs))[0])
+
+
+def MOD_LL_L(limb_nat1: LimbNatural, limb_nat2: LimbNatural) -> LimbNatural:
+    """
+    Деление с остатком первого числа на второе.
+
+    Args:
+        limb_nat1 (LimbNatural): Первое число.
+        limb_nat2 (LimbNatural): Второе число.
+
+    Returns:
+        LimbNatural: Остаток от целочисленного деления двух чисел.
+    """
+
+    if not NZER_L_B(limb_nat2):
+        raise ZeroDivisionError('Ошибка: Деление на 0 невозможно')
+
+    return pack(divmod_limbs(list(limb_nat1.limbs), list(limb_nat2.limbs))[1])
+
+
+def DIVMOD_LL(limb_nat1: LimbNatural, limb_nat2: LimbNatural) -> Tuple[LimbNatural, LimbNatural]:
+    """
+    Деление с остатком первого числа на второе: частное и остаток вычисляются одним делением.
+
+    Args:
+        limb_nat1 (LimbNatural): Первое число.
+        limb_nat2 (LimbNatural): Второе число.
+
+    Returns:
+        Tuple[LimbNatural, LimbNatural]: Частное и остаток от целочисленного деления двух чисел.
+    """
+
+    if not NZER_L_B(limb_nat2):
+        raise ZeroDivisionError('Ошибка: Деление на 0 невозможно')
+
+    quotient, remainder = divmod_limbs(list(limb_nat1.limbs), list(limb_nat2.limbs))
+    return pack(quotient), pack(remainder)
+
+
+def GCF_LL_L(limb_nat1: LimbNatural, limb_nat2: LimbNatural) -> LimbNatural:
+    """
+    Вычисление НОД (наибольший общий делитель) алгоритмом Лемера, для длинных чисел - рекурсивным half-GCD.
+
+    Args:
+        limb_nat1 (LimbNatural): Первое число.
+        limb_nat2 (LimbNatural): Второе число.
+
+    Returns:
+        LimbNatural: НОД двух чисел.
+    """
+
+    if not NZER_L_B(limb_nat1) and not NZER_L_B(limb_nat2):
+        raise ZeroDivisionError('Ошибка: НОД для двух нулей неопределен.')
+
+    return pack(gcd(list(limb_nat1.limbs), list(limb_nat2.limbs))[0])
+
+
+def XGCF_LL_L(limb_nat1: LimbNatural, limb_nat2: LimbNatural) -> Tuple[LimbNatural, Tuple[int, LimbNatural], Tuple[int, LimbNatural]]:
+    """
+    Расширенный алгоритм Евклида: вычисление НОД и коэффициентов Безу u, v, для которых u*limb_nat1 + v*limb_nat2 = НОД.
+
+    Args:
+        limb_nat1 (LimbNatural): Первое число.
+        limb_nat2 (LimbNatural): Второе число.
+
+    Returns:
+        Tuple[LimbNatural, Tuple[int, LimbNatural], Tuple[int, LimbNatural]]: НОД и коэффициенты Безу в виде пар (знак, модуль),
+        знак 0 - неотрицательный, 1 - отрицательный.
+    """
+
+    if not NZER_L_B(limb_nat1) and not NZER_L_B(limb_nat2):
+        raise ZeroDivisionError('Ошибка: НОД для двух нулей неопределен.')
+
+    gcf, matrix = gcd(list(limb_nat1.limbs), list(limb_nat2.limbs), True)
+    u, v = matrix[0]
+    return pack(gcf), (u[0], pack(u[1])), (v[0], pack(v[1]))
+
+
+def SQR_L_L(limb_nat: LimbNatural) -> LimbNatural:
+    """
+    Возведение числа в квадрат. Попарные произведения разрядов вычисляются один раз за счет симметрии.
+
+    Args:
+        limb_nat (LimbNatural): Число.
+
+    Returns:
+        LimbNatural: Квадрат числа.
+    """
+
+    return pack(sqr(list(limb_nat.limbs)))
+
+
+def POW_LL_L(limb_nat: LimbNatural, exponent: LimbNatural) -> LimbNatural:
+    """
+    Возведение числа в натуральную степень (0^0 = 1).
+
+    Args:
+        limb_nat (LimbNatural): Основание.
+        exponent (LimbNatural): Показатель степени.
+
+    Returns:
+        LimbNatural: Степень числа.
+    """
+
+    return pack(pow_limbs(list(limb_nat.limbs), list(exponent.limbs)))
+
+
+def POWMOD_LLL_L(limb_nat: LimbNatural, exponent: LimbNatural, modulus: LimbNatural) -> LimbNatural:
+    """
+    Возведение числа в натуральную степень по модулю.
+
+    Args:
+        limb_nat (LimbNatural): Основание.
+        exponent (LimbNatural): Показатель степени.
+        modulus (LimbNatural): Модуль.
+
+    Returns:
+        LimbNatural: Остаток от деления степени числа на модуль.
+    """
+
+    if not NZER_L_B(modulus):
+        raise ZeroDivisionError('Ошибка: Деление на 0 невозможно')
+
+    return pack(powmod_limbs(list(limb_nat.limbs), list(exponent.limbs), list(modulus.limbs)))
\ No newline at end of file
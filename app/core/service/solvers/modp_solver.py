@@ -0,0 +1,417 @@
+from typing import Tuple
+
+import numpy as np
+
+from core.domain.entities.limb_natural import LIMB_BASE
+from core.domain.entities.natural import Natural
+from core.domain.entities.polynomial import Polynomial
+from core.domain.entities.polynomial_mod_p import PolynomialModP
+from core.domain.exceptions.numbers import DifferentModulusException, IncorrectModulusException
+from core.service.parsers.integer_parser import IntegerParser
+from core.service.solvers.rational_solver import TRANS_Z_Q
+from core.service.solvers.limb_solver import TRANS_N_L
+
+# Наибольший допустимый модуль (не включительно): произведение двух вычетов помещается в int64.
+MODULUS_LIMIT = 2 ** 31
+# Длина меньшего множителя, начиная с которой свертка вычисляется через БПФ, а не np.convolve.
+MODP_FFT_CUTOFF = 256
+# Наибольшая длина произведения для одного БПФ: при ней погрешность свертки 11-битных частей в float64 много меньше 1/2.
+# Более длинные произведения собираются из произведений блоков (см. _convolve_blocks).
+MODP_FFT_LIMIT = 2 ** 20
+# Степень частного, начиная с которой деление выполняется через обращение ряда Ньютоном.
+MODP_NEWTON_CUTOFF = 512
+
+_SPLIT_BITS = 11
+_SPLIT_MASK = (1 << _SPLIT_BITS) - 1
+
+
+def _check_modulus(modulus: int):
+    """
+    Проверка, что модуль - простое число меньше MODULUS_LIMIT (детерминированный тест Миллера-Рабина для чисел меньше 2^32).
+    """
+
+    if not 2 <= modulus < MODULUS_LIMIT:
+        raise IncorrectModulusException(modulus)
+    if modulus < 4:
+        return
+    d, s = modulus - 1, 0
+    while d % 2 == 0:
+        d, s = d // 2, s + 1
+    for a in (2, 7, 61):
+        if a % modulus == 0:
+            continue
+        x = pow(a, d, modulus)
+        if x in (1, modulus - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % modulus
+            if x == modulus - 1:
+                break
+        else:
+            raise IncorrectModulusException(modulus)
+
+
+def _check_same(fpolynom1: PolynomialModP, fpolynom2: PolynomialModP):
+    """
+    Проверка, что полиномы заданы по одному модулю.
+    """
+
+    if fpolynom1.modulus != fpolynom2.modulus:
+        raise DifferentModulusException(fpolynom1.modulus, fpolynom2.modulus)
+
+
+def _trim(a: np.ndarray) -> np.ndarray:
+    """
+    Отбрасывание нулевых старших коэффициентов; нулевой полином - массив из одного нуля.
+    """
+
+    nonzero = np.flatnonzero(a)
+    if nonzero.size == 0:
+        return np.zeros(1, dtype=np.int64)
+    return a[nonzero[0]:]
+
+
+def _build(modulus: int, a: np.ndarray) -> PolynomialModP:
+    """
+    Построение PolynomialModP по массиву вычетов: старшие нули отбрасываются, массив становится доступным только для чтения.
+    """
+
+    a = np.ascontiguousarray(_trim(a), dtype=np.int64)
+    a.setflags(write=False)
+    return PolynomialModP(modulus, len(a) - 1, a)
+
+
+def _pad(a: np.ndarray, length: int) -> np.ndarray:
+    """
+    Дополнение массива коэффициентов старшими нулями до заданной длины.
+    """
+
+    if len(a) == length:
+        return a
+    result = np.zeros(length, dtype=np.int64)
+    result[length-len(a):] = a
+    return result
+
+
+def _nat_mod(nat: Natural, modulus: int) -> int:
+    """
+    Вычет натурального числа по модулю: короткие числа берутся из машинного значения, длинные приводятся по лимбам схемой Горнера.
+    """
+
+    if nat.native is not None:
+        return nat.native % modulus
+    value = 0
+    for limb in reversed(TRANS_N_L(nat).limbs):
+        value = (value * LIMB_BASE + limb) % modulus
+    return value
+
+
+def _convolve_exact(a: np.ndarray, b: np.ndarray, modulus: int) -> np.ndarray:
+    """
+    Свертка вычетов по модулю через np.convolve без переполнения int64: множители делятся на 16-битные половины,
+    так что каждая частичная свертка меньше n * 2^32, и собираются тремя свертками по Карацубе.
+    """
+
+    a1, a0 = a >> 16, a & 0xFFFF
+    b1, b0 = b >> 16, b & 0xFFFF
+    high = np.convolve(a1, b1) % modulus
+    low = np.convolve(a0, b0) % modulus
+    middle = (np.convolve(a1 + a0, b1 + b0) - high - low) % modulus
+    shift = (1 << 16) % modulus
+    return ((high * shift % modulus + middle) % modulus * shift % modulus + low) % modulus
+
+
+def _convolve_fft(a: np.ndarray, b: np.ndarray, modulus: int) -> np.ndarray:
+    """
+    Свертка вычетов по модулю через вещественное БПФ: каждый вычет (до 31 бита) делится на три 11-битные части,
+    частичные свертки - суммы не более 3n произведений меньше 2^22 - вычисляются в float64 точно после округления
+    при длине произведения до MODP_FFT_LIMIT. Прямых преобразований шесть, обратных - пять (по одному на сумму индексов частей).
+    """
+
+    length = len(a) + len(b) - 1
+    size = 1 << (length - 1).bit_length()
+    fa = [np.fft.rfft((a >> (_SPLIT_BITS * i)) & _SPLIT_MASK, size) for i in range(3)]
+    fb = [np.fft.rfft((b >> (_SPLIT_BITS * i)) & _SPLIT_MASK, size) for i in range(3)]
+
+    result = np.zeros(length, dtype=np.int64)
+    shift = (1 << _SPLIT_BITS) % modulus
+    for s in range(4, -1, -1):
+        spectrum = sum(fa[i] * fb[s-i] for i in range(max(s - 2, 0), min(s, 2) + 1))
+        part = np.rint(np.fft.irfft(spectrum, size)[:length]).astype(np.int64) % modulus
+        result = (result * shift + part) % modulus
+    return result
+
+
+def _convolve_blocks(a: np.ndarray, b: np.ndarray, modulus: int) -> np.ndarray:
+    """
+    Свертка множителей, произведение которых длиннее MODP_FFT_LIMIT: множители делятся на блоки длины MODP_FFT_LIMIT/2,
+    произведения пар блоков (не длиннее MODP_FFT_LIMIT) вычисляются через _mul и складываются со сдвигом.
+    """
+
+    block = MODP_FFT_LIMIT // 2
+    result = np.zeros(len(a) + len(b) - 1, dtype=np.int64)
+    for i in range(0, len(a), block):
+        for j in range(0, len(b), block):
+            part = _mul(a[i:i+block], b[j:j+block], modulus)
+            result[i+j:i+j+len(part)] = (result[i+j:i+j+len(part)] + part) % modulus
+    return result
+
+
+def _mul(a: np.ndarray, b: np.ndarray, modulus: int) -> np.ndarray:
+    """
+    Произведение полиномов (массивов вычетов в любом, но одинаковом порядке коэффициентов) по модулю.
+    """
+
+    if min(len(a), len(b)) < MODP_FFT_CUTOFF:
+        return _convolve_exact(a, b, modulus)
+    if len(a) + len(b) - 1 > MODP_FFT_LIMIT:
+        return _convolve_blocks(a, b, modulus)
+    return _convolve_fft(a, b, modulus)
+
+
+def _inverse(f: np.ndarray, k: int, modulus: int) -> np.ndarray:
+    """
+    Обратный ряд к f (младший коэффициент первым, f[0] != 0) по модулю x^k итерацией Ньютона g <- g*(2 - f*g),
+    точность удваивается на каждом шаге.
+    """
+
+    g = np.array([pow(int(f[0]), modulus - 2, modulus)], dtype=np.int64)
+    precision = 1
+    while precision < k:
+        precision = min(2 * precision, k)
+        e = (-_mul(f[:precision], g, modulus)[:precision]) % modulus
+        e[0] = (e[0] + 2) % modulus
+        g = _mul(g, e, modulus)[:precision]
+    return g
+
+
+def _divmod_classic(a: np.ndarray, b: np.ndarray, modulus: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Деление столбиком: на каждом шаге из окна остатка вычитается делитель, умноженный на очередной коэффициент частного (векторно).
+    """
+
+    m = len(b) - 1
+    k = len(a) - m
+    inv = pow(int(b[0]), modulus - 2, modulus)
+    r = a.copy()
+    q = np.zeros(k, dtype=np.int64)
+    for i in range(k):
+        c = int(r[i]) * inv % modulus
+        if c:
+            q[i] = c
+            r[i:i+m+1] = (r[i:i+m+1] - c * b) % modulus
+    return q, r[k:]
+
+
+def _divmod_newton(a: np.ndarray, b: np.ndarray, modulus: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Быстрое деление через обращение ряда: массив коэффициентов, начиная со старшего, прочитанный с младшего -
+    это перевернутый полином, поэтому rev(q) = rev(a) * rev(b)^(-1) mod x^k вычисляется без перестановок,
+    а остаток - младшие deg b коэффициентов a - q*b.
+    """
+
+    m = len(b) - 1
+    k = len(a) - m
+    q = _mul(a[:k], _inverse(b, k, modulus), modulus)[:k]
+    r = (a[k:] - _mul(q, b, modulus)[k:]) % modulus
+    return q, r
+
+
+def _divmod(a: np.ndarray, b: np.ndarray, modulus: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Деление с остатком массивов вычетов (старший коэффициент первым, b без старших нулей).
+    """
+
+    if len(a) < len(b):
+        return np.zeros(1, dtype=np.int64), a
+    if len(b) == 1:
+        inv = pow(int(b[0]), modulus - 2, modulus)
+        return a * inv % modulus, np.zeros(1, dtype=np.int64)
+    if len(a) - len(b) + 1 >= MODP_NEWTON_CUTOFF:
+        return _divmod_newton(a, b, modulus)
+    return _divmod_classic(a, b, modulus)
+
+
+def TRANS_P_F(polynom: Polynomial, modulus: int) -> PolynomialModP:
+    """
+    Приведение полинома с рациональными коэффициентами по простому модулю: числитель и знаменатель каждого коэффициента
+    приводятся по модулю, коэффициент равен числителю, умноженному на обратный к знаменателю.
+
+    Args:
+        polynom (Polynomial): Полином.
+        modulus (int): Простой модуль p < 2^31.
+
+    Returns:
+        PolynomialModP: Полином над полем вычетов.
+    """
+
+    _check_modulus(modulus)
+    coefficients = np.zeros(polynom.polynom_degree + 1, dtype=np.int64)
+    for i, coef in enumerate(polynom.coefficients):
+        numerator = _nat_mod(coef.numerator.number, modulus)
+        if numerator == 0:
+            continue
+        denominator = _nat_mod(coef.denominator, modulus)
+        if denominator == 0:
+            raise ZeroDivisionError('Ошибка: Знаменатель кратен модулю')
+        if coef.numerator.sign:
+            numerator = modulus - numerator
+        coefficients[i] = numerator * pow(denominator, modulus - 2, modulus) % modulus
+    return _build(modulus, coefficients)
+
+
+def TRANS_F_P(fpolynom: PolynomialModP) -> Polynomial:
+    """
+    Преобразование полинома над полем вычетов в полином с целыми коэффициентами от 0 до p-1.
+
+    Args:
+        fpolynom (PolynomialModP): Полином над полем вычетов.
+
+    Returns:
+        Polynomial: Полином.
+    """
+
+    return Polynomial(fpolynom.polynom_degree, tuple(TRANS_Z_Q(IntegerParser.str_to_int(str(c), False)) for c in fpolynom.coefficients.tolist()))
+
+
+def ADD_FF_F(fpolynom1: PolynomialModP, fpolynom2: PolynomialModP) -> PolynomialModP:
+    """
+    Сложение полиномов над полем вычетов.
+
+    Args:
+        fpolynom1 (PolynomialModP): Первый полином.
+        fpolynom2 (PolynomialModP): Второй полином.
+
+    Returns:
+        PolynomialModP: Сумма полиномов.
+    """
+
+    _check_same(fpolynom1, fpolynom2)
+    length = max(len(fpolynom1.coefficients), len(fpolynom2.coefficients))
+    result = _pad(fpolynom1.coefficients, length) + _pad(fpolynom2.coefficients, length)
+    return _build(fpolynom1.modulus, result % fpolynom1.modulus)
+
+
+def SUB_FF_F(fpolynom1: PolynomialModP, fpolynom2: PolynomialModP) -> PolynomialModP:
+    """
+    Вычитание полиномов над полем вычетов.
+
+    Args:
+        fpolynom1 (PolynomialModP): Первый полином.
+        fpolynom2 (PolynomialModP): Второй полином.
+
+    Returns:
+        PolynomialModP: Разность полиномов.
+    """
+
+    _check_same(fpolynom1, fpolynom2)
+    length = max(len(fpolynom1.coefficients), len(fpolynom2.coefficients))
+    result = _pad(fpolynom1.coefficients, length) - _pad(fpolynom2.coefficients, length)
+    return _build(fpolynom1.modulus, result % fpolynom1.modulus)
+
+
+def MUL_FN_F(fpolynom: PolynomialModP, scalar: int) -> PolynomialModP:
+    """
+    Умножение полинома над полем вычетов на число (приводится по модулю).
+
+    Args:
+        fpolynom (PolynomialModP): Полином.
+        scalar (int): Множитель.
+
+    Returns:
+        PolynomialModP: Произведение полинома на число.
+    """
+
+    return _build(fpolynom.modulus, fpolynom.coefficients * (scalar % fpolynom.modulus) % fpolynom.modulus)
+
+
+def MUL_FF_F(fpolynom1: PolynomialModP, fpolynom2: PolynomialModP) -> PolynomialModP:
+    """
+    Умножение полиномов над полем вычетов сверткой: короткие множители - np.convolve по 16-битным половинам вычетов,
+    длинные - вещественное БПФ по 11-битным частям, произведения длиннее MODP_FFT_LIMIT - по блокам.
+
+    Args:
+        fpolynom1 (PolynomialModP): Первый полином.
+        fpolynom2 (PolynomialModP): Второй полином.
+
+    Returns:
+        PolynomialModP: Произведение полиномов.
+    """
+
+    _check_same(fpolynom1, fpolynom2)
+    return _build(fpolynom1.modulus, _mul(fpolynom1.coefficients, fpolynom2.coefficients, fpolynom1.modulus))
+
+
+def DIVMOD_FF(fpolynom1: PolynomialModP, fpolynom2: PolynomialModP) -> Tuple[PolynomialModP, PolynomialModP]:
+    """
+    Деление полиномов над полем вычетов с остатком. При степени частного не меньше MODP_NEWTON_CUTOFF частное
+    вычисляется через обращение перевернутого делителя итерацией Ньютона (несколько быстрых умножений),
+    иначе - делением столбиком.
+
+    Args:
+        fpolynom1 (PolynomialModP): Делимое.
+        fpolynom2 (PolynomialModP): Делитель.
+
+    Returns:
+        Tuple[PolynomialModP, PolynomialModP]: Частное и остаток.
+    """
+
+    _check_same(fpolynom1, fpolynom2)
+    if fpolynom2.coefficients[0] == 0:
+        raise ZeroDivisionError('Ошибка: Деление на 0 невозможно')
+
+    q, r = _divmod(fpolynom1.coefficients, fpolynom2.coefficients, fpolynom1.modulus)
+    return _build(fpolynom1.modulus, q), _build(fpolynom1.modulus, r)
+
+
+def DIV_FF_F(fpolynom1: PolynomialModP, fpolynom2: PolynomialModP) -> PolynomialModP:
+    """
+    Частное от деления полиномов над полем вычетов.
+
+    Args:
+        fpolynom1 (PolynomialModP): Делимое.
+        fpolynom2 (PolynomialModP): Делитель.
+
+    Returns:
+        PolynomialModP: Частное.
+    """
+
+    return DIVMOD_FF(fpolynom1, fpolynom2)[0]
+
+
+def MOD_FF_F(fpolynom1: PolynomialModP, fpolynom2: PolynomialModP) -> PolynomialModP:
+    """
+    Остаток от деления полиномов над полем вычетов.
+
+    Args:
+        fpolynom1 (PolynomialModP): Делимое.
+        fpolynom2 (PolynomialModP): Делитель.
+
+    Returns:
+        PolynomialModP: Остаток.
+    """
+
+    return DIVMOD_FF(fpolynom1, fpolynom2)[1]
+
+
+def GCF_FF_F(fpolynom1: PolynomialModP, fpolynom2: PolynomialModP) -> PolynomialModP:
+    """
+    НОД полиномов над полем вычетов алгоритмом Евклида, нормированный к старшему коэффициенту 1
+    (НОД двух нулевых полиномов - нулевой полином).
+
+    Args:
+        fpolynom1 (PolynomialModP): Первый полином.
+        fpolynom2 (PolynomialModP): Второй полином.
+
+    Returns:
+        PolynomialModP: НОД полиномов.
+    """
+
+    _check_same(fpolynom1, fpolynom2)
+    modulus = fpolynom1.modulus
+    a, b = fpolynom1.coefficients, fpolynom2.coefficients
+    while b[0] != 0:
+        a, b = b, _trim(_divmod(a, b, modulus)[1])
+    if a[0] == 0:
+        return _build(modulus, a)
+    return _build(modulus, a * pow(int(a[0]), modulus - 2, modulus) % modulus)
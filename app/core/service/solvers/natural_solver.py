@@ -1,8 +1,31 @@
-from copy import deepcopy
+from math import gcd
+from typing import Tuple
 
-from core.domain.entities.natural import Natural
+from core.domain.entities.constants import NATURAL_ONE, NATURAL_TEN, NATURAL_ZERO
+from core.domain.entities.natural import SMALL_DIGIT_COUNT, Natural
 from core.domain.exceptions.numbers import FirstLessThanSecondException, IncorrectDegreeException, IncorrectDigitException
 from core.service.parsers.natural_parser import NaturalParser
+from core.service.solvers.limb_solver import DIV_LL_L, DIVMOD_LL, GCF_LL_L, MUL_LL_L, POW_LL_L, POWMOD_LLL_L, TRANS_L_N, TRANS_N_L
+
+_INTERNED = {0: NATURAL_ZERO, 1: NATURAL_ONE, 10: NATURAL_TEN}
+
+
+def from_native(value: int) -> Natural:
+    """
+    Построение натурального числа по машинному целому. Для 0, 1 и 10 возвращаются общие экземпляры,
+    число длиннее SMALL_DIGIT_COUNT разрядов хранится только поразрядно.
+
+    Args:
+        value (int): Неотрицательное целое.
+
+    Returns:
+        Natural: Натуральное число.
+    """
+    
+    if value in _INTERNED:
+        return _INTERNED[value]
+    digits = tuple(map(int, str(value)))
+    return Natural(len(digits), digits, value if len(digits) <= SMALL_DIGIT_COUNT else None)
 
 
 def COM_NN_D(nat1: Natural, nat2: Natural) -> int:
@@ -17,6 +40,9 @@ def COM_NN_D(nat1: Natural, nat2: Natural) -> int:
         int: номер меньшего числа, 0 для равных чисел.
     """
     
+    if nat1.native is not None and nat2.native is not None:
+        return 2 if nat1.native > nat2.native else 1 if nat1.native < nat2.native else 0
+    
     if nat1.digit_count > nat2.digit_count:
         return 2
     elif nat1.digit_count < nat2.digit_count:
@@ -54,21 +80,24 @@ def ADD_1N_N(nat: Natural) -> Natural:
     Returns:
         Natural: Число, увеличенное на единицу.
     """
-    result = deepcopy(nat)
     
-    i = result.digit_count - 1
+    if nat.native is not None:
+        return from_native(nat.native + 1)
+    
+    digits = list(nat.digits)
+    
+    i = nat.digit_count - 1
     
-    while i > 0 and result.digits[i] == 9:
-        result.digits[i] = 0
+    while i > 0 and digits[i] == 9:
+        digits[i] = 0
         i -= 1
     
-    result.digits[i] += 1
-    if result.digits[0] == 10:
-        result.digits[0] = 0
-        result.digits.insert(0, 1)
-        result.digit_count += 1
+    digits[i] += 1
+    if digits[0] == 10:
+        digits[0] = 0
+        digits.insert(0, 1)
     
-    return result
+    return Natural(len(digits), tuple(digits))
 
 
 def ADD_NN_N(nat1: Natural, nat2: Natural) -> Natural:
@@ -83,31 +112,33 @@ def ADD_NN_N(nat1: Natural, nat2: Natural) -> Natural:
         Natural: Сумма двух чисел.
     """
     
-    result = deepcopy(nat1)
-    nat2_copy = deepcopy(nat2)
+    if nat1.native is not None and nat2.native is not None:
+        return from_native(nat1.native + nat2.native)
     
-    if COM_NN_D(result, nat2_copy) < 2:
-        result, nat2_copy = nat2_copy, result
+    if COM_NN_D(nat1, nat2) < 2:
+        nat1, nat2 = nat2, nat1
     
-    if NZER_N_B(nat2):
-        remain = 0
-        for i in range(nat2_copy.digit_count):
-            result.digits[-i-1] += nat2_copy.digits[-i-1] + remain
-            remain = result.digits[-i-1] // 10
-            result.digits[-i-1] %= 10
-            
-        cur_digit = result.digit_count - nat2_copy.digit_count - 1
-        while remain and cur_digit >= 0:
-            result.digits[cur_digit] += remain
-            remain = result.digits[cur_digit] // 10
-            result.digits[cur_digit] %= 10
-            cur_digit -= 1
-            
-        if remain:
-            result.digit_count += 1
-            result.digits.insert(0, remain)
+    if not NZER_N_B(nat2):
+        return nat1
+    
+    digits = list(nat1.digits)
+    remain = 0
+    for i in range(nat2.digit_count):
+        digits[-i-1] += nat2.digits[-i-1] + remain
+        remain = digits[-i-1] // 10
+        digits[-i-1] %= 10
+        
+    cur_digit = nat1.digit_count - nat2.digit_count - 1
+    while remain and cur_digit >= 0:
+        digits[cur_digit] += remain
+        remain = digits[cur_digit] // 10
+        digits[cur_digit] %= 10
+        cur_digit -= 1
+        
+    if remain:
+        digits.insert(0, remain)
     
-    return result
+    return Natural(len(digits), tuple(digits))
 
 
 def SUB_NN_N(nat1: Natural, nat2: Natural) -> Natural:
@@ -127,27 +158,31 @@ def SUB_NN_N(nat1: Natural, nat2: Natural) -> Natural:
     if comm_nn_d == 1:
         raise FirstLessThanSecondException(NaturalParser.nat_to_str(nat1), NaturalParser.nat_to_str(nat2))
     elif comm_nn_d == 0:
-        return NaturalParser.str_to_nat('0')
+        return NATURAL_ZERO
     
-    result = deepcopy(nat1)
-    if NZER_N_B(nat2):
-        zero_count = -1
-        
-        for i in range(1, result.digit_count+1):
-            if i < nat2.digit_count+1:
-                result.digits[-i] -= nat2.digits[-i]
-                
-            if result.digits[-i] < 0:
-                result.digits[-i] += 10
-                result.digits[-i-1] -= 1
-            
-            zero_count = max(result.digit_count-i+1, zero_count) if result.digits[-i] == 0 else -1
-            
-        if zero_count != -1:
-            result.digit_count -= zero_count
-            result.digits = result.digits[zero_count::]
+    if nat1.native is not None:
+        return from_native(nat1.native - nat2.native)
+    
+    if not NZER_N_B(nat2):
+        return nat1
+    
+    digits = list(nat1.digits)
+    zero_count = -1
+    
+    for i in range(1, nat1.digit_count+1):
+        if i < nat2.digit_count+1:
+            digits[-i] -= nat2.digits[-i]
             
-    return result
+        if digits[-i] < 0:
+            digits[-i] += 10
+            digits[-i-1] -= 1
+        
+        zero_count = max(nat1.digit_count-i+1, zero_count) if digits[-i] == 0 else -1
+        
+    if zero_count != -1:
+        digits = digits[zero_count::]
+        
+    return Natural(len(digits), tuple(digits))
 
 
 def MUL_ND_N(nat: Natural, multiplier: int) -> Natural:
@@ -163,20 +198,22 @@ def MUL_ND_N(nat: Natural, multiplier: int) -> Natural:
     """
     
     if multiplier == 0 or not NZER_N_B(nat):
-        return NaturalParser.str_to_nat('0')
+        return NATURAL_ZERO
     elif 10 > multiplier > 0:
-        result = deepcopy(nat)
+        if nat.native is not None:
+            return from_native(nat.native * multiplier)
+        
+        digits = list(nat.digits)
         overflow = 0
         
-        for i in range(result.digit_count):
-            result.digits[-i-1] = result.digits[-i-1] * multiplier + overflow
-            result.digits[-i-1], overflow = result.digits[-i-1] % 10, result.digits[-i-1] // 10
+        for i in range(nat.digit_count):
+            digits[-i-1] = digits[-i-1] * multiplier + overflow
+            digits[-i-1], overflow = digits[-i-1] % 10, digits[-i-1] // 10
             
         if overflow:
-            result.digit_count += 1
-            result.digits.insert(0, overflow)
+            digits.insert(0, overflow)
             
-        return result
+        return Natural(len(digits), tuple(digits))
     else:
         raise IncorrectDigitException(multiplier)
     
@@ -196,42 +233,32 @@ def MUL_Nk_N (nat: Natural, k: int) -> Natural:
     if k < 0:
         raise IncorrectDegreeException(k)
     
-    result = deepcopy(nat)
-    if NZER_N_B(result):
-        result.digit_count += k
-        result.digits.extend([0 for _ in range(k)])
+    if not NZER_N_B(nat) or k == 0:
+        return nat
         
-    return result
+    return Natural(nat.digit_count + k, nat.digits + (0,) * k)
 
 
-def MUL_NN_N(nat1: Natural, nat2: Natural) -> Natural:
+def MUL_NN_N(nat1: Natural, nat2: Natural, parallel: bool = False) -> Natural:
     """
-    Умножение двух натуральных чисел.
+    Умножение двух натуральных чисел. Вычисляется в записи по основанию 10^9 алгоритмами столбика, Карацубы или Тоома-Кука в зависимости от длины чисел.
+    При parallel=True числа от PARALLEL_CUTOFF лимбов умножаются через NTT с вычислением сверток в пуле процессов.
     
     Args:
         nat1 (Natural): Первое число.
         nat2 (Natural): Второе число.
+        parallel (bool): Распределять ли умножение больших чисел по процессам.
     
     Returns:
         Natural: Произведение двух чисел.
     """
     
-    nat1_copy = deepcopy(nat1)
-    nat2_copy = deepcopy(nat2)
+    if nat1.native is not None and nat2.native is not None:
+        return from_native(nat1.native * nat2.native)
     
-    if COM_NN_D(nat1_copy, nat2_copy) < 2:
-        nat1_copy, nat2_copy = nat2_copy, nat1_copy
-        
-    if not NZER_N_B(nat2_copy):
-        return nat2_copy
-    
-    result = NaturalParser.str_to_nat('0')
-    for i in range(nat2_copy.digit_count):
-        tmp = MUL_ND_N(nat1_copy, nat2_copy.digits[nat2_copy.digit_count-i-1])
-        tmp = MUL_Nk_N(tmp, i)
-        result = ADD_NN_N(result, tmp)
-    
-    return result
+    limb_nat1 = TRANS_N_L(nat1)
+    limb_nat2 = limb_nat1 if nat2 is nat1 else TRANS_N_L(nat2)
+    return TRANS_L_N(MUL_LL_L(limb_nat1, limb_nat2, parallel))
 
 
 def SUB_NDN_N(nat1: Natural, nat2: Natural, multiplier: int) -> Natural:
@@ -266,31 +293,23 @@ def DIV_NN_Dk(nat1: Natural, nat2: Natural) -> Natural:
     if not NZER_N_B(nat2):
         raise ZeroDivisionError('Ошибка: Деление на 0 невозможно')
     
-    result = NaturalParser.str_to_nat('0')
-    deg = 0
-    tmp = nat2
-    while COM_NN_D(nat1, tmp) != 1:
-        deg += 1
-        tmp = MUL_Nk_N(tmp, 1)
-        
-    if deg:
-        if COM_NN_D(nat1, tmp) == 1:
-            deg -= 1
-            tmp.digit_count -= 1
-            tmp.digits.pop()
-            
-        sub = deepcopy(nat1)
-        while COM_NN_D(sub, tmp) != 1:
-            sub = SUB_NN_N(sub, tmp)
-            result = ADD_1N_N(result)
-        result = MUL_Nk_N(result, deg)
-        
-    return result
+    deg = nat1.digit_count - nat2.digit_count
+    if deg < 0 or deg == 0 and COM_NN_D(nat1, nat2) == 1:
+        return NATURAL_ZERO
+    
+    shifted = MUL_Nk_N(nat2, deg)
+    if COM_NN_D(nat1, shifted) == 1:
+        deg -= 1
+        shifted = MUL_Nk_N(nat2, deg)
+    
+    digit = DIV_LL_L(TRANS_N_L(nat1), TRANS_N_L(shifted)).limbs[0]
+    return MUL_Nk_N(Natural(1, (digit,)), deg)
 
 
 def DIV_NN_N(nat1: Natural, nat2: Natural) -> Natural:
     """
-    Целочисленное деление первого числа на второе.
+    Целочисленное деление первого числа на второе. Выполняется за один проход делением столбиком по основанию 10^9,
+    для длинных делителей - рекурсивным алгоритмом Бурникеля-Циглера.
     
     Args:
         nat1 (Natural): Первое число.
@@ -300,14 +319,36 @@ def DIV_NN_N(nat1: Natural, nat2: Natural) -> Natural:
         Natural: Частное от целочисленного деления двух чисел.
     """
     
-    result = NaturalParser.str_to_nat('0')
-    nat1_copy = deepcopy(nat1)
-    while COM_NN_D(nat1_copy, nat2) != 1:
-        tmp = DIV_NN_Dk(nat1_copy, nat2)
-        nat1_copy = SUB_NN_N(nat1_copy, MUL_NN_N(tmp, nat2))
-        result = ADD_NN_N(result, tmp)
+    if not NZER_N_B(nat2):
+        raise ZeroDivisionError('Ошибка: Деление на 0 невозможно')
+    
+    if nat1.native is not None and nat2.native is not None:
+        return from_native(nat1.native // nat2.native)
+    
+    return TRANS_L_N(DIV_LL_L(TRANS_N_L(nat1), TRANS_N_L(nat2)))
+
+
+def DIVMOD_NN(nat1: Natural, nat2: Natural) -> Tuple[Natural, Natural]:
+    """
+    Деление с остатком первого числа на второе: частное и остаток вычисляются одним делением.
+    
+    Args:
+        nat1 (Natural): Первое число.
+        nat2 (Natural): Второе число.
+    
+    Returns:
+        Tuple[Natural, Natural]: Частное и остаток от целочисленного деления двух чисел.
+    """
+    
+    if not NZER_N_B(nat2):
+        raise ZeroDivisionError('Ошибка: Деление на 0 невозможно')
+    
+    if nat1.native is not None and nat2.native is not None:
+        quotient, remainder = divmod(nat1.native, nat2.native)
+        return from_native(quotient), from_native(remainder)
     
-    return result
+    quotient, remainder = DIVMOD_LL(TRANS_N_L(nat1), TRANS_N_L(nat2))
+    return TRANS_L_N(quotient), TRANS_L_N(remainder)
 
 
 def MOD_NN_N(nat1: Natural, nat2: Natural) -> Natural:
@@ -322,14 +363,12 @@ def MOD_NN_N(nat1: Natural, nat2: Natural) -> Natural:
         Natural: Остаток от целочисленного деления двух чисел.
     """
     
-    div = DIV_NN_N(nat1, nat2)
-    mul = MUL_NN_N(div, nat2)
-    return SUB_NN_N(nat1, mul)
+    return DIVMOD_NN(nat1, nat2)[1]
 
 
 def GCF_NN_N(nat1: Natural, nat2: Natural) -> Natural:
     """
-    Вычисление НОД (наибольший общий делитель) через алгоритм Евклида.
+    Вычисление НОД (наибольший общий делитель) алгоритмом Лемера, для длинных чисел - рекурсивным half-GCD.
     
     Args:
         nat1 (Natural): Первое число.
@@ -342,16 +381,10 @@ def GCF_NN_N(nat1: Natural, nat2: Natural) -> Natural:
     if not NZER_N_B(nat1) and not NZER_N_B(nat2):
         raise ZeroDivisionError('Ошибка: НОД для двух нулей неопределен.')
     
-    nat1_copy = deepcopy(nat1)
-    nat2_copy = deepcopy(nat2)
-    
-    while NZER_N_B(nat1_copy) and NZER_N_B(nat2_copy):
-        if COM_NN_D(nat1_copy, nat2_copy) == 2:
-            nat1_copy = MOD_NN_N(nat1_copy, nat2_copy)
-        else:
-            nat2_copy = MOD_NN_N(nat2_copy, nat1_copy)
+    if nat1.native is not None and nat2.native is not None:
+        return from_native(gcd(nat1.native, nat2.native))
     
-    return ADD_NN_N(nat1_copy, nat2_copy)
+    return TRANS_L_N(GCF_LL_L(TRANS_N_L(nat1), TRANS_N_L(nat2)))
 
 
 def LCM_NN_N(nat1: Natural, nat2: Natural) -> Natural:
@@ -370,6 +403,45 @@ def LCM_NN_N(nat1: Natural, nat2: Natural) -> Natural:
         raise ZeroDivisionError('Ошибка: Невозможно вычислить НОК для 0')
     
     gcf = GCF_NN_N(nat1, nat2)
-    nat1_div = DIV_NN_N(nat1, gcf)
-    nat2_div = DIV_NN_N(nat2, gcf)
-    return MUL_NN_N(gcf, MUL_NN_N(nat1_div, nat2_div))
\ No newline at end of file
+    nat1_div = DIVMOD_NN(nat1, gcf)[0]
+    return MUL_NN_N(nat1_div, nat2)
+
+
+def POW_NN_N(nat: Natural, exponent: Natural) -> Natural:
+    """
+    Возведение числа в натуральную степень бинарным методом с отдельной процедурой возведения в квадрат (0^0 = 1).
+    
+    Args:
+        nat (Natural): Основание.
+        exponent (Natural): Показатель степени.
+    
+    Returns:
+        Natural: Степень числа.
+    """
+    
+    if nat.native is not None and exponent.native is not None and exponent.native * nat.native.bit_length() < 60:
+        return from_native(nat.native ** exponent.native)
+    
+    return TRANS_L_N(POW_LL_L(TRANS_N_L(nat), TRANS_N_L(exponent)))
+
+
+def POWMOD_NNN_N(nat: Natural, exponent: Natural, modulus: Natural) -> Natural:
+    """
+    Возведение числа в натуральную степень по модулю методом скользящего окна.
+    
+    Args:
+        nat (Natural): Основание.
+        exponent (Natural): Показатель степени.
+        modulus (Natural): Модуль.
+    
+    Returns:
+        Natural: Остаток от деления степени числа на модуль.
+    """
+    
+    if not NZER_N_B(modulus):
+        raise ZeroDivisionError('Ошибка: Деление на 0 невозможно')
+    
+    if nat.native is not None and exponent.native is not None and modulus.native is not None:
+        return from_native(pow(nat.native, exponent.native, modulus.native))
+    
+    return TRANS_L_N(POWMOD_LLL_L(TRANS_N_L(nat), TRANS_N_L(exponent), TRANS_N_L(modulus)))
\ No newline at end of file
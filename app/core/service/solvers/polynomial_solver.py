@@ -1,13 +1,19 @@
-from copy import deepcopy
+from typing import Sequence, Tuple
 
+from core.domain.entities.constants import POLYNOMIAL_ZERO, RATIONAL_ZERO
 from core.domain.entities.polynomial import Polynomial
 from core.domain.entities.rational import Rational
 from core.service.parsers.integer_parser import IntegerParser
-from core.service.parsers.polynoial_parser import PolynomialParser
-from core.service.parsers.rational_parser import RationalParser
+from core.service.solvers.content_solver import DIVMOD_CC, GCF_CC_C, MUL_CC_C, MVAL_CQ_Q, NMR_C_C, SQF_C, TRANS_C_P, TRANS_P_C, VAL_CQ_Q
 from core.service.solvers.natural_solver import GCF_NN_N, LCM_NN_N
 from core.service.solvers.integer_solver import ABS_Z_N, POZ_Z_D, TRANS_N_Z
-from core.service.solvers.rational_solver import ADD_QQ_Q, DIV_QQ_Q, MUL_QQ_Q, SUB_QQ_Q, TRANS_Z_Q
+from core.service.solvers.rational_solver import ADD_QQ_Q, MUL_QQ_Q, SUB_QQ_Q, TRANS_Z_Q
+
+# Выбор умножения полиномов с рациональными коэффициентами. Через примитивные части произведение стоит порядка
+# (n + m) * (длина НОК знаменателей): каждый коэффициент результата сокращается с общим знаменателем; поэлементное
+# умножение столбиком - порядка m * S1 + n * S2, где S - суммарная длина коэффициентов полинома (в разрядах).
+# Примитивные части перемножаются, пока первая оценка не больше второй, деленной на CONTENT_MUL_FACTOR (подобрано по замерам).
+CONTENT_MUL_FACTOR = 3
 
 
 def dec_d_p(polynom: Polynomial) -> Polynomial:
@@ -21,16 +27,14 @@ def dec_d_p(polynom: Polynomial) -> Polynomial:
         Polynomial: Полином с пониженной степенью (если есть нулевые старшие коэффициенты).
     """
     
-    pol = deepcopy(polynom)
-    
     c = 0
-    while c != pol.polynom_degree and POZ_Z_D(pol.coefficients[c].numerator) == 0:
+    while c != polynom.polynom_degree and POZ_Z_D(polynom.coefficients[c].numerator) == 0:
         c += 1
+    
+    if c == 0:
+        return polynom
         
-    pol.polynom_degree -= c
-    pol.coefficients = pol.coefficients[c::]
-        
-    return pol
+    return Polynomial(polynom.polynom_degree - c, polynom.coefficients[c::])
 
 
 def ADD_PP_P(polynom1: Polynomial, polynom2: Polynomial) -> Polynomial:
@@ -50,11 +54,12 @@ def ADD_PP_P(polynom1: Polynomial, polynom2: Polynomial) -> Polynomial:
     
     if pol1.polynom_degree < pol2.polynom_degree:
         pol1, pol2 = pol2, pol1
-        
+    
+    coefficients = list(pol1.coefficients)
     for i in range(pol2.polynom_degree+1):
-        pol1.coefficients[-i-1] = ADD_QQ_Q(pol1.coefficients[-i-1], pol2.coefficients[-i-1])
+        coefficients[-i-1] = ADD_QQ_Q(coefficients[-i-1], pol2.coefficients[-i-1])
         
-    return dec_d_p(pol1)
+    return dec_d_p(Polynomial(pol1.polynom_degree, tuple(coefficients)))
 
 
 def SUB_PP_P(polynom1: Polynomial, polynom2: Polynomial) -> Polynomial:
@@ -73,12 +78,14 @@ def SUB_PP_P(polynom1: Polynomial, polynom2: Polynomial) -> Polynomial:
     pol2 = dec_d_p(polynom2)
     
     if pol1.polynom_degree < pol2.polynom_degree:
-        pol1, pol2 = pol2, pol1
-        
+        pol2 = Polynomial(pol2.polynom_degree, tuple(SUB_QQ_Q(RATIONAL_ZERO, coef) for coef in pol2.coefficients))
+        return ADD_PP_P(pol2, pol1)
+    
+    coefficients = list(pol1.coefficients)
     for i in range(pol2.polynom_degree+1):
-        pol1.coefficients[-i-1] = SUB_QQ_Q(pol1.coefficients[-i-1], pol2.coefficients[-i-1])
+        coefficients[-i-1] = SUB_QQ_Q(coefficients[-i-1], pol2.coefficients[-i-1])
     
-    return dec_d_p(pol1)
+    return dec_d_p(Polynomial(pol1.polynom_degree, tuple(coefficients)))
 
 
 def MUL_PQ_P(polynom: Polynomial, ratio: Rational) -> Polynomial:
@@ -94,12 +101,11 @@ def MUL_PQ_P(polynom: Polynomial, ratio: Rational) -> Polynomial:
     """
     
     if POZ_Z_D(ratio.numerator) == 0:
-        return PolynomialParser.str_to_polynom('0/1')
+        return POLYNOMIAL_ZERO
     
-    result = dec_d_p(polynom)
-    for i in range (result.polynom_degree+1):
-        result.coefficients[i] = MUL_QQ_Q(result.coefficients[i], ratio)
-    return dec_d_p(result)
+    pol = dec_d_p(polynom)
+    coefficients = tuple(MUL_QQ_Q(coef, ratio) for coef in pol.coefficients)
+    return dec_d_p(Polynomial(pol.polynom_degree, coefficients))
 
 
 def MUL_Pxk_P(polynom: Polynomial, k: int) -> Polynomial:
@@ -114,11 +120,12 @@ def MUL_Pxk_P(polynom: Polynomial, k: int) -> Polynomial:
         Polynomial: Произведение полинома на x^k.
     """
     
-    result = dec_d_p(polynom)
+    pol = dec_d_p(polynom)
+    if k == 0:
+        return pol
     
-    result.polynom_degree += k
-    result.coefficients.extend([RationalParser.str_to_ratio('0/1') for _ in range(k)])
-    return dec_d_p(result)
+    zero = RATIONAL_ZERO
+    return dec_d_p(Polynomial(pol.polynom_degree + k, pol.coefficients + (zero,) * k))
 
 
 def LED_P_Q(polynom: Polynomial) -> Rational:
@@ -165,7 +172,7 @@ def FAC_P_Q (polynom: Polynomial) -> Rational:
     deg = pol.polynom_degree
     
     gcf = ABS_Z_N(pol.coefficients[deg].numerator)
-    lcm = deepcopy(pol.coefficients[deg].denominator)
+    lcm = pol.coefficients[deg].denominator
     
     for i in range(deg):
         gcf = GCF_NN_N(gcf, ABS_Z_N(pol.coefficients[i].numerator))
@@ -174,35 +181,80 @@ def FAC_P_Q (polynom: Polynomial) -> Rational:
     return Rational(TRANS_N_Z(gcf), lcm)
 
 
-def MUL_PP_P(polynom1: Polynomial, polynom2: Polynomial) -> Polynomial:
+def _size(polynom: Polynomial) -> int:
+    """
+    Суммарная длина числителей и знаменателей коэффициентов полинома в разрядах.
     """
-    Умножение двух полиномов.
+
+    return sum(coef.numerator.number.digit_count + coef.denominator.digit_count for coef in polynom.coefficients)
+
+
+def _lcm_digits(polynom: Polynomial, limit: int) -> int:
+    """
+    Длина НОК знаменателей коэффициентов полинома в разрядах; вычисление прерывается, как только длина превышает limit.
+    """
+
+    lcm = None
+    for den in set(coef.denominator for coef in polynom.coefficients):
+        lcm = den if lcm is None else LCM_NN_N(lcm, den)
+        if lcm.digit_count > limit:
+            break
+    return lcm.digit_count
+
+
+def _mul_coefficients(polynom1: Polynomial, polynom2: Polynomial) -> Polynomial:
+    """
+    Умножение полиномов столбиком по рациональным коэффициентам: каждое произведение и сумма сокращаются
+    методом Хенричи, поэтому знаменатели не превышают НОК знаменателей слагаемых одного коэффициента результата.
+    """
+
+    coefficients = [RATIONAL_ZERO] * (polynom1.polynom_degree + polynom2.polynom_degree + 1)
+    for i, coef1 in enumerate(polynom1.coefficients):
+        if POZ_Z_D(coef1.numerator) == 0:
+            continue
+        for j, coef2 in enumerate(polynom2.coefficients):
+            if POZ_Z_D(coef2.numerator) != 0:
+                coefficients[i+j] = ADD_QQ_Q(coefficients[i+j], MUL_QQ_Q(coef1, coef2))
+    return dec_d_p(Polynomial(len(coefficients) - 1, tuple(coefficients)))
+
+
+def MUL_PP_P(polynom1: Polynomial, polynom2: Polynomial, parallel: bool = False) -> Polynomial:
+    """
+    Умножение двух полиномов. Если общие знаменатели коэффициентов невелики по сравнению с самими коэффициентами
+    (см. CONTENT_MUL_FACTOR), полиномы переводятся в вид содержание * примитивная часть,
+    перемножаются целые примитивные части (столбиком, Карацубой или подстановкой Кронекера в зависимости от степени
+    и длины коэффициентов), коэффициенты сокращаются один раз при обратном переводе.
+    Иначе (например, при больших попарно несвязанных знаменателях) сокращение с огромным общим знаменателем
+    обошлось бы дороже, и полиномы перемножаются столбиком по рациональным коэффициентам.
+    При parallel=True большое произведение подстановкой Кронекера вычисляется в пуле процессов.
     
     Args:
         polynom1 (Polynomial): Первый полином.
         polynom2 (Polynomial): Второй полином.
+        parallel (bool): Распределять ли умножение больших полиномов по процессам.
     
     Returns:
         Polynomial: Произведение полиномов.
     """
     
-    result = PolynomialParser.str_to_polynom('0/1')
-    
-    pol1 = dec_d_p(polynom1)
-    pol2 = dec_d_p(polynom2)
-    
-    if POZ_Z_D(pol1.coefficients[0].numerator) and POZ_Z_D(pol2.coefficients[0].numerator):
-        for i in range(pol1.polynom_degree+1):
-            summ = MUL_PQ_P(pol1, pol2.coefficients[pol2.polynom_degree-i])
-            summ = MUL_Pxk_P(summ, pol2.polynom_degree-i)
-            result = ADD_PP_P(result, summ)
-        
-    return dec_d_p(result)
+    n, m = len(polynom1.coefficients), len(polynom2.coefficients)
+    limit = (m * _size(polynom1) + n * _size(polynom2)) // (CONTENT_MUL_FACTOR * (n + m))
+    lcm_digits = _lcm_digits(polynom1, limit)
+    if polynom2 is not polynom1:
+        lcm_digits += _lcm_digits(polynom2, limit - lcm_digits)
+    else:
+        lcm_digits *= 2
+    if lcm_digits > limit:
+        return _mul_coefficients(polynom1, polynom2)
+
+    cpolynom1 = TRANS_P_C(polynom1)
+    cpolynom2 = cpolynom1 if polynom2 is polynom1 else TRANS_P_C(polynom2)
+    return TRANS_C_P(MUL_CC_C(cpolynom1, cpolynom2, parallel))
 
 
 def DIV_PP_P(polynom1: Polynomial, polynom2: Polynomial) -> Polynomial:
     """
-    Деление двух полиномов.
+    Деление двух полиномов. Примитивные части делятся псевдоделением над целыми числами, без дробей во внутреннем цикле.
     
     Args:
         polynom1 (Polynomial): Первый полином.
@@ -212,20 +264,26 @@ def DIV_PP_P(polynom1: Polynomial, polynom2: Polynomial) -> Polynomial:
         Polynomial: Частное от деления полиномов.
     """
     
-    pol1 = dec_d_p(polynom1)
-    pol2 = dec_d_p(polynom2)
+    return TRANS_C_P(DIVMOD_CC(TRANS_P_C(polynom1), TRANS_P_C(polynom2))[0])
+
+
+def DIVMOD_PP(polynom1: Polynomial, polynom2: Polynomial, pseudo: bool = False) -> Tuple[Polynomial, Polynomial]:
+    """
+    Деление полиномов с остатком: частное и остаток получаются за один проход деления.
+    При pseudo=True выполняется псевдоделение без дробей: возвращаются Q и R, для которых
+    lc(B)^e * A = Q*B + R, e = max(deg A - deg B + 1, 0); для целых коэффициентов Q и R также целые.
     
-    result = PolynomialParser.str_to_polynom('0/1')
+    Args:
+        polynom1 (Polynomial): Делимое.
+        polynom2 (Polynomial): Делитель.
+        pseudo (bool): Выполнять ли псевдоделение.
     
-    while pol1.polynom_degree >= pol2.polynom_degree:
-        div = DIV_QQ_Q(pol1.coefficients[0], pol2.coefficients[0])
-        k = pol1.polynom_degree - pol2.polynom_degree
-        tmp = Polynomial(0, div)
-        tmp = MUL_Pxk_P(tmp, k)
-        result = ADD_PP_P(result, tmp)
-        pol1 = SUB_PP_P(pol1, tmp)
+    Returns:
+        Tuple[Polynomial, Polynomial]: Частное и остаток.
+    """
     
-    return result
+    quotient, remainder = DIVMOD_CC(TRANS_P_C(polynom1), TRANS_P_C(polynom2), pseudo)
+    return TRANS_C_P(quotient), TRANS_C_P(remainder)
 
 
 def MOD_PP_P(polynom1: Polynomial, polynom2: Polynomial) -> Polynomial:
@@ -240,31 +298,25 @@ def MOD_PP_P(polynom1: Polynomial, polynom2: Polynomial) -> Polynomial:
         Polynomial: Остаток от деления полиномов.
     """
     
-    div = DIV_PP_P(polynom1, polynom2)
-    
-    return SUB_PP_P(polynom1, MUL_PP_P(div, polynom2))
+    return TRANS_C_P(DIVMOD_CC(TRANS_P_C(polynom1), TRANS_P_C(polynom2))[1])
 
 
-def GCF_PP_P(polynom1: Polynomial, polynom2: Polynomial) -> Polynomial:
+def GCF_PP_P(polynom1: Polynomial, polynom2: Polynomial, modular: bool = True) -> Polynomial:
     """
-    Вычисление НОД двух полиномов.
+    Вычисление НОД двух полиномов, нормированного к старшему коэффициенту 1.
+    По умолчанию используется модульный алгоритм (НОД по нескольким простым модулям, КТО и рациональное восстановление
+    с проверкой пробным делением), при modular=False - субрезультантная последовательность остатков.
     
     Args:
         polynom1 (Polynomial): Первый полином.
         polynom2 (Polynomial): Второй полином.
+        modular (bool): Использовать ли модульный алгоритм.
         
     Returns:
         Polynomial: НОД полиномов.
     """
     
-    divid = dec_d_p(polynom1)
-    divis = dec_d_p(polynom2)
-    
-    divis = MOD_PP_P(divid, divis)
-    while POZ_Z_D(divis.coefficients[0].numerator):
-        divis, divid = divid, divis
-        divis = MOD_PP_P(divid, divis)
-    return divis
+    return TRANS_C_P(GCF_CC_C(TRANS_P_C(polynom1), TRANS_P_C(polynom2), modular))
 
 
 def DER_P_P(polynom: Polynomial) -> Polynomial:
@@ -278,33 +330,71 @@ def DER_P_P(polynom: Polynomial) -> Polynomial:
         Polynomial: Производная полинома.
     """
     
-    result = deepcopy(polynom)
+    coefficients = []
+    for i in range(polynom.polynom_degree):
+        mul = IntegerParser.str_to_int(str(polynom.polynom_degree-i))
+        coefficients.append(MUL_QQ_Q(polynom.coefficients[i], TRANS_Z_Q(mul)))
     
-    for i in range(result.polynom_degree):
-        mul = IntegerParser.str_to_int(str(result.polynom_degree-i))
-        result.coefficients[i] = MUL_QQ_Q(result.coefficients[i], TRANS_Z_Q(mul))
-        
-    result.polynom_degree -= 1
-    result.coefficients.pop()
-    
-    return result
+    return Polynomial(polynom.polynom_degree - 1, tuple(coefficients))
 
 
-def NMR_P_P(polynom: Polynomial) -> Polynomial:
+def NMR_P_P(polynom: Polynomial, modular: bool = True) -> Polynomial:
     """
     Упрощение полинома: устранение кратных корней и нормализация.
     
     Args:
         polynom (Polynomial): Полином.
+        modular (bool): Использовать ли модульный алгоритм НОД.
     
     Returns:
         Polynomial: Упрощенный полином.
     """
     
-    pol = dec_d_p(polynom)
+    return TRANS_C_P(NMR_C_C(TRANS_P_C(polynom), modular))
+
+
+def SQF_P(polynom: Polynomial, modular: bool = True) -> Tuple[Tuple[Polynomial, int], ...]:
+    """
+    Бесквадратное разложение полинома алгоритмом Юня: P = lc(P) * F_1 * F_2^2 * ... * F_k^k.
+    
+    Args:
+        polynom (Polynomial): Полином.
+        modular (bool): Использовать ли модульный алгоритм НОД.
+    
+    Returns:
+        Tuple[Tuple[Polynomial, int], ...]: Нормированные множители F_i положительной степени и их кратности i.
+    """
+    
+    return tuple((TRANS_C_P(factor), multiplicity) for factor, multiplicity in SQF_C(TRANS_P_C(polynom), modular))
+
+
+def VAL_PQ_Q(polynom: Polynomial, ratio: Rational) -> Rational:
+    """
+    Вычисление значения полинома в рациональной точке схемой Горнера над целыми числами с одним сокращением в конце.
+    
+    Args:
+        polynom (Polynomial): Полином.
+        ratio (Rational): Точка.
+    
+    Returns:
+        Rational: Значение полинома в точке.
+    """
+    
+    return VAL_CQ_Q(TRANS_P_C(polynom), ratio)
+
+
+def MVAL_PQ_Q(polynom: Polynomial, ratios: Sequence[Rational], tree: bool = False) -> Tuple[Rational, ...]:
+    """
+    Вычисление значений полинома во многих рациональных точках: схемой Горнера в каждой точке
+    или, при tree=True, по дереву подпроизведений.
+    
+    Args:
+        polynom (Polynomial): Полином.
+        ratios (Sequence[Rational]): Точки.
+        tree (bool): Вычислять значения по дереву подпроизведений.
+    
+    Returns:
+        Tuple[Rational, ...]: Значения полинома в точках, в том же порядке.
+    """
     
-    der = DER_P_P(pol)
-    nod = GCF_PP_P(pol, der)
-    result = DIV_PP_P(pol, nod)
-    norm_mul = DIV_QQ_Q(RationalParser.str_to_ratio('1/1'), result.coefficients[0])
-    return MUL_PQ_P(norm_mul)
\ No newline at end of file
+    return MVAL_CQ_Q(TRANS_P_C(polynom), ratios, tree)
@@ -1,17 +1,35 @@
-from copy import deepcopy
-
+from core.domain.entities.constants import NATURAL_ONE, RATIONAL_ONE, RATIONAL_ZERO
 from core.domain.entities.integer import Integer
+from core.domain.entities.natural import Natural
 from core.domain.entities.rational import Rational
 from core.domain.exceptions.numbers import RationalIsNotIntegerException
-from core.service.parsers.integer_parser import IntegerParser
-from core.service.parsers.natural_parser import NaturalParser
-from core.service.solvers.integer_solver import ABS_Z_N, ADD_ZZ_Z, DIV_ZZ_Z, MUL_ZM_Z, MUL_ZZ_Z, POZ_Z_D, TRANS_N_Z
-from core.service.solvers.natural_solver import COM_NN_D, DIV_NN_N, GCF_NN_N, LCM_NN_N, MUL_NN_N, NZER_N_B
+from core.service.solvers.integer_solver import ABS_Z_N, ADD_ZZ_Z, MUL_ZM_Z, MUL_ZZ_Z, POW_ZN_Z, POZ_Z_D, TRANS_N_Z
+from core.service.solvers.natural_solver import COM_NN_D, DIV_NN_N, GCF_NN_N, MUL_NN_N, NZER_N_B, POW_NN_N
+
+
+def _div_exact(integer: Integer, nat: Natural) -> Integer:
+    """
+    Деление целого числа на натуральный делитель, про который известно, что он делит число нацело.
+    """
+    
+    if COM_NN_D(nat, NATURAL_ONE) == 0:
+        return integer
+    return Integer(integer.sign, DIV_NN_N(ABS_Z_N(integer), nat))
+
+
+def _reduced(numerator: Integer, denominator: Natural) -> Rational:
+    """
+    Построение дроби из заведомо взаимно простых числителя и знаменателя, нулевая дробь приводится к виду 0/1.
+    """
+    
+    if POZ_Z_D(numerator) == 0:
+        return RATIONAL_ZERO
+    return Rational(numerator, denominator, True)
 
 
 def RED_Q_Q(ratio: Rational) -> Rational:
     """
-    Сокращение рациональной дроби.
+    Сокращение рациональной дроби. Дроби с флагом reduced возвращаются без изменений.
     
     Args:
         ratio (Rational): Рациональная дробь.
@@ -20,16 +38,17 @@ def RED_Q_Q(ratio: Rational) -> Rational:
         Rational: Сокращенная рациональная дробь.
     """
     
+    if ratio.reduced:
+        return ratio
+    
     if not NZER_N_B(ratio.denominator):
         raise ZeroDivisionError('Ошибка: Знаменатель равен 0')
     
-    gcf_n = GCF_NN_N(ABS_Z_N(ratio.numerator), ratio.denominator)
-    gcf_z = TRANS_N_Z(gcf_n)
-    new_numerator = DIV_ZZ_Z(ratio.numerator, gcf_z)
-    if POZ_Z_D(ratio.numerator) != POZ_Z_D(gcf_z) and POZ_Z_D(ratio.numerator) != 0:
-        new_numerator = ADD_ZZ_Z(new_numerator, IntegerParser.str_to_int('1'))
+    if POZ_Z_D(ratio.numerator) == 0:
+        return RATIONAL_ZERO
     
-    return Rational(new_numerator, DIV_NN_N(ratio.denominator, gcf_n))
+    gcf = GCF_NN_N(ABS_Z_N(ratio.numerator), ratio.denominator)
+    return Rational(_div_exact(ratio.numerator, gcf), DIV_NN_N(ratio.denominator, gcf), True)
 
 
 def INT_Q_B(ratio: Rational) -> bool:
@@ -44,7 +63,7 @@ def INT_Q_B(ratio: Rational) -> bool:
     """
     
     red_ratio = RED_Q_Q(ratio)
-    if COM_NN_D(red_ratio.denominator, NaturalParser.str_to_nat('1')) == 0:
+    if COM_NN_D(red_ratio.denominator, NATURAL_ONE) == 0:
         return True
     return False
 
@@ -60,8 +79,7 @@ def TRANS_Z_Q(integer: Integer) -> Rational:
         Rational: Целое число, преобразованное в рациональное.
     """
     
-    int_copy = deepcopy(integer)
-    return Rational(int_copy, NaturalParser.str_to_nat('1'))
+    return Rational(integer, NATURAL_ONE, True)
 
 
 def TRANS_Q_Z(ratio: Rational):
@@ -80,81 +98,134 @@ def TRANS_Q_Z(ratio: Rational):
     raise RationalIsNotIntegerException(ratio)
 
 
-def ADD_QQ_Q(ratio1: Rational, ratio2: Rational) -> Rational:
+def ADD_QQ_Q(ratio1: Rational, ratio2: Rational, reduce: bool = True) -> Rational:
     """
-    Сложение двух рациональных дробей.
+    Сложение двух рациональных дробей методом Хенричи: для несократимых a/b и c/d с g = НОД(b, d)
+    числитель t = a(d/g) + c(b/g) может иметь общий множитель со знаменателем только внутри g,
+    поэтому вместо сокращения полного результата вычисляется НОД(t, g).
+    При reduce=False дроби складываются без сокращения, сокращение откладывается до вызова RED_Q_Q (RationalParser.ratio_to_str печатает такую дробь сокращенной).
     
     Args:
         ratio1 (Rational): Первая рациональная дробь.
         ratio2 (Rational): Вторая рациональная дробь.
+        reduce (bool): Сокращать ли результат.
         
     Returns:
         Rational: Сумма дробей.
     """
     
+    if not reduce:
+        if COM_NN_D(ratio1.denominator, ratio2.denominator) == 0:
+            return Rational(ADD_ZZ_Z(ratio1.numerator, ratio2.numerator), ratio1.denominator)
+        numer = ADD_ZZ_Z(MUL_ZZ_Z(ratio1.numerator, TRANS_N_Z(ratio2.denominator)), MUL_ZZ_Z(ratio2.numerator, TRANS_N_Z(ratio1.denominator)))
+        return Rational(numer, MUL_NN_N(ratio1.denominator, ratio2.denominator))
+    
     ra1 = RED_Q_Q(ratio1)
     ra2 = RED_Q_Q(ratio2)
-    den = LCM_NN_N(ra1.denominator, ra2.denominator)
     
-    dopmul1 = TRANS_N_Z(DIV_NN_N(den, ra1.denominator))
-    dopmul2 = TRANS_N_Z(DIV_NN_N(den, ra2.denominator))
+    gcf = GCF_NN_N(ra1.denominator, ra2.denominator)
+    dopmul1 = DIV_NN_N(ra1.denominator, gcf)
+    dopmul2 = DIV_NN_N(ra2.denominator, gcf)
     
-    numer = ADD_ZZ_Z(MUL_ZZ_Z(ratio1.numerator, dopmul1), MUL_ZZ_Z(ratio2.numerator, dopmul2))
+    numer = ADD_ZZ_Z(MUL_ZZ_Z(ra1.numerator, TRANS_N_Z(dopmul2)), MUL_ZZ_Z(ra2.numerator, TRANS_N_Z(dopmul1)))
+    if POZ_Z_D(numer) == 0:
+        return RATIONAL_ZERO
     
-    return RED_Q_Q(Rational(numer, den))
+    gcf2 = GCF_NN_N(ABS_Z_N(numer), gcf)
+    return _reduced(_div_exact(numer, gcf2), MUL_NN_N(dopmul1, DIV_NN_N(ra2.denominator, gcf2)))
 
 
-def SUB_QQ_Q(ratio1: Rational, ratio2: Rational) -> Rational:
+def SUB_QQ_Q(ratio1: Rational, ratio2: Rational, reduce: bool = True) -> Rational:
     """
     Вычитание двух рациональных дробей.
     
     Args:
         ratio1 (Rational): Первая рациональная дробь.
         ratio2 (Rational): Вторая рациональная дробь.
+        reduce (bool): Сокращать ли результат.
         
     Returns:
         Rational: Разность дробей.
     """
     
-    ra2 = Rational(MUL_ZM_Z(ratio2.numerator), deepcopy(ratio2.denominator))
-    return ADD_QQ_Q(ratio1, ra2)
+    ra2 = Rational(MUL_ZM_Z(ratio2.numerator), ratio2.denominator, ratio2.reduced)
+    return ADD_QQ_Q(ratio1, ra2, reduce)
 
 
-def MUL_QQ_Q(ratio1: Rational, ratio2: Rational) -> Rational:
+def MUL_QQ_Q(ratio1: Rational, ratio2: Rational, reduce: bool = True) -> Rational:
     """
-    Перемножение двух рациональных дробей.
+    Перемножение двух рациональных дробей методом Хенричи: для несократимых a/b и c/d
+    сокращаются только перекрестные пары a, d и c, b, после чего произведение уже несократимо.
+    При reduce=False дроби перемножаются без сокращения, сокращение откладывается до вызова RED_Q_Q (RationalParser.ratio_to_str печатает такую дробь сокращенной).
     
     Args:
         ratio1 (Rational): Первая рациональная дробь.
         ratio2 (Rational): Вторая рациональная дробь.
+        reduce (bool): Сокращать ли результат.
         
     Returns:
         Rational: Произведение дробей.
     """
     
+    if not reduce:
+        return Rational(MUL_ZZ_Z(ratio1.numerator, ratio2.numerator), MUL_NN_N(ratio1.denominator, ratio2.denominator))
+    
     ra1 = RED_Q_Q(ratio1)
     ra2 = RED_Q_Q(ratio2)
+    if POZ_Z_D(ra1.numerator) == 0 or POZ_Z_D(ra2.numerator) == 0:
+        return RATIONAL_ZERO
+    
+    gcf1 = GCF_NN_N(ABS_Z_N(ra1.numerator), ra2.denominator)
+    gcf2 = GCF_NN_N(ABS_Z_N(ra2.numerator), ra1.denominator)
     
-    result = Rational(MUL_ZZ_Z(ra1.numerator, ra2.numerator), MUL_NN_N(ra1.denominator, ra2.denominator))
-    return RED_Q_Q(result)
+    numer = MUL_ZZ_Z(_div_exact(ra1.numerator, gcf1), _div_exact(ra2.numerator, gcf2))
+    denom = MUL_NN_N(DIV_NN_N(ra1.denominator, gcf2), DIV_NN_N(ra2.denominator, gcf1))
+    return Rational(numer, denom, True)
 
 
-def DIV_QQ_Q(ratio1: Rational, ratio2: Rational) -> Rational:
+def DIV_QQ_Q(ratio1: Rational, ratio2: Rational, reduce: bool = True) -> Rational:
     """
     Деление двух рациональных дробей.
     
     Args:
         ratio1 (Rational): Первая рациональная дробь.
         ratio2 (Rational): Вторая рациональная дробь.
+        reduce (bool): Сокращать ли результат.
         
     Returns:
         Rational: Частное дробей.
     """
     
+    if POZ_Z_D(ratio2.numerator) == 0:
+        raise ZeroDivisionError('Ошибка: Знаменатель равен 0')
+    
     numer = TRANS_N_Z(ratio2.denominator)
     if POZ_Z_D(ratio2.numerator) == 1:
         numer = MUL_ZM_Z(numer)
     denom = ABS_Z_N(ratio2.numerator)
     
-    ra2 = Rational(numer, denom)
-    return MUL_QQ_Q(ratio1, ra2)
\ No newline at end of file
+    ra2 = Rational(numer, denom, ratio2.reduced)
+    return MUL_QQ_Q(ratio1, ra2, reduce)
+
+
+def POW_QZ_Q(ratio: Rational, exponent: Integer) -> Rational:
+    """
+    Возведение рациональной дроби в целую степень. Дробь сокращается один раз до возведения,
+    степени взаимно простых числителя и знаменателя взаимно просты, поэтому результат уже несократим.
+    
+    Args:
+        ratio (Rational): Рациональная дробь.
+        exponent (Integer): Показатель степени.
+        
+    Returns:
+        Rational: Степень дроби.
+    """
+    
+    red_ratio = RED_Q_Q(ratio)
+    if POZ_Z_D(exponent) == 1:
+        if POZ_Z_D(red_ratio.numerator) == 0:
+            raise ZeroDivisionError('Ошибка: Знаменатель равен 0')
+        red_ratio = DIV_QQ_Q(RATIONAL_ONE, red_ratio)
+    
+    power = ABS_Z_N(exponent)
+    return Rational(POW_ZN_Z(red_ratio.numerator, power), POW_NN_N(red_ratio.denominator, power), True)
\ No newline at end of file
@@ -0,0 +1,291 @@
+from heapq import heapify, heappop, heappush
+from typing import Dict, List, Tuple
+
+from core.domain.entities.constants import POLYNOMIAL_ZERO, RATIONAL_ZERO, SPARSE_POLYNOMIAL_ZERO
+from core.domain.entities.polynomial import Polynomial
+from core.domain.entities.rational import Rational
+from core.domain.entities.sparse_polynomial import SparsePolynomial
+from core.service.parsers.integer_parser import IntegerParser
+from core.service.solvers.integer_solver import POZ_Z_D
+from core.service.solvers.rational_solver import ADD_QQ_Q, DIV_QQ_Q, MUL_QQ_Q, POW_QZ_Q, RED_Q_Q, SUB_QQ_Q
+
+Term = Tuple[int, Rational]
+
+
+def _build(terms: List[Term]) -> SparsePolynomial:
+    """
+    Построение SparsePolynomial по членам, уже упорядоченным по убыванию показателя: коэффициенты сокращаются, нулевые члены отбрасываются.
+    """
+
+    terms = tuple((exponent, coef) for exponent, coef in ((e, RED_Q_Q(c)) for e, c in terms) if POZ_Z_D(coef.numerator) != 0)
+    return SparsePolynomial(terms[0][0], terms) if terms else SPARSE_POLYNOMIAL_ZERO
+
+
+def _merge(terms1: Tuple[Term, ...], terms2: Tuple[Term, ...], negate: bool) -> List[Term]:
+    """
+    Слияние двух упорядоченных списков членов, как в сортировке слиянием: члены с равными показателями складываются
+    (или вычитаются при negate=True) без сокращения, сокращение выполняется при построении результата.
+    """
+
+    result = []
+    i = j = 0
+    while i < len(terms1) and j < len(terms2):
+        e1, c1 = terms1[i]
+        e2, c2 = terms2[j]
+        if e1 > e2:
+            result.append(terms1[i])
+            i += 1
+        elif e1 < e2:
+            result.append((e2, SUB_QQ_Q(RATIONAL_ZERO, c2) if negate else c2))
+            j += 1
+        else:
+            result.append((e1, SUB_QQ_Q(c1, c2, False) if negate else ADD_QQ_Q(c1, c2, False)))
+            i += 1
+            j += 1
+    result.extend(terms1[i:])
+    result.extend((e, SUB_QQ_Q(RATIONAL_ZERO, c)) if negate else (e, c) for e, c in terms2[j:])
+    return result
+
+
+def TRANS_P_S(polynom: Polynomial) -> SparsePolynomial:
+    """
+    Преобразование плотного полинома в разреженный: сохраняются только ненулевые коэффициенты.
+
+    Args:
+        polynom (Polynomial): Полином.
+
+    Returns:
+        SparsePolynomial: Разреженный полином.
+    """
+
+    degree = polynom.polynom_degree
+    return _build([(degree - i, coef) for i, coef in enumerate(polynom.coefficients)])
+
+
+def TRANS_S_P(spolynom: SparsePolynomial) -> Polynomial:
+    """
+    Преобразование разреженного полинома в плотный: пропущенные степени заполняются нулями.
+
+    Args:
+        spolynom (SparsePolynomial): Разреженный полином.
+
+    Returns:
+        Polynomial: Полином.
+    """
+
+    if not spolynom.terms:
+        return POLYNOMIAL_ZERO
+
+    coefficients = [RATIONAL_ZERO] * (spolynom.polynom_degree + 1)
+    for exponent, coef in spolynom.terms:
+        coefficients[spolynom.polynom_degree - exponent] = coef
+    return Polynomial(spolynom.polynom_degree, tuple(coefficients))
+
+
+def ADD_SS_S(spolynom1: SparsePolynomial, spolynom2: SparsePolynomial) -> SparsePolynomial:
+    """
+    Сложение разреженных полиномов слиянием упорядоченных списков членов.
+
+    Args:
+        spolynom1 (SparsePolynomial): Первый полином.
+        spolynom2 (SparsePolynomial): Второй полином.
+
+    Returns:
+        SparsePolynomial: Сумма полиномов.
+    """
+
+    return _build(_merge(spolynom1.terms, spolynom2.terms, False))
+
+
+def SUB_SS_S(spolynom1: SparsePolynomial, spolynom2: SparsePolynomial) -> SparsePolynomial:
+    """
+    Вычитание разреженных полиномов слиянием упорядоченных списков членов.
+
+    Args:
+        spolynom1 (SparsePolynomial): Первый полином.
+        spolynom2 (SparsePolynomial): Второй полином.
+
+    Returns:
+        SparsePolynomial: Разность полиномов.
+    """
+
+    return _build(_merge(spolynom1.terms, spolynom2.terms, True))
+
+
+def MUL_SQ_S(spolynom: SparsePolynomial, ratio: Rational) -> SparsePolynomial:
+    """
+    Умножение разреженного полинома на рациональное число.
+
+    Args:
+        spolynom (SparsePolynomial): Полином.
+        ratio (Rational): Рациональное число.
+
+    Returns:
+        SparsePolynomial: Произведение полинома и рационального числа.
+    """
+
+    if POZ_Z_D(ratio.numerator) == 0:
+        return SPARSE_POLYNOMIAL_ZERO
+    return SparsePolynomial(spolynom.polynom_degree, tuple((exponent, MUL_QQ_Q(coef, ratio)) for exponent, coef in spolynom.terms))
+
+
+def MUL_Sxk_S(spolynom: SparsePolynomial, k: int) -> SparsePolynomial:
+    """
+    Умножение разреженного полинома на x^k: сдвиг показателей, коэффициенты не изменяются.
+
+    Args:
+        spolynom (SparsePolynomial): Полином.
+        k (int): степень x.
+
+    Returns:
+        SparsePolynomial: Произведение полинома на x^k.
+    """
+
+    if k == 0 or not spolynom.terms:
+        return spolynom
+    return SparsePolynomial(spolynom.polynom_degree + k, tuple((exponent + k, coef) for exponent, coef in spolynom.terms))
+
+
+def MUL_SS_S(spolynom1: SparsePolynomial, spolynom2: SparsePolynomial) -> SparsePolynomial:
+    """
+    Умножение разреженных полиномов слиянием через кучу (алгоритм Джонсона): для каждого члена меньшего полинома
+    в куче хранится его очередное произведение с членом другого полинома, поэтому произведения извлекаются по убыванию
+    показателя, члены результата собираются по одному и не требуют ни сортировки, ни плотного буфера.
+    Память - O(число членов меньшего полинома), время - O(nm log min(n, m)) умножений и сравнений.
+    Коэффициент с равными показателями накапливается без сокращения и сокращается один раз.
+
+    Args:
+        spolynom1 (SparsePolynomial): Первый полином.
+        spolynom2 (SparsePolynomial): Второй полином.
+
+    Returns:
+        SparsePolynomial: Произведение полиномов.
+    """
+
+    rows, columns = spolynom1.terms, spolynom2.terms
+    if len(rows) > len(columns):
+        rows, columns = columns, rows
+    if not rows:
+        return SPARSE_POLYNOMIAL_ZERO
+
+    heap = [(-(e + columns[0][0]), i, 0) for i, (e, _) in enumerate(rows)]
+    result = []
+    while heap:
+        exponent = -heap[0][0]
+        coef = None
+        while heap and -heap[0][0] == exponent:
+            _, i, j = heappop(heap)
+            product = MUL_QQ_Q(rows[i][1], columns[j][1], False)
+            coef = product if coef is None else ADD_QQ_Q(coef, product, False)
+            if j + 1 < len(columns):
+                heappush(heap, (-(rows[i][0] + columns[j+1][0]), i, j + 1))
+        result.append((exponent, coef))
+    return _build(result)
+
+
+def DIVMOD_SS(spolynom1: SparsePolynomial, spolynom2: SparsePolynomial) -> Tuple[SparsePolynomial, SparsePolynomial]:
+    """
+    Деление разреженных полиномов с остатком. Остаток хранится словарем показатель -> коэффициент, а его показатели -
+    в куче, поэтому на каждом шаге старший член остатка извлекается за O(log) без плотного буфера.
+    Коэффициенты остатка накапливаются без сокращения и сокращаются, только когда член становится старшим.
+
+    Args:
+        spolynom1 (SparsePolynomial): Делимое.
+        spolynom2 (SparsePolynomial): Делитель.
+
+    Returns:
+        Tuple[SparsePolynomial, SparsePolynomial]: Частное и остаток.
+    """
+
+    if not spolynom2.terms:
+        raise ZeroDivisionError('Ошибка: Деление на 0 невозможно')
+
+    degree, lc = spolynom2.terms[0]
+    tail = spolynom2.terms[1:]
+    remainder: Dict[int, Rational] = dict(spolynom1.terms)
+    heap = [-exponent for exponent in remainder]
+    heapify(heap)
+
+    quotient = []
+    while heap and -heap[0] >= degree:
+        exponent = -heappop(heap)
+        coef = RED_Q_Q(remainder.pop(exponent))
+        if POZ_Z_D(coef.numerator) == 0:
+            continue
+
+        shift = exponent - degree
+        coef = DIV_QQ_Q(coef, lc)
+        quotient.append((shift, coef))
+        for e, c in tail:
+            product = MUL_QQ_Q(coef, c, False)
+            if e + shift in remainder:
+                remainder[e + shift] = SUB_QQ_Q(remainder[e + shift], product, False)
+            else:
+                remainder[e + shift] = SUB_QQ_Q(RATIONAL_ZERO, product, False)
+                heappush(heap, -(e + shift))
+
+    return _build(quotient), _build(sorted(remainder.items(), reverse=True))
+
+
+def DIV_SS_S(spolynom1: SparsePolynomial, spolynom2: SparsePolynomial) -> SparsePolynomial:
+    """
+    Частное от деления разреженных полиномов.
+
+    Args:
+        spolynom1 (SparsePolynomial): Делимое.
+        spolynom2 (SparsePolynomial): Делитель.
+
+    Returns:
+        SparsePolynomial: Частное.
+    """
+
+    return DIVMOD_SS(spolynom1, spolynom2)[0]
+
+
+def MOD_SS_S(spolynom1: SparsePolynomial, spolynom2: SparsePolynomial) -> SparsePolynomial:
+    """
+    Остаток от деления разреженных полиномов.
+
+    Args:
+        spolynom1 (SparsePolynomial): Делимое.
+        spolynom2 (SparsePolynomial): Делитель.
+
+    Returns:
+        SparsePolynomial: Остаток.
+    """
+
+    return DIVMOD_SS(spolynom1, spolynom2)[1]
+
+
+def VAL_SQ_Q(spolynom: SparsePolynomial, ratio: Rational) -> Rational:
+    """
+    Значение разреженного полинома в рациональной точке схемой Горнера по членам: между соседними членами
+    накопленное значение умножается на x в степени разности показателей (бинарное возведение в степень),
+    так что число операций зависит от числа членов и логарифма степени, а не от самой степени.
+    Промежуточные значения не сокращаются, результат сокращается один раз.
+
+    Args:
+        spolynom (SparsePolynomial): Полином.
+        ratio (Rational): Точка.
+
+    Returns:
+        Rational: Значение полинома в точке.
+    """
+
+    if not spolynom.terms:
+        return RATIONAL_ZERO
+
+    powers = {}
+
+    def power(gap: int) -> Rational:
+        if gap not in powers:
+            powers[gap] = POW_QZ_Q(ratio, IntegerParser.str_to_int(str(gap), False))
+        return powers[gap]
+
+    exponent, value = spolynom.terms[0]
+    for e, c in spolynom.terms[1:]:
+        value = ADD_QQ_Q(MUL_QQ_Q(value, power(exponent - e), False), c, False)
+        exponent = e
+    if exponent:
+        value = MUL_QQ_Q(value, power(exponent), False)
+    return RED_Q_Q(value)